@@ -17,17 +17,23 @@ Usage:
     python analyze_codebase.py /path/to/project --json
     python analyze_codebase.py /path/to/project --full
     python analyze_codebase.py /path/to/project --deep  # Full AST + git analysis
+    python analyze_codebase.py /path/to/project --rev v1.2.0  # Analyze a tag without checkout
+    python analyze_codebase.py /path/to/project --timeline 12  # Complexity over 12 commits
 """
 
 import os
 import sys
 import re
+import io
 import ast
 import json
+import heapq
+import threading
 import subprocess
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from array import array
 from collections import defaultdict, Counter
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterator
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 import hashlib
@@ -756,19 +762,23 @@ class GitHistoryAnalyzer:
         'launch', 'release', 'ship', 'deploy', 'production',
     ]
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, rev: str = 'HEAD'):
         self.project_path = project_path
+        self.rev = rev
         self.commits: List[GitCommitNarrative] = []
         self.pivots: List[ArchitecturalPivot] = []
+        self.churn: Optional[ChurnIndex] = None
 
     def analyze(self, max_commits: int = 200) -> Dict[str, Any]:
         """Perform full git history analysis."""
-        if not (self.project_path / '.git').exists():
+        # Any directory inside a working tree, not just its root
+        if git_prefix(self.project_path) is None:
             return {"error": "Not a git repository"}
 
         self._load_commits(max_commits)
         self._detect_pivots()
         self._extract_story_arcs()
+        self._build_churn_index()
 
         return {
             "total_commits": len(self.commits),
@@ -778,6 +788,7 @@ class GitHistoryAnalyzer:
             "story_worthy_commits": self._get_story_worthy_commits(),
             "timeline_summary": self._get_timeline_summary(),
             "contributor_stories": self._get_contributor_stories(),
+            "churn": self._get_churn_summary(),
         }
 
     def _load_commits(self, max_commits: int):
@@ -785,7 +796,7 @@ class GitHistoryAnalyzer:
         try:
             # Get detailed commit info
             result = subprocess.run(
-                ['git', 'log', f'-n{max_commits}', '--pretty=format:%H|%s|%ai|%an|%b|||'],
+                ['git', 'log', f'-n{max_commits}', '--pretty=format:%H|%s|%ai|%an|%b|||', self.rev],
                 cwd=self.project_path,
                 capture_output=True, text=True, timeout=30
             )
@@ -948,6 +959,16 @@ class GitHistoryAnalyzer:
         # (e.g., problem -> attempts -> solution)
         pass  # Placeholder for more sophisticated analysis
 
+    def _build_churn_index(self):
+        """Build the per-file churn index over the full history."""
+        self.churn = ChurnIndex(self.project_path, self.rev).build()
+
+    def _get_churn_summary(self) -> Dict[str, Any]:
+        """Get churn rankings and complexity hotspots at the analyzed revision."""
+        with GitObjectStore(self.project_path) as store:
+            root = open_revision(self.project_path, self.rev, store)
+            return self.churn.to_dict(root)
+
     def _get_category_breakdown(self) -> Dict[str, int]:
         """Get breakdown of commits by category."""
         breakdown = Counter(c.category for c in self.commits)
@@ -1005,17 +1026,668 @@ class GitHistoryAnalyzer:
         return result[:10]
 
 
+# =============================================================================
+# Churn Hotspot Index
+# =============================================================================
+
+class CountMinSketch:
+    """Fixed-size frequency sketch; estimates never undercount."""
+
+    def __init__(self, width: int = 2 ** 14, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+
+    def indexes(self, key: str) -> List[int]:
+        """Column of `key` in each row (double hashing over one digest)."""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, key: str, count: int = 1, indexes: Optional[List[int]] = None) -> int:
+        """Add `count` to `key` and return its new estimate."""
+        indexes = indexes or self.indexes(key)
+        estimate = None
+        for row, col in zip(self._rows, indexes):
+            row[col] += count
+            estimate = row[col] if estimate is None else min(estimate, row[col])
+        return estimate
+
+    def estimate(self, key: str, indexes: Optional[List[int]] = None) -> int:
+        indexes = indexes or self.indexes(key)
+        return min(row[col] for row, col in zip(self._rows, indexes))
+
+
+class TopK:
+    """Keep the `k` keys with the largest counts (min-heap, lazy deletion)."""
+
+    def __init__(self, k: int):
+        self.k = k
+        self._counts: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def offer(self, key: str, count: int):
+        if key in self._counts or len(self._counts) < self.k:
+            self._counts[key] = count
+            heapq.heappush(self._heap, (count, key))
+        else:
+            self._drop_stale()
+            if count <= self._heap[0][0]:
+                return
+            _, evicted = heapq.heappop(self._heap)
+            del self._counts[evicted]
+            self._counts[key] = count
+            heapq.heappush(self._heap, (count, key))
+
+        if len(self._heap) > 4 * self.k:
+            self._heap = [(c, k) for k, c in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def _drop_stale(self):
+        while self._heap and self._counts.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def keys(self) -> List[str]:
+        return list(self._counts)
+
+
+class ChurnCounter:
+    """Bounded-memory change frequency and lines-touched counts per key."""
+
+    def __init__(self, top_k: int = 50, width: int = 2 ** 14, depth: int = 4):
+        self.commits = CountMinSketch(width, depth)
+        self.lines = CountMinSketch(width, depth)
+        self.top_by_commits = TopK(top_k)
+        self.top_by_lines = TopK(top_k)
+
+    def add(self, key: str, lines: int):
+        indexes = self.commits.indexes(key)
+        self.top_by_commits.offer(key, self.commits.add(key, 1, indexes))
+        self.top_by_lines.offer(key, self.lines.add(key, lines, indexes))
+
+    def ranking(self, by: str = 'commits', limit: int = 10) -> List[Dict[str, Any]]:
+        """Top keys ranked by 'commits' or 'lines_touched'."""
+        candidates = set(self.top_by_commits.keys()) | set(self.top_by_lines.keys())
+        rows = []
+        for key in candidates:
+            indexes = self.commits.indexes(key)
+            rows.append({
+                "path": key,
+                "commits": self.commits.estimate(key, indexes),
+                "lines_touched": self.lines.estimate(key, indexes),
+            })
+        rows.sort(key=lambda r: (-r[by], r["path"]))
+        return rows[:limit]
+
+
+class ChurnIndex:
+    """Per-file and per-directory churn from one streamed `git log --numstat`.
+
+    Only history under `project_path` is counted, with paths relative to it,
+    so a subdirectory project lines up with its own file paths.
+
+    Counts live in count-min sketches with top-k heaps on top, so memory is
+    bounded regardless of history length or the number of distinct paths.
+    """
+
+    def __init__(self, project_path: Path, rev: str = 'HEAD', top_k: int = 50):
+        self.project_path = project_path
+        self.rev = rev
+        self.files = ChurnCounter(top_k)
+        self.directories = ChurnCounter(top_k)
+        self.commits_scanned = 0
+
+    def build(self, max_commits: Optional[int] = None) -> "ChurnIndex":
+        """Stream the log once and fill the file and directory counters."""
+        # --relative and the `.` pathspec keep a subdirectory project to its
+        # own commits and report paths relative to it, like the rest of the
+        # analysis
+        cmd = ['git', '-c', 'core.quotepath=off', 'log', '--numstat',
+               '--no-renames', '--relative', '--format=%x01%H']
+        if max_commits:
+            cmd.append(f'-n{max_commits}')
+        cmd.extend([self.rev, '--', '.'])
+
+        try:
+            proc = subprocess.Popen(
+                cmd, cwd=self.project_path, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, errors='replace'
+            )
+        except Exception:
+            return self
+
+        commit_dirs: Dict[str, int] = {}
+        with proc:
+            for line in proc.stdout:
+                if line.startswith('\x01'):
+                    self._flush_directories(commit_dirs)
+                    self.commits_scanned += 1
+                    continue
+
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) != 3:
+                    continue
+
+                added, deleted, file_path = parts
+                lines = (int(added) if added.isdigit() else 0) + \
+                        (int(deleted) if deleted.isdigit() else 0)
+                self.files.add(file_path, lines)
+
+                # Each directory counts once per commit
+                parent = PurePosixPath(file_path).parent
+                while str(parent) != '.':
+                    key = str(parent)
+                    commit_dirs[key] = commit_dirs.get(key, 0) + lines
+                    parent = parent.parent
+
+            self._flush_directories(commit_dirs)
+        return self
+
+    def _flush_directories(self, commit_dirs: Dict[str, int]):
+        for directory, lines in commit_dirs.items():
+            self.directories.add(directory, lines)
+        commit_dirs.clear()
+
+    def top_files(self, limit: int = 10, by: str = 'commits') -> List[Dict[str, Any]]:
+        return self.files.ranking(by, limit)
+
+    def top_directories(self, limit: int = 10, by: str = 'commits') -> List[Dict[str, Any]]:
+        return self.directories.ranking(by, limit)
+
+    def hotspots(self, root, limit: int = 10) -> List[Dict[str, Any]]:
+        """Rank frequently changed Python files by churn x complexity.
+
+        `root` is the tree (Path or GitRevisionPath) whose current contents
+        provide the `PythonASTAnalyzer` complexity for each candidate.
+        """
+        candidates = [f for f in self.files.ranking('commits', self.files.top_by_commits.k)
+                      if f["path"].endswith('.py')]
+
+        scored = []
+        for churn in candidates:
+            try:
+                source = (root / churn["path"]).read_text(encoding='utf-8', errors='ignore')
+            except Exception:
+                continue  # deleted or unreadable at this revision
+            analysis = PythonASTAnalyzer(churn["path"]).analyze(source)
+            if "error" in analysis:
+                continue
+            scored.append({**churn, "complexity": analysis["complexity_score"]})
+
+        if not scored:
+            return []
+
+        max_commits = max(h["commits"] for h in scored) or 1
+        max_complexity = max(h["complexity"] for h in scored) or 1
+        for h in scored:
+            h["hotspot_score"] = round(
+                (h["commits"] / max_commits) * (h["complexity"] / max_complexity), 3)
+
+        scored.sort(key=lambda h: -h["hotspot_score"])
+        return scored[:limit]
+
+    def to_dict(self, root=None) -> Dict[str, Any]:
+        return {
+            "commits_scanned": self.commits_scanned,
+            "most_changed_files": self.top_files(10),
+            "most_touched_files": self.top_files(10, by='lines_touched'),
+            "most_changed_directories": self.top_directories(10),
+            "most_touched_directories": self.top_directories(10, by='lines_touched'),
+            "hotspots": self.hotspots(root) if root is not None else [],
+        }
+
+
+# =============================================================================
+# Git Object Store (analyze any revision without a checkout)
+# =============================================================================
+
+class GitObjectStore:
+    """Read git objects through one long-lived `git cat-file --batch` process.
+
+    Objects are cached by sha, so a tree or blob that is shared between
+    paths (or between revisions) is only transferred once. Requests are
+    serialized with a lock, which makes a store safe to share between
+    threads analyzing different revisions. Pass `cache_blobs=False` when
+    blobs are only read once (trees are always cached).
+    """
+
+    def __init__(self, repo_path: Path, cache_blobs: bool = True):
+        self.repo_path = repo_path
+        self.cache_blobs = cache_blobs
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._objects: Dict[str, Tuple[str, bytes]] = {}
+        self._trees: Dict[str, Dict[str, Tuple[str, str]]] = {}
+
+    def __enter__(self) -> "GitObjectStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the cat-file process."""
+        with self._lock:
+            if self._proc is not None:
+                try:
+                    self._proc.stdin.close()
+                    self._proc.wait(timeout=10)
+                except Exception:
+                    self._proc.kill()
+                self._proc.stdout.close()
+                self._proc = None
+
+    def read(self, name: str) -> Optional[Tuple[str, str, bytes]]:
+        """Return (sha, type, data) for an object name, or None if missing."""
+        cached = self._objects.get(name)
+        if cached is not None:
+            return name, cached[0], cached[1]
+
+        with self._lock:
+            if self._proc is None:
+                self._proc = subprocess.Popen(
+                    ['git', 'cat-file', '--batch'],
+                    cwd=self.repo_path,
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            self._proc.stdin.write(name.encode('utf-8') + b'\n')
+            self._proc.stdin.flush()
+
+            header = self._proc.stdout.readline().split()
+            if len(header) != 3:
+                # "<name> missing" / "<name> ambiguous"
+                return None
+
+            sha, obj_type, size = header[0].decode(), header[1].decode(), int(header[2])
+            data = self._proc.stdout.read(size)
+            self._proc.stdout.read(1)  # trailing newline
+
+        if obj_type != 'blob' or self.cache_blobs:
+            self._objects[sha] = (obj_type, data)
+        return sha, obj_type, data
+
+    def resolve_tree(self, rev: str, prefix: str = '') -> Optional[str]:
+        """Resolve a revision (branch, tag, sha) to the sha of its tree at `prefix`.
+
+        `prefix` is a directory relative to the repository root; the default
+        is the root tree.
+        """
+        obj = self.read(f"{rev}:{prefix}" if prefix else f"{rev}^{{tree}}")
+        return obj[0] if obj and obj[1] == 'tree' else None
+
+    def list_tree(self, tree_sha: str) -> Dict[str, Tuple[str, str]]:
+        """Parse a tree object into {name: (mode, sha)}."""
+        if tree_sha in self._trees:
+            return self._trees[tree_sha]
+
+        entries: Dict[str, Tuple[str, str]] = {}
+        obj = self.read(tree_sha)
+        if obj and obj[1] == 'tree':
+            data = obj[2]
+            sha_len = len(tree_sha) // 2  # 20 bytes for SHA-1, 32 for SHA-256
+            pos = 0
+            while pos < len(data):
+                space = data.index(b' ', pos)
+                nul = data.index(b'\0', space)
+                mode = data[pos:space].decode()
+                name = data[space + 1:nul].decode('utf-8', errors='replace')
+                sha = data[nul + 1:nul + 1 + sha_len].hex()
+                entries[name] = (mode, sha)
+                pos = nul + 1 + sha_len
+
+        self._trees[tree_sha] = entries
+        return entries
+
+
+class GitRevisionPath:
+    """Read-only, pathlib-style view of a path inside a git revision.
+
+    Supports the subset of the `Path` API the analysis stages use
+    (`/`, `exists`, `is_dir`, `is_file`, `iterdir`, `read_text`, `open`,
+    `stat`, `name`, `suffix`), so they run unchanged on in-memory blobs.
+    """
+
+    _DIR_MODE = '40000'
+    _SKIP_MODES = {'160000', '120000'}  # submodules, symlinks
+
+    def __init__(self, store: GitObjectStore, root_tree: str, name: str,
+                 parts: Tuple[str, ...] = ()):
+        self.store = store
+        self.root_tree = root_tree
+        self.parts = parts
+        self._root_name = name
+
+    def __truediv__(self, other) -> "GitRevisionPath":
+        extra = tuple(p for p in PurePosixPath(str(other).replace(os.sep, '/')).parts if p != '.')
+        return GitRevisionPath(self.store, self.root_tree, self._root_name, self.parts + extra)
+
+    def __str__(self) -> str:
+        return '/'.join(self.parts) or '.'
+
+    def __repr__(self) -> str:
+        return f"GitRevisionPath({str(self)!r})"
+
+    @property
+    def name(self) -> str:
+        return self.parts[-1] if self.parts else self._root_name
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.name).suffix
+
+    @property
+    def object_id(self) -> Optional[str]:
+        """Sha of the tree or blob at this path."""
+        entry = self._entry()
+        return entry[1] if entry else None
+
+    def _entry(self) -> Optional[Tuple[str, str]]:
+        entry = (self._DIR_MODE, self.root_tree)
+        for part in self.parts:
+            if entry[0] != self._DIR_MODE:
+                return None
+            entry = self.store.list_tree(entry[1]).get(part)
+            if entry is None:
+                return None
+        return entry
+
+    def exists(self) -> bool:
+        entry = self._entry()
+        return entry is not None and entry[0] not in self._SKIP_MODES
+
+    def is_dir(self) -> bool:
+        entry = self._entry()
+        return entry is not None and entry[0] == self._DIR_MODE
+
+    def is_file(self) -> bool:
+        entry = self._entry()
+        return entry is not None and entry[0] != self._DIR_MODE and entry[0] not in self._SKIP_MODES
+
+    def iterdir(self) -> Iterator["GitRevisionPath"]:
+        entry = self._entry()
+        if entry is None or entry[0] != self._DIR_MODE:
+            raise NotADirectoryError(str(self))
+        for name, (mode, _) in self.store.list_tree(entry[1]).items():
+            if mode not in self._SKIP_MODES:
+                yield self / name
+
+    def read_bytes(self) -> bytes:
+        entry = self._entry()
+        if entry is None or not self.is_file():
+            raise FileNotFoundError(str(self))
+        obj = self.store.read(entry[1])
+        if obj is None:
+            raise FileNotFoundError(str(self))
+        return obj[2]
+
+    def read_text(self, encoding: str = 'utf-8', errors: str = 'strict') -> str:
+        return self.read_bytes().decode(encoding, errors)
+
+    def open(self, mode: str = 'r', encoding: str = 'utf-8', errors: str = 'strict'):
+        if 'b' in mode:
+            return io.BytesIO(self.read_bytes())
+        return io.StringIO(self.read_text(encoding, errors))
+
+    def stat(self) -> os.stat_result:
+        size = len(self.read_bytes()) if self.is_file() else 0
+        return os.stat_result((0o100644, 0, 0, 1, 0, 0, size, 0, 0, 0))
+
+    def walk(self) -> Iterator[Tuple[Path, List[str], List[str]]]:
+        """Top-down walk mirroring `os.walk`, yielding paths relative to self.
+
+        Like `os.walk`, callers may prune `dirs` in place; pruned subtrees
+        are never read from the object store.
+        """
+        entry = self._entry()
+        if entry is None or entry[0] != self._DIR_MODE:
+            return
+        stack = [(Path(), entry[1])]
+        while stack:
+            rel_root, tree_sha = stack.pop()
+            listing = self.store.list_tree(tree_sha)
+            dirs = sorted(n for n, (mode, _) in listing.items() if mode == self._DIR_MODE)
+            files = sorted(n for n, (mode, _) in listing.items()
+                           if mode != self._DIR_MODE and mode not in self._SKIP_MODES)
+            yield rel_root, dirs, files
+            for d in reversed(dirs):
+                if d in listing:
+                    stack.append((rel_root / d, listing[d][1]))
+
+
+def git_prefix(project_path: Path) -> Optional[str]:
+    """Path of `project_path` inside its repository ('' at the root).
+
+    None if it is not inside a git working tree.
+    """
+    try:
+        result = subprocess.run(
+            ['git', '-c', 'core.quotepath=off', 'rev-parse', '--show-prefix'],
+            cwd=project_path, capture_output=True, text=True, timeout=10
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().rstrip('/')
+
+
+def open_revision(project_path: Path, rev: str,
+                  store: Optional[GitObjectStore] = None,
+                  prefix: Optional[str] = None) -> Optional[GitRevisionPath]:
+    """Open `rev` of the repository at `project_path` as a GitRevisionPath.
+
+    When `project_path` is a subdirectory of the repository, the view is
+    rooted at that directory's tree in `rev`, matching the working tree.
+    Pass `prefix` (see git_prefix) to skip looking it up again.
+    """
+    store = store or GitObjectStore(project_path)
+    if prefix is None:
+        prefix = git_prefix(project_path) or ''
+    tree_sha = store.resolve_tree(rev, prefix)
+    if tree_sha is None:
+        return None
+    return GitRevisionPath(store, tree_sha, project_path.resolve().name)
+
+
+def walk_project(root) -> Iterator[Tuple[Path, List[str], List[str]]]:
+    """os.walk over a working tree or git revision, relative to the root."""
+    if isinstance(root, GitRevisionPath):
+        yield from root.walk()
+        return
+    for dirpath, dirs, files in os.walk(root):
+        yield Path(dirpath).relative_to(root), dirs, files
+
+
+# =============================================================================
+# Historical Complexity Timeline
+# =============================================================================
+
+class ComplexityTimeline:
+    """Run the AST, complexity and pattern stages over sampled commits.
+
+    Per-file results are memoized by git blob sha: a blob that is unchanged
+    between samples (the common case) is parsed exactly once, and unchanged
+    subtrees are only listed once thanks to the object store's tree cache.
+    """
+
+    def __init__(self, project_path: Path, rev: str = 'HEAD'):
+        self.project_path = project_path
+        self.rev = rev
+        self._blob_results: Dict[str, Tuple[str, Optional[Dict[str, Any]]]] = {}
+        self.blobs_parsed = 0
+        self.blobs_reused = 0
+
+    def analyze(self, samples: int = 10) -> Dict[str, Any]:
+        """Build a time series of complexity metrics over `samples` commits."""
+        prefix = git_prefix(self.project_path)
+        if prefix is None:
+            return {"error": "Not a git repository"}
+
+        commits = self._sample_commits(samples)
+        timeline = []
+
+        with GitObjectStore(self.project_path, cache_blobs=False) as store:
+            for commit in commits:
+                root = open_revision(self.project_path, commit["sha"], store, prefix)
+                if root is None:
+                    continue
+                timeline.append({**commit, **self._analyze_commit(root)})
+
+        for point in timeline:
+            point["sha"] = point["sha"][:8]
+
+        return {
+            "revision": self.rev,
+            "samples": len(timeline),
+            "timeline": timeline,
+            "blobs_parsed": self.blobs_parsed,
+            "blobs_reused": self.blobs_reused,
+        }
+
+    def _sample_commits(self, samples: int) -> List[Dict[str, str]]:
+        """Pick `samples` evenly spaced first-parent commits, oldest first."""
+        try:
+            result = subprocess.run(
+                ['git', 'log', '--first-parent', '--reverse',
+                 '--pretty=format:%H|%ai|%s', self.rev],
+                cwd=self.project_path,
+                capture_output=True, text=True, timeout=60
+            )
+        except Exception:
+            return []
+
+        if result.returncode != 0:
+            return []
+
+        commits = []
+        for line in result.stdout.splitlines():
+            parts = line.split('|', 2)
+            if len(parts) == 3:
+                commits.append({"sha": parts[0], "date": parts[1][:10], "message": parts[2][:80]})
+
+        if samples <= 1:
+            return commits[-1:]
+        if len(commits) <= samples:
+            return commits
+
+        step = (len(commits) - 1) / (samples - 1)
+        return [commits[round(i * step)] for i in range(samples)]
+
+    def _analyze_commit(self, root: GitRevisionPath) -> Dict[str, Any]:
+        """Aggregate per-file results for one snapshot and detect patterns."""
+        totals = {
+            "classes": [],
+            "functions": [],
+            "imports": [],
+            "react_components": [],
+            "hooks": [],
+            "complexity_total": 0,
+        }
+        directories = []
+        files_analyzed = 0
+
+        for rel_root, dirs, files in walk_project(root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            directories.extend(str(rel_root / d) for d in dirs)
+
+            for file in files:
+                ext = PurePosixPath(file).suffix.lower()
+                if ext != ".py" and ext not in JS_EXTENSIONS:
+                    continue
+                rel_path = str(rel_root / file)
+                analysis = self._analyze_blob(root / rel_path, rel_path, ext)
+                if analysis is not None:
+                    merge_ast_results(totals, analysis)
+                    files_analyzed += 1
+
+        patterns = DesignPatternDetector().detect(
+            [ClassInfo(**c) for c in totals["classes"]],
+            [FunctionInfo(**f) for f in totals["functions"]],
+            [ImportInfo(**i) for i in totals["imports"]],
+            {"directories": directories},
+        )
+
+        return {
+            "files_analyzed": files_analyzed,
+            "complexity_total": totals["complexity_total"],
+            "classes": len(totals["classes"]),
+            "functions": len(totals["functions"]),
+            "react_components": len(totals["react_components"]),
+            "design_patterns": [
+                {"name": p.name, "confidence": round(p.confidence, 2)} for p in patterns
+            ],
+        }
+
+    def _analyze_blob(self, file_path: GitRevisionPath, rel_path: str,
+                      ext: str) -> Optional[Dict[str, Any]]:
+        """Analyze a blob once; later samples reuse the memoized result."""
+        sha = file_path.object_id
+        if sha is None:
+            return None
+
+        if sha in self._blob_results:
+            self.blobs_reused += 1
+            first_path, analysis = self._blob_results[sha]
+            if analysis is None or first_path == rel_path:
+                return analysis
+            # Same content at a new path (rename/copy): relabel, don't reparse
+            return {
+                **analysis,
+                "classes": [{**c, "file": rel_path} for c in analysis["classes"]],
+                "functions": [{**f, "file": rel_path} for f in analysis["functions"]],
+                "imports": [{**i, "file": rel_path} for i in analysis["imports"]],
+            }
+
+        self.blobs_parsed += 1
+        analysis = None
+        try:
+            source = file_path.read_text(encoding='utf-8', errors='ignore')
+            if sum(1 for line in source.splitlines() if line.strip()) <= 2000:
+                analysis = analyze_source_file(rel_path, ext, source)
+        except Exception:
+            pass
+
+        self._blob_results[sha] = (rel_path, analysis)
+        return analysis
+
+
 # =============================================================================
 # Main Analysis Functions
 # =============================================================================
 
 def analyze_project(project_path: str, full_analysis: bool = False,
-                    deep_analysis: bool = False) -> Dict[str, Any]:
-    """Main analysis function with enhanced capabilities."""
+                    deep_analysis: bool = False, rev: Optional[str] = None,
+                    timeline_samples: int = 0) -> Dict[str, Any]:
+    """Main analysis function with enhanced capabilities.
+
+    With `rev`, the tree and blobs of that revision are read from the git
+    object store instead of the working tree, so any branch, tag or sha can
+    be analyzed without a checkout. With `timeline_samples`, complexity and
+    design patterns are also tracked across that many sampled commits.
+    """
     path = Path(project_path)
     if not path.exists():
         return {"error": f"Path not found: {project_path}"}
 
+    if rev is None:
+        return _analyze_root(path, path, full_analysis, deep_analysis,
+                             timeline_samples=timeline_samples)
+
+    with GitObjectStore(path) as store:
+        root = open_revision(path, rev, store)
+        if root is None:
+            return {"error": f"Unknown revision: {rev}"}
+        results = _analyze_root(path, root, full_analysis, deep_analysis, rev,
+                                timeline_samples)
+        results["revision"] = rev
+        return results
+
+
+def _analyze_root(path: Path, root, full_analysis: bool, deep_analysis: bool,
+                  rev: str = 'HEAD', timeline_samples: int = 0) -> Dict[str, Any]:
+    """Run every analysis stage against `root` (a Path or GitRevisionPath)."""
     results = {
         "project_name": path.name,
         "languages": defaultdict(int),
@@ -1040,21 +1712,21 @@ def analyze_project(project_path: str, full_analysis: bool = False,
             "design_patterns": [],
         },
         "git_narrative": {},
+        "complexity_timeline": {},
     }
 
     # Collect all files
     all_files = []
     all_dirs = set()
 
-    for root, dirs, files in os.walk(path):
+    for rel_root, dirs, files in walk_project(root):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        rel_root = Path(root).relative_to(path)
 
         for d in dirs:
             all_dirs.add(str(rel_root / d))
 
         for file in files:
-            file_path = Path(root) / file
+            file_path = root / (rel_root / file)
             rel_path = rel_root / file
             ext = file_path.suffix.lower()
 
@@ -1088,16 +1760,16 @@ def analyze_project(project_path: str, full_analysis: bool = False,
     results["largest_files"] = all_files[:10]
 
     # Basic analysis
-    results["frameworks"] = detect_frameworks(path)
-    results["structure"]["tree"] = generate_structure(path, max_depth=2)
-    results["key_files"] = identify_key_files(path, all_files)
+    results["frameworks"] = detect_frameworks(root)
+    results["structure"]["tree"] = generate_structure(root, max_depth=2)
+    results["key_files"] = identify_key_files(root, all_files)
     results["complexity"] = calculate_complexity(all_files)
-    results["dependencies"] = analyze_dependencies(path)
-    results["test_info"] = analyze_tests(path, all_files)
+    results["dependencies"] = analyze_dependencies(root)
+    results["test_info"] = analyze_tests(root, all_files)
 
     # Enhanced AST analysis
     if deep_analysis or full_analysis:
-        ast_results = perform_ast_analysis(path, all_files)
+        ast_results = perform_ast_analysis(root, all_files)
         results["ast_analysis"] = ast_results
 
         # Design pattern detection
@@ -1112,15 +1784,19 @@ def analyze_project(project_path: str, full_analysis: bool = False,
 
     # Git narrative analysis
     if deep_analysis:
-        git_analyzer = GitHistoryAnalyzer(path)
+        git_analyzer = GitHistoryAnalyzer(path, rev)
         results["git_narrative"] = git_analyzer.analyze()
     else:
-        results["git_insights"] = get_basic_git_insights(path)
+        results["git_insights"] = get_basic_git_insights(path, rev)
+
+    # Historical complexity timeline
+    if timeline_samples > 0:
+        results["complexity_timeline"] = ComplexityTimeline(path, rev).analyze(timeline_samples)
 
     # Extract story hooks (enhanced)
     if full_analysis or deep_analysis:
-        results["story_hooks"] = extract_enhanced_story_hooks(path, all_files)
-        results["api_endpoints"] = extract_api_endpoints(path, all_files)
+        results["story_hooks"] = extract_enhanced_story_hooks(root, all_files)
+        results["api_endpoints"] = extract_api_endpoints(root, all_files)
 
     # Generate content angles (using all analysis)
     results["content_angles"] = suggest_enhanced_angles(results, deep_analysis)
@@ -1128,8 +1804,14 @@ def analyze_project(project_path: str, full_analysis: bool = False,
     return results
 
 
-def perform_ast_analysis(path: Path, all_files: List[Dict]) -> Dict[str, Any]:
-    """Perform AST analysis on Python and JS/TS files."""
+JS_EXTENSIONS = ['.js', '.ts', '.jsx', '.tsx']
+
+
+def analyze_source_file(rel_path: str, ext: str, source: str) -> Dict[str, Any]:
+    """Run the AST stage on a single file's source.
+
+    Returns the same keys as `perform_ast_analysis`, unaggregated.
+    """
     results = {
         "classes": [],
         "functions": [],
@@ -1139,60 +1821,69 @@ def perform_ast_analysis(path: Path, all_files: List[Dict]) -> Dict[str, Any]:
         "complexity_total": 0,
     }
 
-    py_analyzer = PythonASTAnalyzer("")
-    js_analyzer = JSAnalyzer()
+    if ext == ".py":
+        analysis = PythonASTAnalyzer(rel_path).analyze(source)
 
-    # Analyze Python files
-    for file_info in all_files:
-        if file_info["ext"] != ".py":
-            continue
-        if file_info.get("lines", 0) > 2000:  # Skip very large files
-            continue
+        if "error" not in analysis:
+            results["classes"].extend(analysis.get("classes", []))
+            results["functions"].extend(analysis.get("functions", []))
+            results["imports"].extend(analysis.get("imports", []))
+            results["complexity_total"] += analysis.get("complexity_score", 0)
 
-        try:
-            full_path = path / file_info["path"]
-            source = full_path.read_text(encoding='utf-8', errors='ignore')
+    elif ext in JS_EXTENSIONS:
+        analysis = JSAnalyzer().analyze(source, rel_path)
 
-            analyzer = PythonASTAnalyzer(file_info["path"])
-            analysis = analyzer.analyze(source)
+        # Convert JS classes to common format
+        for cls in analysis.get("classes", []):
+            results["classes"].append({
+                "name": cls["name"],
+                "file": rel_path,
+                "line": 0,
+                "bases": [cls["extends"]] if cls.get("extends") else [],
+                "methods": [],
+                "decorators": [],
+                "docstring": None,
+            })
 
-            if "error" not in analysis:
-                results["classes"].extend(analysis.get("classes", []))
-                results["functions"].extend(analysis.get("functions", []))
-                results["imports"].extend(analysis.get("imports", []))
-                results["complexity_total"] += analysis.get("complexity_score", 0)
-        except Exception:
-            pass
+        results["react_components"].extend(analysis.get("react_components", []))
+        results["hooks"].extend(analysis.get("hooks", []))
 
-    # Analyze JS/TS files
-    for file_info in all_files:
-        if file_info["ext"] not in [".js", ".ts", ".jsx", ".tsx"]:
-            continue
-        if file_info.get("lines", 0) > 2000:
-            continue
+    return results
+
+
+def merge_ast_results(results: Dict[str, Any], analysis: Dict[str, Any]):
+    """Accumulate one file's `analyze_source_file` output into `results`."""
+    for key in ("classes", "functions", "imports", "react_components", "hooks"):
+        results[key].extend(analysis[key])
+    results["complexity_total"] += analysis["complexity_total"]
 
-        try:
-            full_path = path / file_info["path"]
-            source = full_path.read_text(encoding='utf-8', errors='ignore')
-
-            analysis = js_analyzer.analyze(source, file_info["path"])
-
-            # Convert JS classes to common format
-            for cls in analysis.get("classes", []):
-                results["classes"].append({
-                    "name": cls["name"],
-                    "file": file_info["path"],
-                    "line": 0,
-                    "bases": [cls["extends"]] if cls.get("extends") else [],
-                    "methods": [],
-                    "decorators": [],
-                    "docstring": None,
-                })
-
-            results["react_components"].extend(analysis.get("react_components", []))
-            results["hooks"].extend(analysis.get("hooks", []))
-        except Exception:
-            pass
+
+def perform_ast_analysis(path: Path, all_files: List[Dict]) -> Dict[str, Any]:
+    """Perform AST analysis on Python and JS/TS files."""
+    results = {
+        "classes": [],
+        "functions": [],
+        "imports": [],
+        "react_components": [],
+        "hooks": [],
+        "complexity_total": 0,
+    }
+
+    # Python files first, then JS/TS files
+    for exts in ([".py"], JS_EXTENSIONS):
+        for file_info in all_files:
+            if file_info["ext"] not in exts:
+                continue
+            if file_info.get("lines", 0) > 2000:  # Skip very large files
+                continue
+
+            try:
+                full_path = path / file_info["path"]
+                source = full_path.read_text(encoding='utf-8', errors='ignore')
+                merge_ast_results(results, analyze_source_file(
+                    file_info["path"], file_info["ext"], source))
+            except Exception:
+                pass
 
     # Limit results
     results["classes"] = results["classes"][:50]
@@ -1322,6 +2013,12 @@ def suggest_enhanced_angles(results: Dict, deep_analysis: bool) -> List[str]:
         for pivot in pivots[:2]:
             angles.append(f"Architectural pivot: {pivot['description'][:100]}")
 
+        hotspots = git_narrative.get("churn", {}).get("hotspots", [])
+        if hotspots:
+            top = hotspots[0]
+            angles.append(f"Inside our hotspot: why {top['path']} changed in "
+                          f"{top['commits']} commits")
+
         story_commits = git_narrative.get("story_worthy_commits", [])
         for commit in story_commits[:2]:
             if commit.get("story_value", 0) > 0.6:
@@ -1368,11 +2065,20 @@ def suggest_enhanced_angles(results: Dict, deep_analysis: bool) -> List[str]:
     if test_info.get("estimated_coverage") == "high":
         angles.append("How we achieved comprehensive test coverage")
 
+    # Based on complexity timeline
+    timeline = results.get("complexity_timeline", {}).get("timeline", [])
+    if len(timeline) >= 2:
+        first, last = timeline[0], timeline[-1]
+        angles.append(
+            f"The evolution of our architecture: complexity {first['complexity_total']} → "
+            f"{last['complexity_total']}, {first['classes']} → {last['classes']} classes "
+            f"({first['date']} to {last['date']})"
+        )
+
     # Generic but valuable angles
-    angles.extend([
-        "What I'd do differently: Lessons from building this",
-        "The evolution of our architecture",
-    ])
+    angles.append("What I'd do differently: Lessons from building this")
+    if len(timeline) < 2:
+        angles.append("The evolution of our architecture")
 
     # Deduplicate and limit
     seen = set()
@@ -1393,7 +2099,7 @@ def suggest_enhanced_angles(results: Dict, deep_analysis: bool) -> List[str]:
 def count_lines(file_path: Path) -> int:
     """Count non-empty lines in a file."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        with file_path.open('r', encoding='utf-8', errors='ignore') as f:
             return sum(1 for line in f if line.strip())
     except Exception:
         return 0
@@ -1652,7 +2358,7 @@ def calculate_complexity(all_files: List[Dict]) -> Dict:
     }
 
 
-def get_basic_git_insights(path: Path) -> Dict[str, Any]:
+def get_basic_git_insights(path: Path, rev: str = 'HEAD') -> Dict[str, Any]:
     """Get basic git insights without deep analysis."""
     insights = {
         "is_git_repo": False,
@@ -1663,22 +2369,21 @@ def get_basic_git_insights(path: Path) -> Dict[str, Any]:
         "age": ""
     }
 
-    git_dir = path / '.git'
-    if not git_dir.exists():
+    if git_prefix(path) is None:
         return insights
 
     insights["is_git_repo"] = True
 
     try:
         result = subprocess.run(
-            ['git', 'rev-list', '--count', 'HEAD'],
+            ['git', 'rev-list', '--count', rev],
             cwd=path, capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0:
             insights["total_commits"] = int(result.stdout.strip())
 
         result = subprocess.run(
-            ['git', 'shortlog', '-sn', '--no-merges', 'HEAD'],
+            ['git', 'shortlog', '-sn', '--no-merges', rev],
             cwd=path, capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0:
@@ -1688,19 +2393,23 @@ def get_basic_git_insights(path: Path) -> Dict[str, Any]:
             ]
 
         result = subprocess.run(
-            ['git', 'log', '--format=%cr', '-1'],
+            ['git', 'log', '--format=%cr', '-1', rev],
             cwd=path, capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0:
             insights["recent_activity"] = result.stdout.strip()
 
         result = subprocess.run(
-            ['git', 'log', '--reverse', '--format=%cr', '-1'],
+            ['git', 'log', '--reverse', '--format=%cr', '-1', rev],
             cwd=path, capture_output=True, text=True, timeout=10
         )
         if result.returncode == 0:
             insights["age"] = f"Started {result.stdout.strip()}"
 
+        # Recent history only, like the other quick insights
+        churn = ChurnIndex(path, rev, top_k=20).build(max_commits=200)
+        insights["most_changed_files"] = churn.top_files(10)
+
     except Exception:
         pass
 
@@ -1715,6 +2424,8 @@ def print_report(results: Dict, verbose: bool = False):
     """Print a formatted report."""
     print("\n" + "=" * 70)
     print(f"PROJECT ANALYSIS: {results['project_name']}")
+    if results.get('revision'):
+        print(f"Revision: {results['revision']}")
     print("=" * 70)
 
     print("\nOVERVIEW")
@@ -1748,12 +2459,29 @@ def print_report(results: Dict, verbose: bool = False):
         for pivot in git_narrative['pivots'][:3]:
             print(f"  [{pivot['date']}] {pivot['description'][:60]}...")
 
+    hotspots = git_narrative.get('churn', {}).get('hotspots', []) if git_narrative else []
+    if hotspots:
+        print("\nCHURN HOTSPOTS")
+        for h in hotspots[:5]:
+            print(f"  • {h['path']} ({h['commits']} commits, {h['lines_touched']} lines, "
+                  f"complexity {h['complexity']})")
+
     if git_narrative and git_narrative.get('story_worthy_commits'):
         print("\nSTORY-WORTHY COMMITS")
         for commit in git_narrative['story_worthy_commits'][:5]:
             score = int(commit['story_value'] * 100)
             print(f"  [{commit['date']}] {commit['message'][:50]}... (story value: {score}%)")
 
+    # Complexity timeline
+    timeline = results.get('complexity_timeline', {}).get('timeline', [])
+    if timeline:
+        print("\nCOMPLEXITY TIMELINE")
+        for point in timeline:
+            names = ", ".join(p['name'] for p in point['design_patterns'][:3])
+            print(f"  [{point['date']}] {point['sha']} complexity {point['complexity_total']}, "
+                  f"{point['classes']} classes, {point['functions']} functions"
+                  f"{' | ' + names if names else ''}")
+
     # Classes and Functions (new)
     ast_analysis = results.get('ast_analysis', {})
     classes = ast_analysis.get('classes', [])
@@ -1794,6 +2522,8 @@ if __name__ == "__main__":
         print("  --full     Include story hooks and API endpoint extraction")
         print("  --deep     Full AST analysis + git narrative (slower)")
         print("  --verbose  Show all details in report")
+        print("  --rev REF  Analyze a git revision (branch, tag, sha) without checkout")
+        print("  --timeline N  Track complexity and patterns over N sampled commits")
         print("\nEnhanced analysis with AST parsing, design pattern detection,")
         print("and semantic git history analysis for technical writing.")
         sys.exit(1)
@@ -1803,10 +2533,28 @@ if __name__ == "__main__":
     deep_analysis = "--deep" in sys.argv
     verbose = "--verbose" in sys.argv
 
+    rev = None
+    if "--rev" in sys.argv:
+        idx = sys.argv.index("--rev")
+        if idx + 1 >= len(sys.argv):
+            print("Error: --rev requires a git revision")
+            sys.exit(1)
+        rev = sys.argv[idx + 1]
+
+    timeline_samples = 0
+    if "--timeline" in sys.argv:
+        idx = sys.argv.index("--timeline")
+        if idx + 1 < len(sys.argv) and sys.argv[idx + 1].isdigit():
+            timeline_samples = int(sys.argv[idx + 1])
+        else:
+            timeline_samples = 10
+
     results = analyze_project(
         project_path,
         full_analysis=full_analysis,
-        deep_analysis=deep_analysis
+        deep_analysis=deep_analysis,
+        rev=rev,
+        timeline_samples=timeline_samples,
     )
 
     if "error" in results:
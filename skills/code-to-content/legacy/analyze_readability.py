@@ -8,8 +8,20 @@ the target audience and content type.
 
 Features:
     - Audience-aware thresholds (beginner vs expert expects different density)
-    - Domain-specific jargon detection with context
-    - Improved syllable counting with exceptions dictionary
+    - Domain-specific jargon detection with context, extensible with a
+      memory-mapped glossary index (multi-word terms, loaded lazily)
+    - Improved syllable counting with exceptions dictionary and an optional
+      pronunciation lexicon (memoized per word form)
+    - Incremental re-analysis for editors (IncrementalAnalyzer rescans only
+      the paragraphs an edit touched)
+    - Corpus length distributions for batches (percentiles, histograms,
+      per-section breakdowns; uses NumPy when installed)
+    - Findings located by line and column in the source file
+    - One-pass markdown block parsing (backtick and tilde fences, indented
+      code, front matter) shared by prose extraction and structure metrics
+    - Delta reports between two versions, rescanning only changed paragraphs
+    - Pluggable rules sharing one traversal of tokens, sentences, paragraphs
+      and markdown blocks (built-in checks are rules too)
     - Actionable suggestions tailored to audience
     - Content structure analysis for technical docs
 
@@ -17,8 +29,23 @@ Usage:
     python analyze_readability.py /path/to/file.md
     python analyze_readability.py /path/to/file.md --audience beginner
     python analyze_readability.py /path/to/file.md --audience expert
+    python analyze_readability.py /path/to/file.md --audience all  # Rank audiences
     python analyze_readability.py /path/to/file.md --json
     python analyze_readability.py /path/to/file.md --validate
+    python analyze_readability.py docs/ 'guides/**/*.md' --validate  # Parallel batch
+    python analyze_readability.py manual.md --stream             # Memory bounded by the longest block
+    cat manual.md | python analyze_readability.py - --json       # From stdin
+    python analyze_readability.py --build-syllable-lexicon cmudict.dict syllables.idx
+    python analyze_readability.py file.md --syllable-lexicon syllables.idx
+    python analyze_readability.py --build-jargon-index glossary.tsv jargon.idx
+    python analyze_readability.py file.md --jargon-index jargon.idx
+    python analyze_readability.py docs/ --validate --cache .readability-cache
+    python analyze_readability.py --staged --validate               # Pre-commit hook
+    python analyze_readability.py --diff old.md new.md             # Readability delta
+    python analyze_readability.py docs/ --profile --json            # Per-stage timing
+    python analyze_readability.py docs/ --rules house_rules.py      # Custom rules
+    python analyze_readability.py docs/guide.md --rev origin/main
+    python analyze_readability.py docs/ --changed origin/main...HEAD --validate
 
 Output:
     - Context-aware readability scores
@@ -31,13 +58,28 @@ Output:
 import os
 import sys
 import re
+import glob
 import json
+import hashlib
+import mmap
+import struct
+import subprocess
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from collections import Counter
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Tuple, Optional, Iterable, Iterator
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from difflib import SequenceMatcher
+from dataclasses import dataclass, asdict, field, replace
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # Optional: corpus statistics fall back to pure Python
+    np = None
+
 
 # =============================================================================
 # Audience Profiles
@@ -158,23 +200,17 @@ SYLLABLE_EXCEPTIONS = {
 }
 
 
-def count_syllables(word: str) -> int:
-    """
-    Count syllables with improved accuracy using exceptions dictionary
-    and better heuristics.
-    """
-    word = word.lower().strip()
+NON_ALPHA_PATTERN = re.compile(r'[^a-z]')
 
-    # Check exceptions first
-    if word in SYLLABLE_EXCEPTIONS:
-        return SYLLABLE_EXCEPTIONS[word]
 
+def _estimate_syllables(word: str) -> int:
+    """Heuristic syllable count for a lowercase word (no dictionary lookup)."""
     # Handle very short words
     if len(word) <= 2:
         return 1
 
     # Remove trailing punctuation
-    word = re.sub(r'[^a-z]', '', word)
+    word = NON_ALPHA_PATTERN.sub('', word)
     if not word:
         return 1
 
@@ -223,6 +259,180 @@ def count_syllables(word: str) -> int:
     return max(1, count)
 
 
+class SortedIndex:
+    """Read-only sorted key/value table in a compact, memory-mapped file.
+
+    Layout (little-endian)::
+
+        b'C2CIDX1\\n'  uint32 count  uint32 reserved
+        uint32 key_offsets[count + 1]    uint32 value_offsets[count + 1]
+        keys blob (UTF-8, sorted bytewise)  values blob
+
+    Nothing is read until the first lookup, and lookups binary-search the
+    mapping directly, so opening a table with hundreds of thousands of
+    entries costs no startup time and only touches the pages it needs.
+    """
+
+    MAGIC = b'C2CIDX1\n'
+    HEADER = struct.Struct('<8sII')
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._mm: Optional[mmap.mmap] = None
+        self._count = 0
+        self._keys_at = self._values_at = 0
+        self._key_blob = self._value_blob = 0
+
+    def fingerprint(self) -> str:
+        """Identifies this file's contents, by path, size and modification time."""
+        stat = self.path.stat()
+        return f"{self.path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @classmethod
+    def write(cls, path: Path, items: Dict[str, bytes]):
+        """Write `items` as a sorted index file."""
+        entries = sorted((k.encode('utf-8'), v) for k, v in items.items())
+        key_offsets, value_offsets = [0], [0]
+        for key, value in entries:
+            key_offsets.append(key_offsets[-1] + len(key))
+            value_offsets.append(value_offsets[-1] + len(value))
+
+        with open(path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, len(entries), 0))
+            f.write(struct.pack(f'<{len(key_offsets)}I', *key_offsets))
+            f.write(struct.pack(f'<{len(value_offsets)}I', *value_offsets))
+            f.write(b''.join(k for k, _ in entries))
+            f.write(b''.join(v for _, v in entries))
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, _ = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC:
+            raise ValueError(f"Not a sorted index file: {self.path}")
+        self._keys_at = self.HEADER.size
+        self._values_at = self._keys_at + 4 * (self._count + 1)
+        self._key_blob = self._values_at + 4 * (self._count + 1)
+        self._value_blob = self._key_blob + struct.unpack_from(
+            '<I', self._mm, self._keys_at + 4 * self._count)[0]
+
+    def __len__(self) -> int:
+        if self._mm is None:
+            self._open()
+        return self._count
+
+    def key_at(self, i: int) -> bytes:
+        start, end = struct.unpack_from('<II', self._mm, self._keys_at + 4 * i)
+        return self._mm[self._key_blob + start:self._key_blob + end]
+
+    def value_at(self, i: int) -> bytes:
+        start, end = struct.unpack_from('<II', self._mm, self._values_at + 4 * i)
+        return self._mm[self._value_blob + start:self._value_blob + end]
+
+    def bisect(self, key: bytes) -> int:
+        """Index of the first entry whose key is >= `key`."""
+        if self._mm is None:
+            self._open()
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def get(self, key: str) -> Optional[bytes]:
+        encoded = key.encode('utf-8')
+        i = self.bisect(encoded)
+        if i < self._count and self.key_at(i) == encoded:
+            return self.value_at(i)
+        return None
+
+
+def build_syllable_lexicon(source: Path, dest: Path) -> int:
+    """Convert a CMUdict-format pronunciation file into a syllable index.
+
+    Each line is `WORD  PH1 PH2 ...`; vowel phonemes carry a stress digit,
+    so the syllable count is the number of phonemes ending in a digit.
+    Alternate pronunciations (`WORD(2)`) and `;;;` comments are skipped.
+    Returns the number of entries written.
+    """
+    counts: Dict[str, bytes] = {}
+    with open(source, encoding='latin-1') as f:
+        for line in f:
+            if not line.strip() or line.startswith(';;;'):
+                continue
+            word, *phones = line.split()
+            if word.endswith(')'):
+                continue
+            syllables = sum(1 for ph in phones if ph[-1].isdigit())
+            counts.setdefault(word.lower(), bytes([min(max(syllables, 1), 255)]))
+
+    SortedIndex.write(dest, counts)
+    return len(counts)
+
+
+class SyllableCounter:
+    """Syllable engine memoized per distinct word form.
+
+    Lookup order: `SYLLABLE_EXCEPTIONS`, then an optional pronunciation
+    lexicon (see `build_syllable_lexicon`), then the vowel-group heuristic.
+    Because of Zipf's law a few thousand word types cover most tokens of a
+    long document, so `count_words` only evaluates each type once.
+    """
+
+    MAX_CACHED = 200_000
+
+    def __init__(self, lexicon_path: Optional[Path] = None):
+        self.lexicon = SortedIndex(lexicon_path) if lexicon_path else None
+        self._cache: Dict[str, int] = {}
+
+    def count(self, word: str) -> int:
+        cached = self._cache.get(word)
+        if cached is not None:
+            return cached
+
+        key = word.lower().strip()
+        result = SYLLABLE_EXCEPTIONS.get(key)
+        if result is None and self.lexicon is not None and len(key) > 2:
+            value = self.lexicon.get(key)
+            if value:
+                result = value[0]
+        if result is None:
+            result = _estimate_syllables(key)
+
+        if len(self._cache) >= self.MAX_CACHED:
+            self._cache.clear()
+        self._cache[word] = result
+        return result
+
+    def count_words(self, word_counts: Dict[str, int]) -> int:
+        """Total syllables for a {word: occurrences} table."""
+        return sum(self.count(word) * n for word, n in word_counts.items())
+
+
+SYLLABLE_LEXICON_ENV = 'C2C_SYLLABLE_LEXICON'
+_default_syllable_counter: Optional[SyllableCounter] = None
+
+
+def default_syllable_counter() -> SyllableCounter:
+    """Process-wide counter; uses the lexicon named by $C2C_SYLLABLE_LEXICON."""
+    global _default_syllable_counter
+    if _default_syllable_counter is None:
+        lexicon = os.environ.get(SYLLABLE_LEXICON_ENV)
+        _default_syllable_counter = SyllableCounter(Path(lexicon) if lexicon else None)
+    return _default_syllable_counter
+
+
+def count_syllables(word: str) -> int:
+    """
+    Count syllables with improved accuracy using exceptions dictionary
+    and better heuristics.
+    """
+    return default_syllable_counter().count(word)
+
+
 # =============================================================================
 # Jargon Detection with Context
 # =============================================================================
@@ -305,6 +515,220 @@ JARGON_PATTERNS = [
     (r'\b\w+-(?:based|driven|first|native|ready|aware|safe)\b', 'compound'),
 ]
 
+# Definition sites: "X is/are/refers to/means", "X, which is", "known as X".
+# Group 1 is the defined term; lookaheads keep matches from overlapping.
+DEFINITION_PATTERNS = [
+    re.compile(r'\b([a-z]+)\b(?=[,\s]+(?:is|are|refers? to|means?))', re.IGNORECASE),
+    re.compile(r'\b([a-z]+)\b(?=[,\s]+(?:which|that)\s+(?:is|are))', re.IGNORECASE),
+    re.compile(r'(?:called|known as|termed)\s+\b([a-z]+)\b', re.IGNORECASE),
+]
+
+
+def index_definitions(text: str) -> Dict[str, int]:
+    """Map each defined term (lowercase) to the offset of its first definition."""
+    first: Dict[str, int] = {}
+    for pattern in DEFINITION_PATTERNS:
+        for match in pattern.finditer(text):
+            term = match.group(1).lower()
+            offset = match.start(1)
+            if offset < first.get(term, len(text)):
+                first[term] = offset
+    return first
+
+
+# A multi-word term matches across spaces with at most one line break, or
+# one joining character ("event sourcing", "CI/CD", "Node.js"), never
+# across a sentence end or a blank line.
+TERM_GAP_PATTERN = re.compile(r'(?=\s)[ \t]*\r?\n?[ \t]*|[-/.]')
+# A multi-word term is defined where it is followed or preceded by the
+# phrasing DEFINITION_PATTERNS looks for around single words.
+TERM_DEFINED_AFTER = re.compile(r'[,\s]+(?:(?:which|that)\s+(?:is|are)|is|are|refers? to|means?)',
+                                re.IGNORECASE)
+TERM_DEFINED_BEFORE = re.compile(r'(?:called|known as|termed)\s+$', re.IGNORECASE)
+JARGON_INDEX_ENV = 'C2C_JARGON_INDEX'
+
+
+def jargon_key(term: str) -> str:
+    """Lookup key of a term: its lowercase words joined by single spaces.
+
+    Empty when the term has a word with digits ("k8s"), which the word
+    tokenizer never produces.
+    """
+    parts = re.findall(r'[a-z0-9]+', term.lower())
+    if not parts or not all(p.isalpha() for p in parts):
+        return ''
+    return ' '.join(parts)
+
+
+def _encode_term(term: JargonTerm) -> bytes:
+    return '\t'.join((term.term, term.category, str(term.complexity),
+                      '1' if term.requires_definition else '0',
+                      ','.join(term.common_in))).encode('utf-8')
+
+
+def _decode_term(value: bytes) -> JargonTerm:
+    name, category, complexity, required, domains = value.decode('utf-8').split('\t')
+    return JargonTerm(name, category, int(complexity), required == '1',
+                      domains.split(',') if domains else [])
+
+
+def load_glossary_file(path: Path) -> Dict[str, JargonTerm]:
+    """Read jargon terms from a tab-separated (or .csv) glossary.
+
+    Columns: term, category, complexity (1-3), requires definition
+    (yes/no), domains (comma-separated). Only the term is required;
+    blank lines and `#` comments are skipped. Terms containing digits are
+    left out since they can never match.
+    """
+    path = Path(path)
+    terms: Dict[str, JargonTerm] = {}
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.suffix.lower() == '.csv':
+            import csv
+            rows = csv.reader(f)
+        else:
+            rows = (line.rstrip('\r\n').split('\t') for line in f)
+        for line_number, row in enumerate(rows, 1):
+            if not row or not row[0].strip() or row[0].lstrip().startswith('#'):
+                continue
+            name, category, complexity, required, domains = (
+                [cell.strip() for cell in row] + [''] * 5)[:5]
+            if complexity and complexity not in ('1', '2', '3'):
+                raise ValueError(f"{path}:{line_number}: complexity must be 1, 2 or 3")
+            key = jargon_key(name)
+            if key:
+                terms[key] = JargonTerm(
+                    name, category or 'general', int(complexity or 2),
+                    required.lower() not in ('no', 'n', 'false', '0'),
+                    [d.strip() for d in domains.split(',') if d.strip()])
+    return terms
+
+
+def build_jargon_index(sources: List[Path], dest: Path) -> int:
+    """Merge glossary files into a sorted jargon index; later files win.
+
+    Returns the number of entries written.
+    """
+    terms: Dict[str, JargonTerm] = {}
+    for source in sources:
+        terms.update(load_glossary_file(source))
+    SortedIndex.write(dest, {key: _encode_term(term) for key, term in terms.items()})
+    return len(terms)
+
+
+class JargonGlossary:
+    """Jargon lookup over JARGON_DATABASE and an optional glossary index.
+
+    The index (see `build_jargon_index`) is a memory-mapped SortedIndex, so
+    a glossary of any size opens instantly and each lookup is a binary
+    search; its entries take precedence over the built-in ones. Results
+    are memoized per word form, so a document costs one lookup per
+    distinct word. Multi-word terms are found by extending a match only
+    while the words so far are the prefix of some longer term.
+    """
+
+    MAX_CACHED = 200_000
+
+    def __init__(self, index_path: Optional[Path] = None,
+                 terms: Optional[Dict[str, JargonTerm]] = None):
+        self.index = SortedIndex(index_path) if index_path else None
+        self.terms: Dict[str, JargonTerm] = {}
+        for word, term in (JARGON_DATABASE if terms is None else terms).items():
+            key = jargon_key(word)
+            if key:
+                self.terms[key] = term
+        self._prefixes = {key[:i] for key in self.terms for i, c in enumerate(key) if c == ' '}
+        self._cache: Dict[str, Tuple[Optional[JargonTerm], bool]] = {}
+        self.regex_evaluations = 0     # word-gap and definition checks, for profiling
+
+    def _lookup(self, key: str) -> Tuple[Optional[JargonTerm], bool]:
+        """(term for `key`, whether a longer term starts with `key`)."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        term = None
+        longer = key in self._prefixes
+        if self.index is not None and len(self.index):
+            value = self.index.get(key)
+            if value is not None:
+                term = _decode_term(value)
+            if not longer:
+                prefix = f"{key} ".encode('utf-8')
+                i = self.index.bisect(prefix)
+                longer = i < len(self.index) and self.index.key_at(i).startswith(prefix)
+        if term is None:
+            term = self.terms.get(key)
+
+        if len(self._cache) >= self.MAX_CACHED:
+            self._cache.clear()
+        self._cache[key] = result = (term, longer)
+        return result
+
+    def get(self, key: str) -> Optional[JargonTerm]:
+        return self._lookup(key)[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key)[0] is not None
+
+    def fingerprint(self) -> List[Any]:
+        """Everything lookups depend on, for cache keys."""
+        return [[[key, asdict(term)] for key, term in self.terms.items()],
+                self.index.fingerprint() if self.index else None]
+
+    def scan(self, doc: "Document") -> Iterator[Tuple[int, str, JargonTerm]]:
+        """Yield (word index, key, term) for each term, longest match first."""
+        i = 0
+        while i < len(doc.lower_words):
+            found = self.match_at(doc, i)
+            if found is None:
+                i += 1
+                continue
+            yield i, found[0], found[1]
+            i = found[2]
+
+    def match_at(self, doc: "Document", i: int) -> Optional[Tuple[str, JargonTerm, int]]:
+        """(key, term, end word index) of the longest term starting at word `i`."""
+        words = doc.lower_words
+        key = words[i]
+        term, longer = self._lookup(key)
+        found = (key, term, i + 1) if term is not None else None
+        if not longer:
+            return found
+        starts = doc.word_starts
+        text = doc.text
+        j = i
+        while longer and j + 1 < len(words):
+            self.regex_evaluations += 1
+            if not TERM_GAP_PATTERN.fullmatch(text, starts[j] + len(words[j]), starts[j + 1]):
+                break
+            j += 1
+            key = f"{key} {words[j]}"
+            term, longer = self._lookup(key)
+            if term is not None:
+                found = (key, term, j + 1)
+        return found
+
+    def defined_at(self, doc: "Document", start: int, end: int) -> bool:
+        """Whether the multi-word term at text[start:end] is being defined."""
+        self.regex_evaluations += 1
+        if TERM_DEFINED_AFTER.match(doc.text, end):
+            return True
+        self.regex_evaluations += 1
+        return TERM_DEFINED_BEFORE.search(doc.text, max(0, start - 16), start) is not None
+
+
+_default_jargon_glossary: Optional[JargonGlossary] = None
+
+
+def default_jargon_glossary() -> JargonGlossary:
+    """Built-in terms plus the glossary index named by $C2C_JARGON_INDEX."""
+    global _default_jargon_glossary
+    if _default_jargon_glossary is None:
+        index = os.environ.get(JARGON_INDEX_ENV)
+        _default_jargon_glossary = JargonGlossary(Path(index) if index else None)
+    return _default_jargon_glossary
+
 
 # =============================================================================
 # Passive Voice Detection (Improved)
@@ -322,6 +746,10 @@ PASSIVE_PATTERNS = [
     r'\b(got|gets|getting)\s+(\w+ed)\b',
 ]
 
+# All patterns as one scanner. Each alternative ends with the participle
+# group, so `match.lastindex` points at it whichever pattern matched.
+PASSIVE_SCANNER = re.compile('|'.join(f'(?:{p})' for p in PASSIVE_PATTERNS), re.IGNORECASE)
+
 # Words that look passive but aren't
 PASSIVE_EXCEPTIONS = {
     'used', 'based', 'called', 'named', 'required', 'needed',
@@ -390,6 +818,1327 @@ FILLER_PHRASES = {
 }
 
 
+HEDGE = 'hedge'
+FILLER = 'filler'
+HOUSE_PHRASES_ENV = 'C2C_HOUSE_PHRASES'
+
+
+class PhraseMatcher:
+    """Token-level trie matching hedge words and filler phrases in one pass.
+
+    Each word position walks the trie only as far as the following tokens
+    keep matching, so the cost per token does not grow with the number of
+    phrases. Words of a multi-word phrase must be separated by whitespace
+    only, so a match never straddles punctuation or a sentence end.
+    """
+
+    def __init__(self, hedges: Dict[str, str], fillers: Dict[str, str]):
+        self.hedges = dict(hedges)     # phrase -> category
+        self.fillers = dict(fillers)   # phrase -> replacement
+        self.hedge_rank = {phrase: i for i, phrase in enumerate(self.hedges)}
+        self.filler_rank = {phrase: i for i, phrase in enumerate(self.fillers)}
+        self.root: Dict[Optional[str], Any] = {}
+        for phrase in self.hedges:
+            self._insert(phrase, HEDGE)
+        for phrase in self.fillers:
+            self._insert(phrase, FILLER)
+
+    def _insert(self, phrase: str, kind: str):
+        node = self.root
+        for token in phrase.lower().split():
+            node = node.setdefault(token, {})
+        # The None key holds the phrases ending at this node
+        node.setdefault(None, []).append((kind, phrase))
+
+    def scan(self, doc: "Document") -> Iterator[Tuple[int, str, str]]:
+        """Yield (word index, kind, phrase) for every match, in word order."""
+        for i in range(len(doc.lower_words)):
+            for kind, phrase in self.match_at(doc, i):
+                yield i, kind, phrase
+
+    def match_at(self, doc: "Document", i: int) -> List[Tuple[str, str]]:
+        """(kind, phrase) of every phrase starting at word `i`, shortest first."""
+        words = doc.lower_words
+        node = self.root.get(words[i])
+        if node is None:
+            return []
+        starts = doc.word_starts
+        text = doc.text
+        matches = []
+        j = i
+        while node is not None:
+            matches.extend(node.get(None, ()))
+            j += 1
+            if j == len(words):
+                break
+            node = node.get(words[j])
+            if node is not None and not text[starts[j - 1] + len(words[j - 1]):starts[j]].isspace():
+                break
+        return matches
+
+
+def load_phrase_file(path: Path) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Read house-style phrases from a tab-separated file.
+
+    Each line is `hedge<TAB>phrase<TAB>category` or
+    `filler<TAB>phrase<TAB>replacement`; blank lines and `#` comments are
+    skipped. Returns (hedges, fillers).
+    """
+    hedges: Dict[str, str] = {}
+    fillers: Dict[str, str] = {}
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            kind, _, rest = line.partition('\t')
+            phrase, _, note = rest.partition('\t')
+            phrase = ' '.join(phrase.lower().split())
+            kind = kind.strip().lower()
+            if kind not in (HEDGE, FILLER) or not phrase:
+                raise ValueError(f"{path}:{line_number}: expected 'hedge|filler<TAB>phrase<TAB>note'")
+            if kind == HEDGE:
+                hedges[phrase] = note.strip() or 'house style'
+            else:
+                fillers[phrase] = note.strip() or '[cut]'
+    return hedges, fillers
+
+
+_default_phrase_matcher: Optional[PhraseMatcher] = None
+
+
+def default_phrase_matcher() -> PhraseMatcher:
+    """Built-in phrases plus any house-style file named by $C2C_HOUSE_PHRASES."""
+    global _default_phrase_matcher
+    if _default_phrase_matcher is None:
+        hedges, fillers = dict(HEDGE_WORDS), dict(FILLER_PHRASES)
+        house = os.environ.get(HOUSE_PHRASES_ENV)
+        if house:
+            extra_hedges, extra_fillers = load_phrase_file(Path(house))
+            hedges.update(extra_hedges)
+            fillers.update(extra_fillers)
+        _default_phrase_matcher = PhraseMatcher(hedges, fillers)
+    return _default_phrase_matcher
+
+
+# =============================================================================
+# Document Model (tokenize once, shared by every metric)
+# =============================================================================
+
+CODE_PLACEHOLDER_PATTERN = re.compile(r'\[CODE_BLOCK\]|\[INLINE_CODE\]')
+WORD_PATTERN = re.compile(r'(?<![A-Za-z0-9])[A-Za-z]+(?![A-Za-z0-9])')
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+# Whitespace-delimited tokens made only of markdown punctuation ("*", "##")
+MARKUP_TOKEN_PATTERN = re.compile(r'(?<!\S)[#*_\[\]()]+(?!\S)')
+# Markdown punctuation left out of previews
+MARKUP_CHARS_PATTERN = re.compile(r'[#*_\[\]()]')
+WORD_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+@dataclass
+class Span:
+    """A sentence or paragraph: character and word ranges in a Document."""
+    start: int       # character offsets into Document.text
+    end: int
+    first_word: int  # word index range into Document.words
+    end_word: int
+    length: int      # whitespace-delimited tokens
+    heading: bool = False
+
+
+@dataclass
+class Document:
+    """Prose tokenized once: words with offsets, sentence and paragraph spans.
+
+    `text` is the prose with code placeholders removed. Markup-only tokens
+    ("*", "##") do not count toward sentence length.
+    """
+    text: str
+    words: List[str]
+    lower_words: List[str]
+    word_starts: List[int]
+    sentences: List[Span]
+    paragraphs: List[Span]
+    word_counts: Counter
+    _sentence_starts: Optional[List[int]] = field(default=None, repr=False)
+
+    @classmethod
+    def parse(cls, prose: str) -> "Document":
+        text = CODE_PLACEHOLDER_PATTERN.sub('', prose)
+
+        words = []
+        word_starts = []
+        for match in WORD_PATTERN.finditer(text):
+            words.append(match.group())
+            word_starts.append(match.start())
+        lower_words = [w.lower() for w in words]
+
+        paragraphs = []
+        para_start = 0
+        for para_end, next_start in cls._breaks(PARAGRAPH_BREAK_PATTERN, text, 0, len(text)):
+            start, end = cls._strip(text, para_start, para_end)
+            if start < end:
+                paragraphs.append(Span(
+                    start, end,
+                    bisect_left(word_starts, start), bisect_left(word_starts, end),
+                    len(text[start:end].split()),
+                    heading=text.startswith('#', start),
+                ))
+            para_start = next_start
+
+        sentences = cls._sentences(text, 0, len(text), word_starts)
+
+        return cls(text, words, lower_words, word_starts, sentences, paragraphs,
+                   Counter(lower_words))
+
+    @staticmethod
+    def _breaks(pattern, text: str, start: int, end: int):
+        """Yield (segment_end, next_segment_start) for each separator, then the tail."""
+        for match in pattern.finditer(text, start, end):
+            yield match.start(), match.end()
+        yield end, end
+
+    @staticmethod
+    def _strip(text: str, start: int, end: int) -> Tuple[int, int]:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    @classmethod
+    def _sentences(cls, text: str, start: int, end: int, word_starts: List[int]) -> List[Span]:
+        spans = []
+        seg_start = start
+        for seg_end, next_start in cls._breaks(SENTENCE_END_PATTERN, text, start, end):
+            a, b = cls._strip(text, seg_start, seg_end)
+            segment = text[a:b]
+            length = len(segment.split()) - len(MARKUP_TOKEN_PATTERN.findall(segment))
+            if length > 0:
+                spans.append(Span(a, b, bisect_left(word_starts, a),
+                                  bisect_left(word_starts, b), length))
+            seg_start = next_start
+        return spans
+
+    def span_text(self, span: Span) -> str:
+        return self.text[span.start:span.end]
+
+    def preview(self, span: Span, limit: int) -> str:
+        """Span text without markdown punctuation, cut after `limit` characters."""
+        text = MARKUP_CHARS_PATTERN.sub('', self.span_text(span)).strip()
+        return text[:limit] + "..." if len(text) > limit else text
+
+    def sentence_index(self, offset: int) -> Optional[int]:
+        """Index of the sentence containing a character offset, if any."""
+        if self._sentence_starts is None:
+            self._sentence_starts = [s.start for s in self.sentences]
+        idx = bisect_right(self._sentence_starts, offset) - 1
+        if idx >= 0 and offset < self.sentences[idx].end:
+            return idx
+        return None
+
+
+# =============================================================================
+# Source Positions (prose offsets back to lines and columns)
+# =============================================================================
+
+NEWLINE_PATTERN = re.compile(r'\n')
+
+
+class SourceMap:
+    """Map offsets in analyzed prose back to lines and columns of the source.
+
+    Analyzed prose is the source with code removed. For every run of prose
+    copied verbatim, the map keeps where it starts in both texts; it also
+    keeps the offset of every source line. Both are sorted, so locating a
+    finding is two binary searches.
+
+        source = SourceMap(content)
+        text = substitute(CODE_PLACEHOLDER_PATTERN, '', content, source)
+        line, column = source.locate(offset_in_text)
+    """
+
+    def __init__(self, content: str = ''):
+        self._text_starts = array('Q', [0])
+        self._source_starts = array('Q', [0])
+        self._line_starts = array('Q', [0])
+        self._line_starts.extend(m.end() for m in NEWLINE_PATTERN.finditer(content))
+        self._lines_before = 0         # lines dropped by `trim`
+        self.text_length = len(content)
+        self.source_length = len(content)
+
+    def rewrite(self, text_starts: array, prev_starts: array, length: int):
+        """Compose with an edit of the mapped text.
+
+        Run `i` of the edited text starts at `text_starts[i]` and was copied
+        from `prev_starts[i]` of the text before the edit (see `substitute`).
+        """
+        old_text, old_source = self._text_starts, self._source_starts
+        new_text, new_source = array('Q'), array('Q')
+        for i, (start, prev) in enumerate(zip(text_starts, prev_starts)):
+            end = text_starts[i + 1] if i + 1 < len(text_starts) else length
+            prev_end = prev + end - start
+            k = bisect_right(old_text, prev) - 1
+            new_text.append(start)
+            new_source.append(old_source[k] + prev - old_text[k])
+            # Earlier edits falling inside this run split it further
+            k += 1
+            while k < len(old_text) and old_text[k] < prev_end:
+                new_text.append(start + old_text[k] - prev)
+                new_source.append(old_source[k])
+                k += 1
+        self._text_starts, self._source_starts = new_text, new_source
+        self.text_length = length
+
+    def extend(self, other: "SourceMap"):
+        """Append the map of source (and prose) that follows this one."""
+        for start, source in zip(other._text_starts, other._source_starts):
+            self._text_starts.append(self.text_length + start)
+            self._source_starts.append(self.source_length + source)
+        starts = iter(other._line_starts)
+        if self._line_starts[-1] == self.source_length:
+            next(starts)
+        self._line_starts.extend(self.source_length + start for start in starts)
+        self.text_length += other.text_length
+        self.source_length += other.source_length
+
+    def trim(self, offset: int):
+        """Forget the prose before `offset` and the lines before it.
+
+        Later offsets still locate; a stream trims to the prose it has not
+        analyzed yet, so the map stays the size of that window.
+        """
+        run = bisect_right(self._text_starts, offset) - 1
+        position = self._source_starts[run] + offset - self._text_starts[run]
+        line = bisect_right(self._line_starts, position) - 1
+        del self._text_starts[:run]
+        del self._source_starts[:run]
+        del self._line_starts[:line]
+        self._lines_before += line
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) in the source of a prose offset."""
+        run = bisect_right(self._text_starts, offset) - 1
+        position = self._source_starts[run] + offset - self._text_starts[run]
+        line = bisect_right(self._line_starts, position) - 1
+        return self._lines_before + line + 1, position - self._line_starts[line] + 1
+
+    def location(self, offset: int) -> Dict[str, int]:
+        line, column = self.locate(offset)
+        return {"line": line, "column": column}
+
+
+def replace_spans(text: str, spans: Iterable[Tuple[int, int, str]],
+                  source: Optional[SourceMap] = None) -> str:
+    """Replace ordered, non-overlapping (start, end, replacement) spans of
+    `text`, recording the edit in `source` if given."""
+    parts = []
+    text_starts = array('Q', [0])
+    prev_starts = array('Q', [0])
+    pos = out = 0
+    for start, end, repl in spans:
+        parts.append(text[pos:start])
+        parts.append(repl)
+        if source is not None:
+            out += start - pos
+            text_starts.append(out)
+            prev_starts.append(start)
+            out += len(repl)
+            text_starts.append(out)
+            prev_starts.append(end)
+        pos = end
+    parts.append(text[pos:])
+
+    result = ''.join(parts)
+    if source is not None:
+        source.rewrite(text_starts, prev_starts, len(result))
+    return result
+
+
+def substitute(pattern, repl: str, text: str, source: Optional[SourceMap] = None) -> str:
+    """`pattern.sub(repl, text)`, recording the edit in `source` if given."""
+    if source is None:
+        return pattern.sub(repl, text)
+    return replace_spans(text, ((m.start(), m.end(), repl) for m in pattern.finditer(text)), source)
+
+
+def _location(source: Optional[SourceMap], offset: int) -> Dict[str, int]:
+    return source.location(offset) if source is not None else {}
+
+
+# =============================================================================
+# Markdown Blocks (one line scan shared by prose and structure analysis)
+# =============================================================================
+
+FRONT_MATTER = 'front_matter'
+HEADING = 'heading'
+PARAGRAPH = 'paragraph'
+BULLET_ITEM = 'bullet_item'
+NUMBERED_ITEM = 'numbered_item'
+CODE = 'code'
+PROSE_BLOCKS = (HEADING, PARAGRAPH, BULLET_ITEM, NUMBERED_ITEM)
+
+# Opening line -> lines that close the front matter (YAML, TOML)
+FRONT_MATTER_FENCES = {'---': ('---', '...'), '+++': ('+++',)}
+# One match per line; the last group that matched says what the line is
+LINE_PATTERN = re.compile(
+    r'^(?P<indent>[ \t]*)(?:'
+    r'(?P<blank>)$'
+    r'|(?P<fence>`{3,}(?=[^`\n]*$)|~{3,})(?P<info>.*)'
+    r'|(?P<heading>#{1,6})(?![^ \t\n]).*'
+    r'|(?P<rule>(?P<rule_char>[-*_])(?:[ \t]*(?P=rule_char)){2,}[ \t]*)$'
+    r'|(?P<item>[-*+]|\d{1,9}[.)])(?![^ \t\n]).*'
+    r'|(?P<text>.*))',
+    re.MULTILINE)
+LANGUAGE_PATTERN = re.compile(r'\w+')
+# Code spans (matching backtick runs), images and links within a prose block
+INLINE_PATTERN = re.compile(
+    r'(?P<code>(?<!`)(`+)(?!`)[\s\S]*?(?<!`)\2(?!`))'
+    r'|(?P<image>!\[[^\]]*\]\([^)]+\))'
+    r'|(?P<link>\[[^\]]+\]\([^)]+\))'
+)
+
+
+@dataclass
+class Block:
+    """A markdown block and the character range of its lines."""
+    kind: str
+    start: int
+    end: int          # end of the last line, before its newline
+    lines: int = 1    # lines of code for CODE blocks
+    level: int = 0    # heading level
+    info: str = ''    # code fence info string
+    code_spans: List[Tuple[int, int]] = field(default_factory=list)
+    links: int = 0
+    images: int = 0
+
+    def shift(self, delta: int) -> "Block":
+        return replace(self, start=self.start + delta, end=self.end + delta,
+                       code_spans=[(a + delta, b + delta) for a, b in self.code_spans])
+
+
+def _indent(line: str) -> int:
+    """Leading whitespace width, with tabs to the next multiple of four."""
+    width = 0
+    for ch in line:
+        if ch == ' ':
+            width += 1
+        elif ch == '\t':
+            width += 4 - width % 4
+        else:
+            break
+    return width
+
+
+_fence_closers: Dict[Tuple[str, int], Any] = {}
+
+
+def _fence_closer(char: str, length: int):
+    """Pattern for the line closing a fence of `length` `char`s."""
+    key = (char, length)
+    if key not in _fence_closers:
+        _fence_closers[key] = re.compile(
+            rf'^[ \t]*{re.escape(char)}{{{length},}}[ \t]*$', re.MULTILINE)
+    return _fence_closers[key]
+
+
+class MarkdownParser:
+    """Line-by-line markdown block parser that can be fed in pieces.
+
+    Recognizes front matter, ATX headings, bullet and numbered list items,
+    fenced (backtick or tilde) and indented code, and paragraphs, and finds
+    the code spans, links and images inside prose blocks. The rules are the
+    subset of CommonMark that decides what is prose, code and structure.
+
+    `feed` takes text ending at a line boundary and returns the text whose
+    blocks are complete, with those blocks. A block still open at the end
+    of the input, such as a paragraph or an unclosed fence, is held back
+    until it closes or `finish` is called.
+
+        blocks = MarkdownParser.parse(content)
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._pos = 0                  # start of the first unscanned line
+        self._done: List[Block] = []
+        self._block: Optional[Block] = None
+        self._fence = None             # closing line pattern of an open fence
+        self._front_matter: Optional[str] = None        # its opening line
+        self._first_line = True
+        self._blank_lines = 0          # trailing blank lines of indented code
+        self._in_list = False
+        self.regex_evaluations = 0     # pattern scans run so far, for profiling
+
+    @classmethod
+    def parse(cls, content: str, parser: Optional["MarkdownParser"] = None) -> List[Block]:
+        """All blocks of a complete document.
+
+        Pass a fresh parser to read its counters afterwards.
+        """
+        parser = parser or cls()
+        head, blocks = parser.feed(content)
+        _, rest = parser.finish()
+        return blocks + [block.shift(len(head)) for block in rest]
+
+    def feed(self, text: str) -> Tuple[str, List[Block]]:
+        """Scan more input; return the text and blocks that are complete."""
+        self._buffer += text
+        self._scan(final=False)
+        return self._emit(self._block.start if self._block is not None else self._pos)
+
+    def finish(self) -> Tuple[str, List[Block]]:
+        """Close every open block and return the rest of the input."""
+        self._scan(final=True)
+        if self._front_matter is not None:
+            # Never closed, so it was not front matter: rescan as markdown
+            self._block = self._front_matter = None
+            self._pos = 0
+            self._scan(final=True)
+        self._close()
+        self._fence = None
+        return self._emit(len(self._buffer))
+
+    def _emit(self, cut: int) -> Tuple[str, List[Block]]:
+        text, self._buffer = self._buffer[:cut], self._buffer[cut:]
+        blocks, self._done = self._done, []
+        self._pos -= cut
+        if self._block is not None:
+            self._block.start -= cut
+            self._block.end -= cut
+        return text, blocks
+
+    def _scan(self, final: bool):
+        buffer = self._buffer
+        size = len(buffer)
+        pos = self._pos
+        match_line = LINE_PATTERN.match
+        lines = 0
+        while pos < size:
+            if self._fence is not None:
+                pos = self._scan_fence(pos, final)
+                if self._fence is not None:
+                    break
+                continue
+            match = match_line(buffer, pos)
+            lines += 1
+            end = match.end()
+            if end == size and not final:
+                break
+            self._line(match, pos, end)
+            pos = end + 1
+        self._pos = min(pos, size)
+        self.regex_evaluations += lines
+
+    def _scan_fence(self, pos: int, final: bool) -> int:
+        """Skip to the line closing the open fence; return where to go on."""
+        buffer = self._buffer
+        size = len(buffer)
+        block = self._block
+        close = self._fence.search(buffer, pos)
+        self.regex_evaluations += 1
+        if close is not None and (close.end() < size or final):
+            block.lines += buffer.count('\n', pos, close.start())
+            block.end = close.end()
+            self._fence = None
+            self._close()
+            return close.end() + 1
+
+        # Not closed yet: take the complete lines and wait for more
+        last = size if final else buffer.rfind('\n', pos) + 1
+        if last > pos:
+            block.lines += buffer.count('\n', pos, last) + (buffer[last - 1] != '\n')
+            block.end = last - (buffer[last - 1] == '\n')
+        return max(last, pos)
+
+    def _line(self, match, start: int, end: int):
+        block = self._block
+
+        if self._front_matter is not None:
+            block.end = end
+            if self._buffer[start:end].rstrip() in FRONT_MATTER_FENCES[self._front_matter]:
+                self._front_matter = None
+                self._close()
+            return
+
+        if self._first_line:
+            self._first_line = False
+            line = self._buffer[start:end].rstrip()
+            if line in FRONT_MATTER_FENCES:
+                self._front_matter = line
+                self._block = Block(FRONT_MATTER, start, end)
+                return
+
+        kind = match.lastgroup
+        if kind == 'blank':
+            if block is not None and block.kind == CODE:
+                self._blank_lines += 1
+            else:
+                self._close()
+            return
+
+        indent = match.group('indent')
+        indent = _indent(indent) if indent else 0
+        if block is not None and block.kind == CODE:
+            if indent >= 4:
+                block.end = end
+                block.lines += self._blank_lines + 1
+                self._blank_lines = 0
+                return
+            self._close()
+            block = None
+        elif indent >= 4 and not self._in_list:
+            if block is None:
+                self._block = Block(CODE, start, end)
+                self._blank_lines = 0
+            else:
+                # Indented code cannot interrupt a paragraph
+                block.end = end
+                block.lines += 1
+            return
+
+        if kind == 'info' and (indent <= 3 or self._in_list):
+            self._close()
+            marker = match.group('fence')
+            self._fence = _fence_closer(marker[0], len(marker))
+            self._block = Block(CODE, match.start('fence'), end, lines=0,
+                                info=match.group('info').strip())
+            return
+
+        if kind == 'heading' and indent <= 3:
+            self._close()
+            self._block = Block(HEADING, start, end, level=len(match.group('heading')))
+            self._close()
+            self._in_list = False
+            return
+
+        if kind == 'rule' and indent <= 3:
+            self._close()
+            return
+
+        if kind == 'item':
+            self._close()
+            marker = match.group('item')
+            self._block = Block(BULLET_ITEM if marker in '-*+' else NUMBERED_ITEM, start, end)
+            self._in_list = True
+            return
+
+        if block is not None:
+            block.end = end
+            block.lines += 1
+            return
+
+        if indent < 2:
+            self._in_list = False
+        self._block = Block(PARAGRAPH, start, end)
+
+    def _close(self):
+        block = self._block
+        if block is None:
+            return
+        self._block = None
+        buffer = self._buffer
+        # Inline elements need a backtick or "](", which most blocks lack
+        if block.kind in PROSE_BLOCKS and (buffer.find('`', block.start, block.end) >= 0
+                                           or buffer.find('](', block.start, block.end) >= 0):
+            self.regex_evaluations += 1
+            for match in INLINE_PATTERN.finditer(buffer, block.start, block.end):
+                kind = match.lastgroup
+                if kind == 'code':
+                    block.code_spans.append(match.span())
+                elif kind == 'image':
+                    block.images += 1
+                else:
+                    block.links += 1
+        self._done.append(block)
+
+
+# =============================================================================
+# Prose Statistics (additive per-block contributions)
+# =============================================================================
+
+SENTENCE_TERMINATORS = '.!?'
+# Example lists keep enough entries to serve every audience profile
+SENTENCE_LIMITS = sorted({p.max_sentence_length for p in AUDIENCE_PROFILES.values()})
+PARAGRAPH_LIMITS = sorted({p.max_paragraph_length for p in AUDIENCE_PROFILES.values()})
+MAX_LONG_SENTENCES = 5
+MAX_LONG_PARAGRAPHS = 3
+MAX_PASSIVE_EXAMPLES = 5
+MAX_FILLER_EXAMPLES = 10
+MAX_RULE_FINDINGS = 10
+
+
+def split_blocks(text: str) -> List[Tuple[int, int]]:
+    """Split prose into independently analyzable blocks of paragraphs.
+
+    A block ends at a paragraph break whose preceding paragraph ends with a
+    sentence terminator. No sentence, phrase, passive construction or
+    definition site can straddle such a break, so per-block statistics add
+    up exactly to whole-document ones.
+    """
+    blocks = []
+    block_start = 0
+    for match in PARAGRAPH_BREAK_PATTERN.finditer(text):
+        end = match.start()
+        while end > block_start and text[end - 1].isspace():
+            end -= 1
+        if end > block_start and text[end - 1] in SENTENCE_TERMINATORS:
+            blocks.append((block_start, match.start()))
+            block_start = match.end()
+    blocks.append((block_start, len(text)))
+    return blocks
+
+
+def _keep_first_over(items: List[Tuple[int, Any]], limits: List[int], n: int) -> List[Tuple[int, Any]]:
+    """Keep, in order, the items needed to show the first `n` over each limit."""
+    kept = []
+    shown = dict.fromkeys(limits, 0)
+    for item in items:
+        needed = False
+        for limit in limits:
+            if item[0] > limit and shown[limit] < n:
+                shown[limit] += 1
+                needed = True
+        if needed:
+            kept.append(item)
+    return kept
+
+
+@dataclass
+class ProseStats:
+    """Metric contributions of a span of prose, independent of audience.
+
+    Counters and totals are additive (`add`), so a document's statistics can
+    be kept up to date by adding and subtracting blocks. Ordered fields hold
+    character offsets and bounded example lists; `extend` appends a later
+    block's entries at a given offset. Offsets are into the analyzed prose;
+    a SourceMap turns them into lines and columns.
+    """
+    # Additive
+    words: int = 0
+    long_words: int = 0          # words of two or more letters
+    syllables: int = 0           # syllables in long_words
+    sentence_lengths: Counter = field(default_factory=Counter)
+    paragraph_lengths: Counter = field(default_factory=Counter)  # non-heading
+    passive_sentences: int = 0
+    passive_instances: int = 0   # distinct passive contexts within each block
+    passive_keys: Counter = field(default_factory=Counter)        # dedup keys across blocks
+    jargon_counts: Counter = field(default_factory=Counter)       # term -> uses
+    hedge_counts: Counter = field(default_factory=Counter)
+    rule_counts: Counter = field(default_factory=Counter)         # house rule -> hits
+    filler_count: int = 0
+    filler_saveable: int = 0
+    # Ordered
+    long_sentences: List[Tuple[int, str, int]] = field(default_factory=list)   # (length, preview, offset)
+    long_paragraphs: List[Tuple[int, str, int]] = field(default_factory=list)
+    passive_examples: List[Dict[str, Any]] = field(default_factory=list)       # match, context, offset
+    jargon_first_use: Dict[str, int] = field(default_factory=dict)
+    hedge_first_use: Dict[str, int] = field(default_factory=dict)
+    definitions: Dict[str, int] = field(default_factory=dict)
+    fillers: List[Tuple[int, int, str]] = field(default_factory=list)  # (rank, offset, phrase)
+    rule_findings: List[Tuple[str, int, str]] = field(default_factory=list)  # (rule, offset, message)
+
+    def add(self, other: "ProseStats", times: int = 1):
+        """Add another span's additive totals `times` times (negative removes)."""
+        self.words += times * other.words
+        self.long_words += times * other.long_words
+        self.syllables += times * other.syllables
+        self.passive_sentences += times * other.passive_sentences
+        self.passive_instances += times * other.passive_instances
+        self.filler_count += times * other.filler_count
+        self.filler_saveable += times * other.filler_saveable
+        for mine, theirs in ((self.sentence_lengths, other.sentence_lengths),
+                             (self.paragraph_lengths, other.paragraph_lengths),
+                             (self.passive_keys, other.passive_keys),
+                             (self.jargon_counts, other.jargon_counts),
+                             (self.hedge_counts, other.hedge_counts),
+                             (self.rule_counts, other.rule_counts)):
+            for key, count in theirs.items():
+                total = mine[key] + times * count
+                if total:
+                    mine[key] = total
+                else:
+                    del mine[key]
+
+    def extend(self, other: "ProseStats", offset: int):
+        """Append the ordered entries of a span that follows this one."""
+        self.long_sentences = _keep_first_over(
+            self.long_sentences + [(n, s, offset + at) for n, s, at in other.long_sentences],
+            SENTENCE_LIMITS, MAX_LONG_SENTENCES)
+        self.long_paragraphs = _keep_first_over(
+            self.long_paragraphs + [(n, p, offset + at) for n, p, at in other.long_paragraphs],
+            PARAGRAPH_LIMITS, MAX_LONG_PARAGRAPHS)
+
+        if len(self.passive_examples) < MAX_PASSIVE_EXAMPLES:
+            seen = {e["context"][:50] for e in self.passive_examples}
+            for example in other.passive_examples:
+                key = example["context"][:50]
+                if key not in seen:
+                    seen.add(key)
+                    self.passive_examples.append(dict(example, offset=offset + example["offset"]))
+            del self.passive_examples[MAX_PASSIVE_EXAMPLES:]
+
+        for word, at in other.jargon_first_use.items():
+            self.jargon_first_use.setdefault(word, offset + at)
+        for word, at in other.definitions.items():
+            self.definitions.setdefault(word, offset + at)
+        for word, at in other.hedge_first_use.items():
+            self.hedge_first_use.setdefault(word, offset + at)
+
+        # Listed phrase by phrase, in PhraseMatcher order
+        fillers = self.fillers + [(rank, offset + at, phrase) for rank, at, phrase in other.fillers]
+        fillers.sort()
+        self.fillers = fillers[:MAX_FILLER_EXAMPLES]
+
+        if other.rule_findings:
+            kept = Counter(rule for rule, _, _ in self.rule_findings)
+            for rule, at, message in other.rule_findings:
+                if kept[rule] < MAX_RULE_FINDINGS:
+                    kept[rule] += 1
+                    self.rule_findings.append((rule, offset + at, message))
+
+    def merge(self, other: "ProseStats", offset: int):
+        self.add(other)
+        self.extend(other, offset)
+
+    def offsets(self) -> Iterator[int]:
+        """Every offset held by the ordered fields."""
+        for entries in (self.long_sentences, self.long_paragraphs):
+            for _, _, at in entries:
+                yield at
+        for example in self.passive_examples:
+            yield example["offset"]
+        for first in (self.jargon_first_use, self.hedge_first_use, self.definitions):
+            yield from first.values()
+        for _, at, _ in self.fillers:
+            yield at
+        for _, at, _ in self.rule_findings:
+            yield at
+
+    @property
+    def sentence_count(self) -> int:
+        return sum(self.sentence_lengths.values())
+
+    @property
+    def distinct_passive(self) -> int:
+        """Distinct passive contexts; falls back to per-block counts when the
+        cross-block keys were dropped to bound memory (streaming)."""
+        return len(self.passive_keys) or self.passive_instances
+
+
+@dataclass
+class MarkupStats:
+    """Code and structure counts of raw markdown.
+
+    Additive over pieces cut at block boundaries (see `MarkdownParser.feed`),
+    so a stream can be counted piece by piece.
+    """
+    characters: int = 0
+    prose_characters: int = 0
+    code_blocks: int = 0
+    code_lines: int = 0
+    prose_lines: int = 0
+    languages: Counter = field(default_factory=Counter)
+    headings: Counter = field(default_factory=Counter)   # "h1".."h4"
+    bullet_items: int = 0
+    numbered_items: int = 0
+    links: int = 0
+    images: int = 0
+    tokens: int = 0
+    rule_counts: Counter = field(default_factory=Counter)  # house rule -> hits
+
+    def add(self, other: "MarkupStats"):
+        for name in ('characters', 'prose_characters', 'code_blocks', 'code_lines',
+                     'prose_lines', 'bullet_items', 'numbered_items', 'links', 'images',
+                     'tokens'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.languages.update(other.languages)
+        self.headings.update(other.headings)
+        self.rule_counts.update(other.rule_counts)
+
+
+# =============================================================================
+# Rule Engine (one traversal dispatched to every rule)
+# =============================================================================
+
+# What a rule consumes; the engine only calls the matching callbacks
+TEXT = 'text'                # each prose block whole: its Document once
+TOKENS = 'tokens'            # each word, lowercased, in order
+SENTENCES = 'sentences'
+PARAGRAPHS = 'paragraphs'
+BLOCKS = 'blocks'            # every markdown block of the document
+CODE_BLOCKS = 'code_blocks'  # fenced and indented code blocks only
+PROSE_UNITS = {TEXT, TOKENS, SENTENCES, PARAGRAPHS}
+RULES_ENV = 'C2C_READABILITY_RULES'
+
+
+class RuleRun:
+    """One rule's view of one prose block.
+
+    Holds the block's Document and the ProseStats rules add to. The engine
+    makes a fresh one per rule and block, so anything a rule keeps from
+    `begin` to `end` goes on it, not on the rule: one Rule instance can
+    then serve any number of analyses at once.
+    """
+
+    def __init__(self, doc: Document, stats: ProseStats):
+        self.doc = doc
+        self.stats = stats
+
+
+class Rule:
+    """A readability check run by a RuleEngine.
+
+    Subclasses name themselves, list what they consume and override the
+    matching callbacks. Prose callbacks see one block at a time (see
+    `split_blocks`) through a RuleRun, and add to its ProseStats; `begin`
+    and `end` bracket each block, and state between them lives on the
+    RuleRun. Markdown callbacks add to the document's MarkupStats.
+
+    A token rule that only reacts to certain words lists them (lowercase)
+    in `triggers`; the engine then calls it for those words alone, with
+    one dictionary lookup per token shared by all such rules.
+
+    Built-in rules fill the metric fields of the stats. House rules record
+    hits with `flag` (prose, with a position) or `tally` (any stats); they
+    appear under `house_rules` in reports. Bump `version` when a rule's
+    behavior changes so cached reports are invalidated.
+
+        class LongWords(Rule):
+            name = 'long-words'
+            consumes = (TOKENS,)
+
+            def token(self, run, i, word):
+                if len(word) > 15:
+                    self.flag(run, run.doc.word_starts[i], f"Long word '{run.doc.words[i]}'")
+    """
+
+    name = ''
+    version = 1
+    consumes: Tuple[str, ...] = ()
+    triggers: Optional[Iterable[str]] = None     # words a token rule needs; None for all
+    builtin = False
+    regex_evaluations = 0        # counted by rules that run patterns, for profiling
+
+    def begin(self, run: RuleRun):
+        pass
+
+    def text(self, run: RuleRun):
+        pass
+
+    def token(self, run: RuleRun, i: int, word: str):
+        pass
+
+    def sentence(self, run: RuleRun, span: Span):
+        pass
+
+    def paragraph(self, run: RuleRun, span: Span):
+        pass
+
+    def end(self, run: RuleRun):
+        pass
+
+    def block(self, block: Block, content: str, markup: MarkupStats):
+        pass
+
+    def code_block(self, block: Block, content: str, markup: MarkupStats):
+        pass
+
+    def flag(self, run: RuleRun, offset: int, message: str):
+        """Record a hit at a block offset."""
+        run.stats.rule_counts[self.name] += 1
+        run.stats.rule_findings.append((self.name, offset, message))
+
+    def tally(self, stats, n: int = 1):
+        """Count hits without a position (ProseStats or MarkupStats)."""
+        stats.rule_counts[self.name] += n
+
+
+class RuleEngine:
+    """Drive one traversal per prose block and dispatch it to every rule.
+
+    Each block's Document is walked once: whole-text callbacks, then every
+    token, sentence and paragraph, each handed to the rules that consume
+    it. Adding a rule adds callbacks to that walk, not another pass.
+    Per-block state lives in RuleRuns made by `collect`, so the engine and
+    its rules can be used by several analyses at once.
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules = list(rules)
+        names = [rule.name for rule in self.rules]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates or not all(names):
+            raise ValueError(f"Rules need unique names: {', '.join(duplicates) or '(unnamed)'}")
+
+        # Callbacks are stored with the index of their rule's RuleRun
+        self.prose_rules = [rule for rule in self.rules if PROSE_UNITS & set(rule.consumes)]
+        prose = list(enumerate(self.prose_rules))
+
+        def consuming(unit: str, callback: str) -> list:
+            return [(k, getattr(rule, callback)) for k, rule in prose if unit in rule.consumes]
+
+        self._text = consuming(TEXT, 'text')
+        self._tokens = [(k, rule.token) for k, rule in prose
+                        if TOKENS in rule.consumes and rule.triggers is None]
+        self._triggered: Dict[str, list] = {}
+        for k, rule in prose:
+            if TOKENS in rule.consumes and rule.triggers is not None:
+                for word in rule.triggers:
+                    self._triggered.setdefault(word, []).append((k, rule.token))
+        self._sentences = consuming(SENTENCES, 'sentence')
+        self._paragraphs = consuming(PARAGRAPHS, 'paragraph')
+        self._blocks = [rule.block for rule in self.rules if BLOCKS in rule.consumes]
+        self._code_blocks = [rule.code_block for rule in self.rules if CODE_BLOCKS in rule.consumes]
+        self._solo: Dict[str, "RuleEngine"] = {}
+
+    def collect(self, doc: Document, stats: ProseStats):
+        """Run every prose rule over one block."""
+        runs = [RuleRun(doc, stats) for _ in self.prose_rules]
+        for rule, run in zip(self.prose_rules, runs):
+            rule.begin(run)
+        for k, callback in self._text:
+            callback(runs[k])
+        callbacks = self._tokens
+        triggered = self._triggered.get
+        if len(callbacks) == 1 and self._triggered:
+            k, callback = callbacks[0]
+            run = runs[k]
+            for i, word in enumerate(doc.lower_words):
+                callback(run, i, word)
+                hits = triggered(word)
+                if hits is not None:
+                    for k, hit in hits:
+                        hit(runs[k], i, word)
+        elif callbacks or self._triggered:
+            for i, word in enumerate(doc.lower_words):
+                for k, callback in callbacks:
+                    callback(runs[k], i, word)
+                hits = triggered(word)
+                if hits is not None:
+                    for k, hit in hits:
+                        hit(runs[k], i, word)
+        if self._sentences:
+            for span in doc.sentences:
+                for k, callback in self._sentences:
+                    callback(runs[k], span)
+        if self._paragraphs:
+            for span in doc.paragraphs:
+                for k, callback in self._paragraphs:
+                    callback(runs[k], span)
+        for rule, run in zip(self.prose_rules, runs):
+            rule.end(run)
+
+    def collect_markup(self, blocks: List[Block], content: str, markup: MarkupStats):
+        """Run every markdown rule over a document's blocks."""
+        for block in blocks:
+            for callback in self._blocks:
+                callback(block, content, markup)
+            if block.kind == CODE:
+                for callback in self._code_blocks:
+                    callback(block, content, markup)
+
+    def only(self, name: str) -> "RuleEngine":
+        """An engine running just the named rule (for timing it alone)."""
+        if name not in self._solo:
+            self._solo[name] = RuleEngine(r for r in self.rules if r.name == name)
+        return self._solo[name]
+
+
+class SyllableRule(Rule):
+    """Words of two or more letters and their syllables, per distinct type."""
+
+    name = 'syllables'
+    consumes = (TEXT,)
+    builtin = True
+
+    def __init__(self, syllables: SyllableCounter):
+        self.syllables = syllables
+
+    def text(self, run: RuleRun):
+        word_types = {w: n for w, n in run.doc.word_counts.items() if len(w) > 1}
+        run.stats.long_words = sum(word_types.values())
+        run.stats.syllables = self.syllables.count_words(word_types)
+
+
+class LengthRule(Rule):
+    """Sentence and paragraph length histograms and long examples."""
+
+    name = 'lengths'
+    consumes = (SENTENCES, PARAGRAPHS)
+    builtin = True
+
+    def begin(self, run: RuleRun):
+        run.long_sentences = []
+        run.long_paragraphs = []
+
+    def sentence(self, run: RuleRun, span: Span):
+        run.stats.sentence_lengths[span.length] += 1
+        if span.length > SENTENCE_LIMITS[0]:
+            run.long_sentences.append((span.length, run.doc.preview(span, 100), span.start))
+
+    def paragraph(self, run: RuleRun, span: Span):
+        if span.heading:
+            return
+        run.stats.paragraph_lengths[span.length] += 1
+        if span.length > PARAGRAPH_LIMITS[0]:
+            run.long_paragraphs.append((span.length, run.doc.preview(span, 80), span.start))
+
+    def end(self, run: RuleRun):
+        stats = run.stats
+        stats.long_sentences = _keep_first_over(run.long_sentences, SENTENCE_LIMITS, MAX_LONG_SENTENCES)
+        stats.long_paragraphs = _keep_first_over(run.long_paragraphs, PARAGRAPH_LIMITS, MAX_LONG_PARAGRAPHS)
+
+
+class PassiveRule(Rule):
+    """Passive constructions, the sentences holding them and examples."""
+
+    name = 'passive'
+    consumes = (TEXT,)
+    builtin = True
+
+    def text(self, run: RuleRun):
+        doc, stats = run.doc, run.stats
+        clean = doc.text
+        passive_sentences = set()
+
+        self.regex_evaluations += 1
+        for match in PASSIVE_SCANNER.finditer(clean):
+            # Check if the past participle is an exception
+            if match.group(match.lastindex).lower() in PASSIVE_EXCEPTIONS:
+                continue
+
+            sentence = doc.sentence_index(match.start())
+            if sentence is not None:
+                passive_sentences.add(sentence)
+
+            # Get context, deduplicated by its first 50 characters
+            start = max(0, match.start() - 30)
+            end = min(len(clean), match.end() + 30)
+            context = clean[start:end].strip()
+
+            key = context[:50]
+            if key not in stats.passive_keys:
+                stats.passive_keys[key] = 1
+                stats.passive_examples.append({
+                    "match": match.group(),
+                    "context": context,
+                    "offset": match.start(),
+                })
+
+        stats.passive_sentences = len(passive_sentences)
+        stats.passive_instances = len(stats.passive_keys)
+
+
+class JargonRule(Rule):
+    """Jargon uses and definition sites."""
+
+    name = 'jargon'
+    consumes = (TOKENS,)
+    builtin = True
+
+    def __init__(self, glossary: JargonGlossary):
+        self.glossary = glossary
+
+    def begin(self, run: RuleRun):
+        run.resume = 0          # first word after the last multi-word match
+        run.phrases = {}
+        run.scans = self.glossary.regex_evaluations
+
+    def token(self, run: RuleRun, i: int, word: str):
+        if i < run.resume:
+            return
+        doc = run.doc
+        found = self.glossary.match_at(doc, i)
+        if found is None:
+            return
+        key, term, run.resume = found
+        stats = run.stats
+        stats.jargon_counts[term.term] += 1
+        stats.jargon_first_use.setdefault(key, doc.word_starts[i])
+        # A multi-word term's definition is one of its own occurrences
+        if run.resume > i + 1 and key not in run.phrases:
+            last = run.resume - 1
+            start = doc.word_starts[i]
+            end = doc.word_starts[last] + len(doc.words[last])
+            if self.glossary.defined_at(doc, start, end):
+                run.phrases[key] = start
+
+    def end(self, run: RuleRun):
+        stats = run.stats
+        if stats.jargon_first_use:
+            stats.definitions = {word: at for word, at in index_definitions(run.doc.text).items()
+                                 if word in self.glossary}
+            stats.definitions.update(run.phrases)
+            self.regex_evaluations += len(DEFINITION_PATTERNS)
+        self.regex_evaluations += self.glossary.regex_evaluations - run.scans
+
+
+class PhraseRule(Rule):
+    """Hedge words and filler phrases, matched on the shared token walk."""
+
+    name = 'phrases'
+    consumes = (TOKENS,)
+    builtin = True
+
+    def __init__(self, phrases: PhraseMatcher):
+        self.phrases = phrases
+        self.triggers = list(phrases.root)   # first words of the phrases
+
+    def token(self, run: RuleRun, i: int, word: str):
+        doc, stats = run.doc, run.stats
+        for kind, phrase in self.phrases.match_at(doc, i):
+            if kind == HEDGE:
+                stats.hedge_counts[phrase] += 1
+                stats.hedge_first_use.setdefault(phrase, doc.word_starts[i])
+            else:
+                stats.fillers.append((self.phrases.filler_rank[phrase], doc.word_starts[i], phrase))
+                stats.filler_count += 1
+                stats.filler_saveable += len(phrase.split()) - 1
+
+
+class StructureRule(Rule):
+    """Code blocks and structural elements of parsed markdown."""
+
+    name = 'structure'
+    consumes = (BLOCKS,)
+    builtin = True
+
+    def block(self, block: Block, content: str, markup: MarkupStats):
+        if block.kind == CODE:
+            markup.code_blocks += 1
+            markup.code_lines += block.lines
+            self.regex_evaluations += 1
+            lang_match = LANGUAGE_PATTERN.match(block.info)
+            if lang_match:
+                markup.languages[lang_match.group()] += 1
+        elif block.kind == HEADING:
+            markup.headings[f"h{block.level}"] += 1
+        elif block.kind != FRONT_MATTER:
+            markup.prose_lines += block.lines
+            if block.kind == BULLET_ITEM:
+                markup.bullet_items += 1
+            elif block.kind == NUMBERED_ITEM:
+                markup.numbered_items += 1
+        markup.links += block.links
+        markup.images += block.images
+
+
+def builtin_rules(syllables: SyllableCounter, phrases: PhraseMatcher,
+                  glossary: JargonGlossary) -> List[Rule]:
+    return [SyllableRule(syllables), LengthRule(), PassiveRule(),
+            JargonRule(glossary), PhraseRule(phrases), StructureRule()]
+
+
+def load_rule_file(path: Path) -> List[Rule]:
+    """Import a Python file and return the rules in its `RULES` list."""
+    import importlib.util
+
+    path = Path(path)
+    name = f"c2c_rules_{hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()[:12]}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ValueError(f"Cannot load rules from {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    rules = list(getattr(module, 'RULES', []))
+    for rule in rules:
+        # Duck-typed: the file may have imported this module under another name
+        if not getattr(rule, 'name', '') or not getattr(rule, 'consumes', ()):
+            raise ValueError(f"{path}: each rule in RULES needs a name and consumes")
+    return rules
+
+
+_source_digests: Dict[str, str] = {}
+
+
+def source_digest(path: str) -> str:
+    """Hash of a source file's contents, read once per process."""
+    if path not in _source_digests:
+        _source_digests[path] = hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+    return _source_digests[path]
+
+
+def rule_fingerprint(rule: Rule) -> List[Any]:
+    """Name, version and defining source of a rule, for cache keys."""
+    module = sys.modules.get(type(rule).__module__)
+    source = getattr(module, '__file__', None)
+    return [rule.name, rule.version, type(rule).__qualname__,
+            source_digest(source) if source else None]
+
+
+_default_house_rules: Optional[Tuple[Rule, ...]] = None
+
+
+def default_house_rules() -> Tuple[Rule, ...]:
+    """Rules from the Python file named by $C2C_READABILITY_RULES, if any."""
+    global _default_house_rules
+    if _default_house_rules is None:
+        path = os.environ.get(RULES_ENV)
+        _default_house_rules = tuple(load_rule_file(Path(path))) if path else ()
+    return _default_house_rules
+
+
+# =============================================================================
+# Rule Profiling (where analysis time goes)
+# =============================================================================
+
+PROFILE_ENV = 'C2C_READABILITY_PROFILE'
+
+
+class RuleProfiler:
+    """Wall time, regex evaluations and tokens per analysis stage.
+
+    Stages are markdown separation, tokenizing, each rule (timed on its
+    own walk of the block, see `RuleEngine.only`) and the
+    `_analyze_*`/`_find_*` report steps. A regex evaluation is one match,
+    search or scan started by the stage; tokens are the words it was
+    given. Profiles are plain dicts in reports and add up with
+    `merge`, so batch runs can total them across worker processes.
+    """
+
+    FIELDS = ('calls', 'seconds', 'regex_evaluations', 'tokens')
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    def _entry(self, stage: str) -> Dict[str, float]:
+        entry = self.stages.get(stage)
+        if entry is None:
+            entry = self.stages[stage] = dict.fromkeys(self.FIELDS, 0)
+        return entry
+
+    def record(self, stage: str, seconds: float, regex_evaluations: int = 0, tokens: int = 0):
+        entry = self._entry(stage)
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        entry['regex_evaluations'] += regex_evaluations
+        entry['tokens'] += tokens
+
+    def merge(self, profile: Dict[str, Any]):
+        """Add a profile from `to_dict` (another document or batch)."""
+        for stage, timing in profile.get('stages', {}).items():
+            entry = self._entry(stage)
+            for name in self.FIELDS:
+                entry[name] += timing.get(name, 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        stages = {stage: dict(entry, seconds=round(entry['seconds'], 6))
+                  for stage, entry in self.stages.items()}
+        return {
+            'total_seconds': round(sum(e['seconds'] for e in self.stages.values()), 6),
+            'stages': stages,
+        }
+
+
+def default_profiling() -> bool:
+    """Whether $C2C_READABILITY_PROFILE asks for per-stage profiles."""
+    return os.environ.get(PROFILE_ENV, '') not in ('', '0')
+
+
 # =============================================================================
 # Main Analysis Class
 # =============================================================================
@@ -397,25 +2146,124 @@ FILLER_PHRASES = {
 class ReadabilityAnalyzer:
     """Context-aware readability analyzer."""
 
-    def __init__(self, audience: Audience = Audience.INTERMEDIATE):
+    def __init__(self, audience: Audience = Audience.INTERMEDIATE,
+                 syllables: Optional[SyllableCounter] = None,
+                 phrases: Optional[PhraseMatcher] = None,
+                 glossary: Optional[JargonGlossary] = None,
+                 cache: Optional["ResultCache"] = None,
+                 profiling: bool = False,
+                 rules: Optional[Iterable[Rule]] = None):
         self.audience = audience
+        self.cache = cache
+        self.profiling = profiling
+        self.profiler: Optional[RuleProfiler] = None
         self.profile = AUDIENCE_PROFILES[audience]
-
-    def analyze(self, content: str, file_name: str = "content") -> Dict[str, Any]:
-        """Perform comprehensive readability analysis."""
+        self.syllables = syllables or default_syllable_counter()
+        self.phrases = phrases or default_phrase_matcher()
+        self.glossary = glossary or default_jargon_glossary()
+        self.house_rules = tuple(default_house_rules() if rules is None else rules)
+        self.engine = RuleEngine(builtin_rules(self.syllables, self.phrases, self.glossary)
+                                 + list(self.house_rules))
+        self.assumed_knowledge = {w.lower() for w in self.profile.allows_assumed_knowledge}
+
+    def analyze(self, content: str, file_name: str = "content",
+                corpus: Optional["CorpusStats"] = None) -> Dict[str, Any]:
+        """Perform comprehensive readability analysis.
+
+        Pass a CorpusStats to also record this document's sentence and
+        paragraph lengths into it. With a ResultCache, a document analyzed
+        before under the same rules is read back instead. With profiling
+        on, the report gets a `profile` of where the time went, and the
+        cache is bypassed so every stage is measured.
+        """
+        if self.profiling:
+            self.profiler = RuleProfiler()
+            try:
+                report = self._analyze(content, file_name, corpus)
+            finally:
+                profiler, self.profiler = self.profiler, None
+            report["profile"] = profiler.to_dict()
+            return report
+        if self.cache is not None:
+            return self._analyze_cached(content, file_name, corpus)
+        return self._analyze(content, file_name, corpus)
+
+    def _analyze(self, content: str, file_name: str,
+                 corpus: Optional["CorpusStats"]) -> Dict[str, Any]:
+        if corpus is not None:
+            corpus.start_document(file_name)
+        source = SourceMap(content)
+        stats, markup = self.collect(content, corpus, source)
+        return self._report(stats, markup, file_name, source)
+
+    def _analyze_cached(self, content: str, file_name: str,
+                        corpus: Optional["CorpusStats"]) -> Dict[str, Any]:
+        cache = self.cache
+        key = cache.key(content, self.audience, ruleset_version(self.syllables, self.phrases, self.glossary,
+                                                                 self.house_rules))
+        cached = cache.get(key)
+        if cached is None:
+            part = CorpusStats()
+            report = self._analyze(content, file_name, part)
+            cache.put(key, report, part)
+        else:
+            report, part = cached
+            report["file_name"] = file_name
+            part.sections = [(file_name, heading) for _, heading in part.sections]
+        if corpus is not None:
+            corpus.extend(part)
+        return report
+
+    def collect(self, content: str, corpus: Optional["CorpusStats"] = None,
+                source: Optional[SourceMap] = None) -> Tuple[ProseStats, MarkupStats]:
+        """Raw, audience-independent statistics of a markdown document.
+
+        Pass `SourceMap(content)` as `source` to have it map the statistics'
+        offsets back to the content.
+        """
         # Separate code from prose
-        prose, code_blocks = self._separate_code_and_prose(content)
-
+        profiler = self.profiler
+        if profiler is None:
+            prose, blocks = self._separate_code_and_prose(content, source)
+        else:
+            started = time.perf_counter()
+            parser = MarkdownParser()
+            prose, blocks = self._separate_code_and_prose(
+                content, source, MarkdownParser.parse(content, parser))
+            profiler.record('_separate_code_and_prose', time.perf_counter() - started,
+                            parser.regex_evaluations)
+
+        # Analyze prose block by block and fold the contributions in order
+        text = substitute(CODE_PLACEHOLDER_PATTERN, '', prose, source)
+        stats = ProseStats()
+        for start, end in split_blocks(text):
+            stats.merge(self._collect_stats(text[start:end], corpus), start)
+
+        if profiler is None:
+            return stats, self._collect_markup(content, prose, blocks)
+        started = time.perf_counter()
+        markup = self._collect_markup(content, prose, blocks)
+        profiler.record('_collect_markup', time.perf_counter() - started,
+                        1 + markup.code_blocks, markup.tokens)
+        return stats, markup
+
+    def _report(self, stats: ProseStats, markup: MarkupStats, file_name: str,
+                source: Optional[SourceMap] = None) -> Dict[str, Any]:
+        """Turn document statistics into the audience-specific report.
+
+        With a SourceMap, findings carry the line and column they start at.
+        """
         # Calculate all metrics
-        readability = self._calculate_readability(prose)
-        sentences = self._analyze_sentences(prose)
-        paragraphs = self._analyze_paragraphs(prose)
-        passive = self._detect_passive_voice(prose)
-        jargon = self._analyze_jargon(prose)
-        hedge = self._find_hedge_words(prose)
-        filler = self._find_filler_phrases(prose)
-        code = self._analyze_code_blocks(code_blocks, prose)
-        structure = self._analyze_structure(content)
+        step = self._step
+        readability = step(self._calculate_readability, stats)
+        sentences = step(self._analyze_sentences, stats, source)
+        paragraphs = step(self._analyze_paragraphs, stats, source)
+        passive = step(self._detect_passive_voice, stats, source)
+        jargon = step(self._analyze_jargon, stats, source)
+        hedge = step(self._find_hedge_words, stats, source)
+        filler = step(self._find_filler_phrases, stats, source)
+        code = step(self._analyze_code_blocks, markup)
+        structure = step(self._analyze_structure, markup)
 
         # Generate audience-aware assessment
         assessment = self._generate_assessment(
@@ -427,12 +2275,12 @@ class ReadabilityAnalyzer:
             readability, sentences, paragraphs, passive, jargon, hedge, filler, code, structure
         )
 
-        return {
+        report = {
             "file_name": file_name,
             "audience": self.audience.value,
             "audience_profile": asdict(self.profile),
-            "total_characters": len(content),
-            "prose_characters": len(prose),
+            "total_characters": markup.characters,
+            "prose_characters": markup.prose_characters,
             "readability_scores": readability,
             "sentence_analysis": sentences,
             "paragraph_analysis": paragraphs,
@@ -446,45 +2294,97 @@ class ReadabilityAnalyzer:
             "suggestions": suggestions,
             "validation_passed": self._validate_content(assessment),
         }
-
-    def _separate_code_and_prose(self, content: str) -> Tuple[str, List[str]]:
-        """Separate code blocks from prose content."""
-        code_blocks = []
-
-        # Extract fenced code blocks
-        code_pattern = r'```[\s\S]*?```'
-        matches = re.findall(code_pattern, content)
-        code_blocks.extend(matches)
-
-        # Remove code blocks from prose
-        prose = re.sub(code_pattern, ' [CODE_BLOCK] ', content)
-
-        # Extract inline code
-        inline_pattern = r'`[^`]+`'
-        prose = re.sub(inline_pattern, ' [INLINE_CODE] ', prose)
-
-        return prose, code_blocks
-
-    def _calculate_readability(self, prose: str) -> Dict[str, Any]:
+        if self.house_rules:
+            report["house_rules"] = step(self._house_rule_findings, stats, markup, source)
+        return report
+
+    def _house_rule_findings(self, stats: ProseStats, markup: MarkupStats,
+                             source: Optional[SourceMap] = None) -> Dict[str, Any]:
+        """Hits of each house rule, with the first few located."""
+        results = {}
+        for rule in self.house_rules:
+            results[rule.name] = {
+                "count": stats.rule_counts[rule.name] + markup.rule_counts[rule.name],
+                "findings": [{"message": message, **_location(source, at)}
+                             for name, at, message in stats.rule_findings if name == rule.name],
+            }
+        return results
+
+    def _step(self, method, *args):
+        """Run one report step, timing it when profiling."""
+        if self.profiler is None:
+            return method(*args)
+        started = time.perf_counter()
+        result = method(*args)
+        self.profiler.record(method.__name__, time.perf_counter() - started)
+        return result
+
+    def _separate_code_and_prose(self, content: str, source: Optional[SourceMap] = None,
+                                 blocks: Optional[List[Block]] = None) -> Tuple[str, List[Block]]:
+        """Separate code blocks from prose content.
+
+        Returns the prose, with code replaced by placeholders and front
+        matter removed, and the markdown blocks (parsed unless given).
+        """
+        if blocks is None:
+            blocks = MarkdownParser.parse(content)
+
+        spans = []
+        for block in blocks:
+            if block.kind == CODE:
+                spans.append((block.start, block.end, ' [CODE_BLOCK] '))
+            elif block.kind == FRONT_MATTER:
+                spans.append((block.start, block.end, ''))
+            else:
+                spans.extend((a, b, ' [INLINE_CODE] ') for a, b in block.code_spans)
+
+        return replace_spans(content, spans, source), blocks
+
+    def _collect_stats(self, text: str, corpus: Optional["CorpusStats"] = None) -> ProseStats:
+        """Scan one block of prose (see `split_blocks`) into ProseStats."""
+        if self.profiler is not None:
+            return self._collect_stats_profiled(text, corpus)
+        doc = Document.parse(text)
+        stats = ProseStats(words=len(doc.words))
+        if corpus is not None:
+            corpus.record(doc)
+
+        self.engine.collect(doc, stats)
+        return stats
+
+    def _collect_stats_profiled(self, text: str, corpus: Optional["CorpusStats"]) -> ProseStats:
+        profiler = self.profiler
+        started = time.perf_counter()
+        doc = Document.parse(text)
+        # Placeholder removal, words, paragraph and sentence breaks, then
+        # one markup-token count per sentence
+        profiler.record('Document.parse', time.perf_counter() - started,
+                        4 + len(doc.sentences), len(doc.words))
+        stats = ProseStats(words=len(doc.words))
+        if corpus is not None:
+            corpus.record(doc)
+
+        # Rules are independent, so timing each on its own walk gives the
+        # same statistics as the shared one
+        for rule in self.engine.prose_rules:
+            scans = rule.regex_evaluations
+            started = time.perf_counter()
+            self.engine.only(rule.name).collect(doc, stats)
+            profiler.record(rule.name, time.perf_counter() - started,
+                            rule.regex_evaluations - scans, len(doc.words))
+        return stats
+
+    def _calculate_readability(self, stats: ProseStats) -> Dict[str, Any]:
         """Calculate readability scores with improved accuracy."""
-        # Clean prose
-        clean = re.sub(r'\[CODE_BLOCK\]|\[INLINE_CODE\]', '', prose)
-        clean = re.sub(r'[#*_\[\]()]', '', clean)
-        clean = re.sub(r'\s+', ' ', clean).strip()
-
-        if not clean:
+        sentence_count = stats.sentence_count
+        if not sentence_count:
             return {"error": "No prose content to analyze"}
 
-        # Extract words and sentences
-        words = [w for w in re.findall(r'\b[a-zA-Z]+\b', clean) if len(w) > 1]
-        sentences = [s.strip() for s in re.split(r'[.!?]+', clean) if s.strip()]
-
-        if not words or not sentences:
+        if not stats.long_words:
             return {"error": "Insufficient content for analysis"}
 
-        word_count = len(words)
-        sentence_count = len(sentences)
-        syllable_count = sum(count_syllables(w) for w in words)
+        word_count = stats.long_words
+        syllable_count = stats.syllables
 
         # Calculate scores
         avg_sentence_length = word_count / sentence_count
@@ -546,129 +2446,84 @@ class ReadabilityAnalyzer:
             "grade_level": f"Grade {round(grade, 1)}",
         }
 
-    def _analyze_sentences(self, prose: str) -> Dict[str, Any]:
+    def _analyze_sentences(self, stats: ProseStats,
+                           source: Optional[SourceMap] = None) -> Dict[str, Any]:
         """Analyze sentence structure with audience awareness."""
-        clean = re.sub(r'\[CODE_BLOCK\]|\[INLINE_CODE\]', '', prose)
-        clean = re.sub(r'[#*_\[\]()]', '', clean)
+        lengths = stats.sentence_lengths
 
-        sentences = [s.strip() for s in re.split(r'[.!?]+', clean) if s.strip()]
-
-        if not sentences:
+        if not lengths:
             return {"error": "No sentences found"}
 
-        lengths = [len(s.split()) for s in sentences]
         max_length = self.profile.max_sentence_length
 
         # Find problematic sentences
-        long_sentences = []
-        for s in sentences:
-            word_count = len(s.split())
-            if word_count > max_length:
-                long_sentences.append({
-                    "sentence": s[:100] + "..." if len(s) > 100 else s,
-                    "word_count": word_count,
-                    "over_limit_by": word_count - max_length,
-                })
-
-        # Calculate variation (good writing has varied sentence lengths)
-        avg_length = sum(lengths) / len(lengths)
-        variance = sum((l - avg_length) ** 2 for l in lengths) / len(lengths)
+        long_sentences = [{
+            "sentence": s,
+            "word_count": word_count,
+            "over_limit_by": word_count - max_length,
+            **_location(source, offset),
+        } for word_count, s, offset in stats.long_sentences if word_count > max_length]
+        over_limit = sum(n for length, n in lengths.items() if length > max_length)
+
+        # Calculate variation (good writing has varied sentence lengths);
+        # integer moments keep the result independent of summation order
+        count = sum(lengths.values())
+        total = sum(length * n for length, n in lengths.items())
+        squares = sum(length * length * n for length, n in lengths.items())
+        avg_length = total / count
+        variance = (count * squares - total * total) / (count * count)
         std_dev = variance ** 0.5
         variation_score = min(1.0, std_dev / avg_length) if avg_length > 0 else 0
 
         return {
-            "total_sentences": len(sentences),
+            "total_sentences": count,
             "avg_sentence_length": round(avg_length, 1),
             "max_allowed_for_audience": max_length,
             "shortest_sentence": min(lengths),
             "longest_sentence": max(lengths),
-            "sentences_over_limit": len(long_sentences),
-            "long_sentences": long_sentences[:5],
+            "sentences_over_limit": over_limit,
+            "long_sentences": long_sentences[:MAX_LONG_SENTENCES],
             "length_variation_score": round(variation_score, 2),
             "variation_assessment": "Good variety" if variation_score > 0.3 else "Could use more variety",
         }
 
-    def _analyze_paragraphs(self, prose: str) -> Dict[str, Any]:
+    def _analyze_paragraphs(self, stats: ProseStats,
+                            source: Optional[SourceMap] = None) -> Dict[str, Any]:
         """Analyze paragraph structure."""
-        paragraphs = re.split(r'\n\s*\n', prose)
-        paragraphs = [p.strip() for p in paragraphs
-                      if p.strip() and not p.strip().startswith('#')]
+        lengths = stats.paragraph_lengths
 
-        if not paragraphs:
+        if not lengths:
             return {"error": "No paragraphs found"}
 
-        lengths = [len(p.split()) for p in paragraphs]
         max_length = self.profile.max_paragraph_length
 
-        long_paragraphs = []
-        for p in paragraphs:
-            word_count = len(p.split())
-            if word_count > max_length:
-                long_paragraphs.append({
-                    "preview": p[:80] + "..." if len(p) > 80 else p,
-                    "word_count": word_count,
-                    "over_limit_by": word_count - max_length,
-                })
+        long_paragraphs = [{
+            "preview": p,
+            "word_count": word_count,
+            "over_limit_by": word_count - max_length,
+            **_location(source, offset),
+        } for word_count, p, offset in stats.long_paragraphs if word_count > max_length]
+        over_limit = sum(n for length, n in lengths.items() if length > max_length)
+
+        count = sum(lengths.values())
+        total = sum(length * n for length, n in lengths.items())
 
         return {
-            "total_paragraphs": len(paragraphs),
-            "avg_paragraph_length": round(sum(lengths) / len(lengths), 1),
+            "total_paragraphs": count,
+            "avg_paragraph_length": round(total / count, 1),
             "max_allowed_for_audience": max_length,
             "shortest_paragraph": min(lengths),
             "longest_paragraph": max(lengths),
-            "paragraphs_over_limit": len(long_paragraphs),
-            "long_paragraphs": long_paragraphs[:3],
+            "paragraphs_over_limit": over_limit,
+            "long_paragraphs": long_paragraphs[:MAX_LONG_PARAGRAPHS],
         }
 
-    def _detect_passive_voice(self, prose: str) -> Dict[str, Any]:
+    def _detect_passive_voice(self, stats: ProseStats,
+                              source: Optional[SourceMap] = None) -> Dict[str, Any]:
         """Detect passive voice with improved accuracy."""
-        clean = re.sub(r'\[CODE_BLOCK\]|\[INLINE_CODE\]', '', prose)
-
-        passive_instances = []
-
-        for pattern in PASSIVE_PATTERNS:
-            for match in re.finditer(pattern, clean, re.IGNORECASE):
-                # Check if the past participle is an exception
-                groups = match.groups()
-                if len(groups) >= 2:
-                    participle = groups[1].lower()
-                    if participle in PASSIVE_EXCEPTIONS:
-                        continue
-
-                # Get context
-                start = max(0, match.start() - 30)
-                end = min(len(clean), match.end() + 30)
-                context = clean[start:end].strip()
-
-                passive_instances.append({
-                    "match": match.group(),
-                    "context": context,
-                })
-
-        # Deduplicate by context
-        seen = set()
-        unique_instances = []
-        for inst in passive_instances:
-            key = inst["context"][:50]
-            if key not in seen:
-                seen.add(key)
-                unique_instances.append(inst)
-
         # Calculate percentage
-        sentences = [s.strip() for s in re.split(r'[.!?]+', clean) if s.strip()]
-        passive_sentences = 0
-
-        for sentence in sentences:
-            for pattern in PASSIVE_PATTERNS:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    # Check exceptions
-                    match = re.search(pattern, sentence, re.IGNORECASE)
-                    if match and len(match.groups()) >= 2:
-                        if match.groups()[1].lower() not in PASSIVE_EXCEPTIONS:
-                            passive_sentences += 1
-                            break
-
-        passive_percentage = (passive_sentences / len(sentences) * 100) if sentences else 0
+        sentences = stats.sentence_count
+        passive_percentage = (stats.passive_sentences / sentences * 100) if sentences else 0
 
         # Assessment relative to audience
         # Technical writing often uses passive appropriately
@@ -681,52 +2536,69 @@ class ReadabilityAnalyzer:
                      "Medium" if passive_percentage > threshold / 2 else "Low"
 
         return {
-            "passive_instances_found": len(unique_instances),
+            "passive_instances_found": stats.distinct_passive,
             "passive_percentage": round(passive_percentage, 1),
-            "examples": unique_instances[:5],
+            "examples": [{
+                "match": example["match"],
+                "context": example["context"],
+                **_location(source, example["offset"]),
+            } for example in stats.passive_examples[:MAX_PASSIVE_EXAMPLES]],
             "assessment": assessment,
             "threshold_for_audience": threshold,
             "within_threshold": passive_percentage <= threshold,
         }
 
-    def _analyze_jargon(self, prose: str) -> Dict[str, Any]:
+    def _analyze_jargon(self, stats: ProseStats,
+                        source: Optional[SourceMap] = None) -> Dict[str, Any]:
         """Analyze jargon with context awareness."""
-        clean = re.sub(r'\[CODE_BLOCK\]|\[INLINE_CODE\]', '', prose)
-        words = re.findall(r'\b[a-zA-Z]+\b', clean.lower())
-
-        jargon_found = []
+        # Terms in order of first use, so ties rank the earlier term first
+        first_use = sorted(stats.jargon_first_use.items(), key=lambda item: item[1])
         jargon_counts = Counter()
+        term_first_use = {}
+        for word, used_at in first_use:
+            term = self.glossary.get(word).term
+            if term not in jargon_counts:
+                jargon_counts[term] = stats.jargon_counts[term]
+                term_first_use[term] = used_at
+
         undefined_jargon = []
+        defined_after_use = []
+        reported = set()
 
-        # Check against jargon database
-        for word in words:
-            if word in JARGON_DATABASE:
-                jargon = JARGON_DATABASE[word]
-                jargon_counts[jargon.term] += 1
+        if self.profile.requires_definitions:
+            for word, used_at in first_use:
+                jargon = self.glossary.get(word)
 
                 # Check if term is allowed for this audience
-                is_allowed = word in [w.lower() for w in self.profile.allows_assumed_knowledge]
-
-                if not is_allowed and self.profile.requires_definitions:
-                    # Check if it's defined in the text (look for "X is" or "X, which" patterns)
-                    definition_patterns = [
-                        rf'\b{word}\b[,\s]+(?:is|are|refers? to|means?)',
-                        rf'\b{word}\b[,\s]+(?:which|that)\s+(?:is|are)',
-                        rf'(?:called|known as|termed)\s+\b{word}\b',
-                    ]
-                    is_defined = any(re.search(p, clean, re.IGNORECASE) for p in definition_patterns)
-
-                    if not is_defined and jargon.term not in [j['term'] for j in undefined_jargon]:
-                        undefined_jargon.append({
-                            "term": jargon.term,
-                            "category": jargon.category,
-                            "complexity": jargon.complexity,
-                            "suggestion": f"Define '{jargon.term}' on first use",
-                        })
+                if word in self.assumed_knowledge or jargon.term in reported:
+                    continue
+
+                defined_at = stats.definitions.get(word)
+                if defined_at is None:
+                    reported.add(jargon.term)
+                    undefined_jargon.append({
+                        "term": jargon.term,
+                        "category": jargon.category,
+                        "complexity": jargon.complexity,
+                        "suggestion": f"Define '{jargon.term}' on first use",
+                        **_location(source, used_at),
+                    })
+                elif defined_at > used_at:
+                    reported.add(jargon.term)
+                    entry = {
+                        "term": jargon.term,
+                        "first_use": used_at,
+                        "defined_at": defined_at,
+                        "suggestion": f"Move the definition of '{jargon.term}' before its first use",
+                        **_location(source, used_at),
+                    }
+                    if source is not None:
+                        entry["defined_line"], entry["defined_column"] = source.locate(defined_at)
+                    defined_after_use.append(entry)
 
         # Calculate jargon density
         jargon_instances = sum(jargon_counts.values())
-        jargon_density = (jargon_instances / len(words) * 100) if words else 0
+        jargon_density = (jargon_instances / stats.words * 100) if stats.words else 0
 
         # Assessment relative to audience tolerance
         tolerance = self.profile.jargon_tolerance
@@ -744,33 +2616,27 @@ class ReadabilityAnalyzer:
             "jargon_density_percentage": round(jargon_density, 2),
             "tolerance_for_audience": tolerance,
             "within_tolerance": jargon_density <= tolerance,
-            "most_used_jargon": [{"term": t, "count": c}
+            "most_used_jargon": [{"term": t, "count": c, **_location(source, term_first_use[t])}
                                  for t, c in jargon_counts.most_common(10)],
             "undefined_jargon": undefined_jargon[:10],
+            "defined_after_use": defined_after_use[:10],
             "assessment": assessment,
         }
 
-    def _find_hedge_words(self, prose: str) -> Dict[str, Any]:
+    def _find_hedge_words(self, stats: ProseStats,
+                          source: Optional[SourceMap] = None) -> Dict[str, Any]:
         """Find hedge words that weaken writing."""
-        clean = re.sub(r'\[CODE_BLOCK\]|\[INLINE_CODE\]', '', prose)
-        clean_lower = clean.lower()
-
         found = Counter()
         by_category = Counter()
 
-        for word, category in HEDGE_WORDS.items():
-            # Handle multi-word phrases
-            if ' ' in word:
-                count = len(re.findall(rf'\b{re.escape(word)}\b', clean_lower))
-            else:
-                count = len(re.findall(rf'\b{word}\b', clean_lower))
-
-            if count > 0:
-                found[word] = count
-                by_category[category] += count
+        # In PhraseMatcher order, so ties rank the earlier entry first
+        for word in sorted(stats.hedge_counts, key=self.phrases.hedge_rank.__getitem__):
+            count = stats.hedge_counts[word]
+            found[word] = count
+            by_category[self.phrases.hedges[word]] += count
 
         total = sum(found.values())
-        words = len(re.findall(r'\b[a-zA-Z]+\b', clean))
+        words = stats.words
         density = (total / words * 100) if words else 0
 
         # Assessment
@@ -785,46 +2651,43 @@ class ReadabilityAnalyzer:
             "total_hedge_words": total,
             "hedge_density_percentage": round(density, 2),
             "by_category": dict(by_category),
-            "most_common": [{"word": w, "count": c} for w, c in found.most_common(5)],
+            "most_common": [{"word": w, "count": c, **_location(source, stats.hedge_first_use[w])}
+                            for w, c in found.most_common(5)],
             "assessment": assessment,
         }
 
-    def _find_filler_phrases(self, prose: str) -> Dict[str, Any]:
+    def _find_filler_phrases(self, stats: ProseStats,
+                             source: Optional[SourceMap] = None) -> Dict[str, Any]:
         """Find filler phrases that could be cut."""
-        clean = re.sub(r'\[CODE_BLOCK\]|\[INLINE_CODE\]', '', prose)
-        clean_lower = clean.lower()
-
-        found = []
-
-        for phrase, replacement in FILLER_PHRASES.items():
-            matches = list(re.finditer(rf'\b{re.escape(phrase)}\b', clean_lower))
-            for match in matches:
-                found.append({
-                    "phrase": phrase,
-                    "replacement": replacement,
-                    "position": match.start(),
-                })
-
-        # Estimate words that could be saved
-        words_saveable = sum(len(f["phrase"].split()) - 1 for f in found)
-
         return {
-            "total_filler_phrases": len(found),
-            "words_saveable": words_saveable,
-            "phrases_found": found[:10],
+            "total_filler_phrases": stats.filler_count,
+            "words_saveable": stats.filler_saveable,
+            "phrases_found": [{
+                "phrase": phrase,
+                "replacement": self.phrases.fillers[phrase],
+                "position": position,
+                **_location(source, position),
+            } for _, position, phrase in stats.fillers[:MAX_FILLER_EXAMPLES]],
         }
 
-    def _analyze_code_blocks(self, code_blocks: List[str], prose: str) -> Dict[str, Any]:
+    def _collect_markup(self, content: str, prose: str, blocks: List[Block]) -> MarkupStats:
+        """Count code blocks and structural elements of parsed markdown."""
+        markup = MarkupStats(characters=len(content), prose_characters=len(prose))
+        self.engine.collect_markup(blocks, content, markup)
+        markup.tokens = len(WORD_TOKEN_PATTERN.findall(content))
+        return markup
+
+    def _analyze_code_blocks(self, markup: MarkupStats) -> Dict[str, Any]:
         """Analyze code-to-prose ratio."""
-        if not code_blocks:
+        if not markup.code_blocks:
             return {
                 "code_blocks": 0,
                 "note": "No code blocks found",
                 "ratio_assessment": "N/A - no code",
             }
 
-        total_code_lines = sum(block.count('\n') for block in code_blocks)
-        prose_lines = len([l for l in prose.split('\n') if l.strip() and not l.strip().startswith('#')])
+        total_code_lines = markup.code_lines
+        prose_lines = markup.prose_lines
 
         # Calculate ratio
         if total_code_lines > 0:
@@ -842,42 +2705,24 @@ class ReadabilityAnalyzer:
         else:
             ratio_assessment = f"Very low - {ratio:.1f} prose lines per code line (target: {expected_ratio})"
 
-        # Detect languages
-        languages = Counter()
-        for block in code_blocks:
-            first_line = block.split('\n')[0]
-            lang_match = re.match(r'```(\w+)', first_line)
-            if lang_match:
-                languages[lang_match.group(1)] += 1
-
         return {
-            "code_blocks": len(code_blocks),
+            "code_blocks": markup.code_blocks,
             "total_code_lines": total_code_lines,
             "prose_lines": prose_lines,
             "prose_to_code_ratio": round(ratio, 2) if ratio != float('inf') else "N/A",
             "expected_ratio_for_audience": expected_ratio,
             "ratio_assessment": ratio_assessment,
-            "languages_used": dict(languages),
+            "languages_used": dict(markup.languages),
         }
 
-    def _analyze_structure(self, content: str) -> Dict[str, Any]:
+    def _analyze_structure(self, markup: MarkupStats) -> Dict[str, Any]:
         """Analyze document structure."""
-        # Count headings
-        h1 = len(re.findall(r'^# [^#]', content, re.MULTILINE))
-        h2 = len(re.findall(r'^## [^#]', content, re.MULTILINE))
-        h3 = len(re.findall(r'^### [^#]', content, re.MULTILINE))
-        h4 = len(re.findall(r'^#### ', content, re.MULTILINE))
-
-        # Count lists
-        bullet_lists = len(re.findall(r'^[\s]*[-*] ', content, re.MULTILINE))
-        numbered_lists = len(re.findall(r'^[\s]*\d+\. ', content, re.MULTILINE))
-
-        # Count links and images
-        links = len(re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content))
-        images = len(re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', content))
+        h1, h2, h3, h4 = (markup.headings[h] for h in ("h1", "h2", "h3", "h4"))
+        bullet_lists = markup.bullet_items
+        numbered_lists = markup.numbered_items
 
         # Calculate scannability score
-        word_count = len(re.findall(r'\b\w+\b', content))
+        word_count = markup.tokens
         structural_elements = h1 + h2 + h3 + h4 + bullet_lists + numbered_lists
 
         if word_count > 0:
@@ -898,8 +2743,8 @@ class ReadabilityAnalyzer:
                 "numbered_items": numbered_lists,
                 "total": bullet_lists + numbered_lists,
             },
-            "links": links,
-            "images": images,
+            "links": markup.links,
+            "images": markup.images,
             "scannability_score": round(scannability, 2),
             "scannability_assessment": "Good" if scannability > 0.3 else "Could improve",
         }
@@ -1043,6 +2888,16 @@ class ReadabilityAnalyzer:
                 "suggestion": "Add brief definitions on first use: 'X (a type of Y that does Z)'",
             })
 
+        late = jargon.get("defined_after_use", [])
+        if late and self.profile.requires_definitions:
+            terms = [u["term"] for u in late[:3]]
+            suggestions.append({
+                "category": "Definitions",
+                "priority": "low",
+                "issue": f"Terms are used before they are defined: {', '.join(terms)}",
+                "suggestion": "Move each definition up to the term's first use.",
+            })
+
         # Hedge words suggestions
         if hedge.get("hedge_density_percentage", 0) > 2:
             suggestions.append({
@@ -1101,10 +2956,839 @@ class ReadabilityAnalyzer:
         return assessment.get("score", 0) >= 60
 
 
+# =============================================================================
+# Audience Fit Ranking
+# =============================================================================
+
+def rank_audiences(stats: ProseStats, markup: MarkupStats, file_name: str = "content",
+                   source: Optional[SourceMap] = None) -> Dict[str, Any]:
+    """Report a document against every audience profile and rank the fits.
+
+    The statistics are collected once; each profile only re-applies its
+    thresholds. Audiences are ranked by assessment score, then by how
+    closely the reading grade fits under the profile's maximum, so the
+    tightest passing audience comes first.
+    """
+    syllables = default_syllable_counter()
+    phrases = default_phrase_matcher()
+    glossary = default_jargon_glossary()
+    reports = {}
+    ranking = []
+    for audience in Audience:
+        report = ReadabilityAnalyzer(audience, syllables, phrases, glossary)._report(
+            stats, markup, file_name, source)
+        reports[audience.value] = report
+
+        grade = report["readability_scores"].get("flesch_kincaid_grade")
+        max_grade = AUDIENCE_PROFILES[audience].max_flesch_kincaid_grade
+        ranking.append({
+            "audience": audience.value,
+            "score": report["assessment"]["score"],
+            "overall": report["assessment"]["overall"],
+            "validation_passed": report["validation_passed"],
+            "flesch_kincaid_grade": grade,
+            "max_grade": max_grade,
+            "grade_headroom": round(max_grade - grade, 1) if grade is not None else None,
+            "issues": report["assessment"]["issues"],
+        })
+
+    def fit(entry):
+        headroom = entry["grade_headroom"]
+        if headroom is None:
+            return (-entry["score"], True, 0)
+        return (-entry["score"], headroom < 0, abs(headroom))
+
+    ranking.sort(key=fit)
+    return {
+        "file_name": file_name,
+        "best_fit": ranking[0]["audience"],
+        "ranking": ranking,
+        "reports": reports,
+    }
+
+
+def analyze_all_audiences(content: str, file_name: str = "content") -> Dict[str, Any]:
+    """Collect a document's statistics once and rank every audience."""
+    source = SourceMap(content)
+    stats, markup = ReadabilityAnalyzer().collect(content, source=source)
+    return rank_audiences(stats, markup, file_name, source)
+
+
+# =============================================================================
+# Incremental Analysis (editor integration)
+# =============================================================================
+
+class IncrementalAnalyzer:
+    """Re-analyze a document as it is edited, rescanning only changed blocks.
+
+    Block statistics are cached by block content, and the document totals
+    are updated by subtracting the blocks an edit removed and adding the
+    ones it introduced. The report is identical to
+    `ReadabilityAnalyzer.analyze` on the same content, because both fold the
+    same per-block statistics. Code separation and the structure metrics
+    still scan the whole document, but that is a single markdown parse.
+
+        session = IncrementalAnalyzer(Audience.BEGINNER)
+        report = session.update(text)      # first call analyzes everything
+        report = session.update(edited)    # later calls rescan changed blocks
+    """
+
+    def __init__(self, audience: Audience = Audience.INTERMEDIATE,
+                 analyzer: Optional[ReadabilityAnalyzer] = None):
+        self.analyzer = analyzer or ReadabilityAnalyzer(audience)
+        self._cache: Dict[str, ProseStats] = {}
+        self._present: Counter = Counter()   # block text -> occurrences
+        self._totals = ProseStats()
+        self.blocks: List[Tuple[int, str]] = []   # (offset, text) of the last update
+        self.source: Optional[SourceMap] = None
+        self.blocks_reused = 0
+        self.blocks_analyzed = 0
+
+    def update(self, content: str, file_name: str = "content") -> Dict[str, Any]:
+        """Analyze the current content, reusing unchanged blocks."""
+        analyzer = self.analyzer
+        source = SourceMap(content)
+        prose, markdown = analyzer._separate_code_and_prose(content, source)
+        text = substitute(CODE_PLACEHOLDER_PATTERN, '', prose, source)
+
+        blocks = [(start, text[start:end]) for start, end in split_blocks(text)]
+        present = Counter(block for _, block in blocks)
+
+        self.blocks_reused = self.blocks_analyzed = 0
+        for block in present:
+            if block in self._cache:
+                self.blocks_reused += present[block]
+            else:
+                self._cache[block] = analyzer._collect_stats(block)
+                self.blocks_analyzed += present[block]
+
+        # Update totals by the difference in block occurrences
+        for block in present.keys() | self._present.keys():
+            delta = present[block] - self._present[block]
+            if delta:
+                self._totals.add(self._cache[block], delta)
+
+        for block in self._present.keys() - present.keys():
+            del self._cache[block]
+        self._present = present
+        self.blocks = blocks
+        self.source = source
+
+        # Ordered example lists depend on block positions
+        stats = ProseStats()
+        stats.add(self._totals)
+        for start, block in blocks:
+            stats.extend(self._cache[block], start)
+
+        markup = analyzer._collect_markup(content, prose, markdown)
+        return analyzer._report(stats, markup, file_name, source)
+
+
+# =============================================================================
+# Version Delta (how an edit moved readability)
+# =============================================================================
+
+DELTA_METRICS = (
+    ("flesch_kincaid_grade", "readability_scores", "flesch_kincaid_grade"),
+    ("flesch_reading_ease", "readability_scores", "flesch_reading_ease"),
+    ("word_count", "readability_scores", "word_count"),
+    ("avg_sentence_length", "readability_scores", "avg_sentence_length"),
+    ("passive_percentage", "passive_voice", "passive_percentage"),
+    ("jargon_density_percentage", "jargon_analysis", "jargon_density_percentage"),
+    ("hedge_density_percentage", "hedge_words", "hedge_density_percentage"),
+    ("score", "assessment", "score"),
+)
+MAX_CHANGED_RANGES = 20
+
+
+def compare_versions(old_content: str, new_content: str,
+                     audience: Audience = Audience.INTERMEDIATE,
+                     file_name: str = "content") -> Dict[str, Any]:
+    """Report how readability moved between two versions of a document.
+
+    The old version is analyzed block by block, then an IncrementalAnalyzer
+    rescans only the blocks the new version added or changed; unchanged
+    blocks, moved ones included, are reused. Blocks are aligned in order to
+    report which ranges of the new version changed.
+    """
+    session = IncrementalAnalyzer(audience)
+    before = session.update(old_content, file_name)
+    old_blocks = [block for _, block in session.blocks]
+    after = session.update(new_content, file_name)
+
+    paragraphs = {"unchanged": 0, "modified": 0, "added": 0, "removed": 0, "changed_ranges": []}
+    matcher = SequenceMatcher(None, old_blocks, [block for _, block in session.blocks],
+                              autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            paragraphs["unchanged"] += i2 - i1
+            continue
+        if tag == 'replace':
+            common = min(i2 - i1, j2 - j1)
+            paragraphs["modified"] += common
+            paragraphs["removed"] += i2 - i1 - common
+            paragraphs["added"] += j2 - j1 - common
+        else:
+            paragraphs["removed"] += i2 - i1
+            paragraphs["added"] += j2 - j1
+        if j1 < j2 and len(paragraphs["changed_ranges"]) < MAX_CHANGED_RANGES:
+            start = session.blocks[j1][0]
+            last_start, last = session.blocks[j2 - 1]
+            paragraphs["changed_ranges"].append({
+                "change": "modified" if tag == 'replace' else "added",
+                "line": session.source.locate(start)[0],
+                "end_line": session.source.locate(last_start + len(last.rstrip()))[0],
+            })
+
+    def metrics(report: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: report.get(section, {}).get(key) for name, section, key in DELTA_METRICS}
+
+    old_metrics, new_metrics = metrics(before), metrics(after)
+    delta = {}
+    for name, value in new_metrics.items():
+        if isinstance(value, (int, float)) and isinstance(old_metrics[name], (int, float)):
+            delta[name] = round(value - old_metrics[name], 2)
+        else:
+            delta[name] = None
+
+    old_undefined = {t["term"] for t in before["jargon_analysis"].get("undefined_jargon", [])}
+    new_undefined = after["jargon_analysis"].get("undefined_jargon", [])
+    new_terms = {t["term"] for t in new_undefined}
+
+    return {
+        "file_name": file_name,
+        "audience": audience.value,
+        "before": old_metrics,
+        "after": new_metrics,
+        "delta": delta,
+        "paragraphs": paragraphs,
+        "new_undefined_terms": [t for t in new_undefined if t["term"] not in old_undefined],
+        "resolved_undefined_terms": sorted(old_undefined - new_terms),
+        "passed_before": before["validation_passed"],
+        "validation_passed": after["validation_passed"],
+        "blocks_analyzed": session.blocks_analyzed,
+        "blocks_reused": session.blocks_reused,
+    }
+
+
+# =============================================================================
+# Streaming Analysis (book-length input)
+# =============================================================================
+
+STREAM_CHUNK_SIZE = 64 * 1024
+# Cut even without a blank line, so a chunk stays bounded
+STREAM_MAX_CHUNK = 8 * 1024 * 1024
+# Prose held back waiting for a block boundary before it is cut anyway
+STREAM_MAX_PENDING = 1024 * 1024
+RECENT_PASSIVE_KEYS = 4096
+
+
+def iter_markdown_chunks(lines: Iterable[str], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Group lines into chunks of roughly `chunk_size` ending at a blank line.
+
+    Any line boundary is a valid cut (the parser holds back unfinished
+    blocks); blank lines just keep what is held back small.
+    """
+    buf = []
+    size = 0
+    for line in lines:
+        buf.append(line)
+        size += len(line)
+        if size >= chunk_size and (not line.strip() or size >= STREAM_MAX_CHUNK):
+            yield ''.join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield ''.join(buf)
+
+
+class StreamPositions:
+    """Lines and columns of the offsets a streamed report can cite.
+
+    Findings are located as their block is merged, through a SourceMap
+    trimmed to the prose not analyzed yet, and only the positions of
+    findings the stats still hold are kept. Stands in for a whole-document
+    SourceMap when the report is built.
+    """
+
+    def __init__(self):
+        self.window = SourceMap()
+        self._found: Dict[int, Tuple[int, int]] = {}
+        self._limit = 1024             # prune dropped findings past this many
+
+    def record(self, block: ProseStats, offset: int):
+        """Locate the findings of a block merged at prose `offset`."""
+        for at in block.offsets():
+            at += offset
+            if at not in self._found:
+                self._found[at] = self.window.locate(at)
+
+    def trim(self, offset: int, stats: ProseStats):
+        """Drop the map before `offset` and positions `stats` no longer cites."""
+        self.window.trim(offset)
+        if len(self._found) > self._limit:
+            live = set(stats.offsets())
+            self._found = {at: pos for at, pos in self._found.items() if at in live}
+            self._limit = max(1024, 2 * len(self._found))
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        return self._found[offset]
+
+    def location(self, offset: int) -> Dict[str, int]:
+        line, column = self.locate(offset)
+        return {"line": line, "column": column}
+
+
+class StreamingAnalyzer:
+    """Analyze a document chunk by chunk without holding the whole text.
+
+    Only running counters and bounded example lists are kept, plus the
+    markdown block and prose block that may continue in the next chunk (an
+    unclosed code fence is held until it closes). Prose without a block
+    boundary is cut at the last sentence end once it passes
+    STREAM_MAX_PENDING characters, and findings are located as they are
+    found (see StreamPositions), so memory does not grow with the input
+    beyond the longest markdown block. The report matches
+    `ReadabilityAnalyzer.analyze`, except that passive contexts are only
+    deduplicated against the most recent RECENT_PASSIVE_KEYS and a
+    paragraph longer than STREAM_MAX_PENDING counts as several.
+
+        stream = StreamingAnalyzer(Audience.EXPERT)
+        for chunk in iter_markdown_chunks(sys.stdin):
+            stream.feed(chunk)
+        report = stream.finish("stdin")
+    """
+
+    def __init__(self, audience: Audience = Audience.INTERMEDIATE,
+                 analyzer: Optional[ReadabilityAnalyzer] = None):
+        self.analyzer = analyzer or ReadabilityAnalyzer(audience)
+        self.stats = ProseStats()
+        self.markup = MarkupStats()
+        self.positions = StreamPositions()
+        self._parser = MarkdownParser()
+        self._pending = ''   # prose of the last, possibly unfinished block
+        self._offset = 0     # prose offset of _pending
+        self._recent_passive: OrderedDict = OrderedDict()
+
+    def feed(self, chunk: str):
+        """Consume raw markdown cut at a line boundary."""
+        self._consume(*self._parser.feed(chunk))
+
+    def _consume(self, markdown: str, blocks: List[Block]):
+        """Analyze markdown whose blocks are complete."""
+        analyzer = self.analyzer
+        source = SourceMap(markdown)
+        prose, _ = analyzer._separate_code_and_prose(markdown, source, blocks)
+        self.markup.add(analyzer._collect_markup(markdown, prose, blocks))
+
+        self._pending += substitute(CODE_PLACEHOLDER_PATTERN, '', prose, source)
+        self.positions.window.extend(source)
+        blocks = split_blocks(self._pending)
+        for start, end in blocks[:-1]:
+            self._merge(self._pending[start:end], self._offset + start)
+
+        last = blocks[-1][0]
+        self._pending = self._pending[last:]
+        self._offset += last
+        while len(self._pending) > STREAM_MAX_PENDING:
+            cut = self._forced_cut(self._pending)
+            self._merge(self._pending[:cut], self._offset)
+            self._pending = self._pending[cut:]
+            self._offset += cut
+        self.positions.trim(self._offset, self.stats)
+
+    @staticmethod
+    def _forced_cut(text: str) -> int:
+        """Where to cut a block too long to hold: the last sentence end in
+        the first STREAM_MAX_PENDING characters, else the last space."""
+        head = text[:STREAM_MAX_PENDING]
+        cut = 0
+        for match in SENTENCE_END_PATTERN.finditer(head):
+            if match.end() < len(head) and head[match.end()].isspace():
+                cut = match.end()
+        if not cut:
+            cut = max(head.rfind(' '), head.rfind('\n')) + 1
+        return cut or STREAM_MAX_PENDING
+
+    def flush(self):
+        """Analyze the last block; call once the input is exhausted."""
+        self._consume(*self._parser.finish())
+        if self._pending:
+            self._merge(self._pending, self._offset)
+            self._offset += len(self._pending)
+            self._pending = ''
+
+    def finish(self, file_name: str = "stdin") -> Dict[str, Any]:
+        """Flush the last block and build the report."""
+        self.flush()
+        return self.analyzer._report(self.stats, self.markup, file_name, self.positions)
+
+    def _merge(self, text: str, offset: int):
+        block = self.analyzer._collect_stats(text)
+        self.stats.merge(block, offset)
+        self.positions.record(block, offset)
+
+        # Keep passive dedup keys for recent blocks only
+        recent = self._recent_passive
+        for key in block.passive_keys:
+            if key in recent:
+                recent.move_to_end(key)
+                self.stats.passive_instances -= 1
+            else:
+                recent[key] = None
+                if len(recent) > RECENT_PASSIVE_KEYS:
+                    recent.popitem(last=False)
+        self.stats.passive_keys.clear()
+
+
+def analyze_stream(lines: Iterable[str], audience: Optional[Audience],
+                   file_name: str = "stdin") -> Dict[str, Any]:
+    """Stream lines of markdown through a StreamingAnalyzer.
+
+    With `audience` None, every profile is ranked (see `rank_audiences`).
+    """
+    stream = StreamingAnalyzer(audience or Audience.INTERMEDIATE)
+    for chunk in iter_markdown_chunks(lines):
+        stream.feed(chunk)
+    if audience is None:
+        stream.flush()
+        return rank_audiences(stream.stats, stream.markup, file_name, stream.positions)
+    return stream.finish(file_name)
+
+
+# =============================================================================
+# Corpus Statistics (bulk length distributions)
+# =============================================================================
+
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+SENTENCE_BUCKETS = (5, 10, 15, 20, 25, 30, 40, 50)
+PARAGRAPH_BUCKETS = (25, 50, 75, 100, 150, 200, 300)
+
+
+class CorpusStats:
+    """Sentence and paragraph lengths across many documents.
+
+    Lengths are kept in compact array('I') buffers, each tagged with the id
+    of the heading section it falls in. No text is kept except the section
+    headings. Summaries use NumPy when it is installed and an exact
+    pure-Python path otherwise. Both give identical numbers, with
+    nearest-rank percentiles.
+    """
+
+    def __init__(self):
+        self.sentence_lengths = array('I')
+        self.sentence_sections = array('I')
+        self.paragraph_lengths = array('I')
+        self.paragraph_sections = array('I')
+        self.sections: List[Tuple[str, str]] = []   # (document, heading)
+
+    def __len__(self) -> int:
+        return len(self.sentence_lengths)
+
+    def start_document(self, name: str):
+        """Open the untitled leading section of a new document."""
+        self.sections.append((name, ""))
+
+    def record(self, doc: Document):
+        """Append a block's sentence and paragraph lengths."""
+        if not self.sections:
+            self.start_document("content")
+        document = self.sections[-1][0]
+
+        # Each heading opens a section; everything from it onward belongs there
+        base = len(self.sections) - 1
+        heading_starts = []
+        for span in doc.paragraphs:
+            if span.heading:
+                heading_starts.append(span.start)
+                title = doc.span_text(span).split('\n', 1)[0].lstrip('#').strip()
+                self.sections.append((document, title[:80]))
+
+        for span in doc.sentences:
+            self.sentence_lengths.append(span.length)
+            self.sentence_sections.append(base + bisect_right(heading_starts, span.start))
+        for span in doc.paragraphs:
+            if not span.heading:
+                self.paragraph_lengths.append(span.length)
+                self.paragraph_sections.append(base + bisect_right(heading_starts, span.start))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sections": self.sections,
+            "sentence_lengths": self.sentence_lengths.tolist(),
+            "sentence_sections": self.sentence_sections.tolist(),
+            "paragraph_lengths": self.paragraph_lengths.tolist(),
+            "paragraph_sections": self.paragraph_sections.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CorpusStats":
+        corpus = cls()
+        corpus.sections = [(document, heading) for document, heading in data["sections"]]
+        for name in ("sentence_lengths", "sentence_sections",
+                     "paragraph_lengths", "paragraph_sections"):
+            getattr(corpus, name).extend(data[name])
+        return corpus
+
+    def extend(self, other: "CorpusStats"):
+        """Append another corpus, e.g. one collected in a worker process."""
+        offset = len(self.sections)
+        self.sections.extend(other.sections)
+        self.sentence_lengths.extend(other.sentence_lengths)
+        self.paragraph_lengths.extend(other.paragraph_lengths)
+        self.sentence_sections.extend(_shift_ids(other.sentence_sections, offset))
+        self.paragraph_sections.extend(_shift_ids(other.paragraph_sections, offset))
+
+    def summary(self, top_sections: int = 5) -> Dict[str, Any]:
+        """Distributions for sentences and paragraphs, plus the sections
+        with the longest average sentences."""
+        sections = [s for s in self.section_distributions() if s["count"] >= 3]
+        sections.sort(key=lambda s: -s["mean"])
+        return {
+            "backend": "numpy" if np is not None else "python",
+            "documents": len({doc for doc, _ in self.sections}),
+            "sections": len(self.sections),
+            "sentences": length_distribution(self.sentence_lengths, SENTENCE_BUCKETS),
+            "paragraphs": length_distribution(self.paragraph_lengths, PARAGRAPH_BUCKETS),
+            "longest_sentence_sections": sections[:top_sections],
+        }
+
+    def section_distributions(self, kind: str = "sentence") -> List[Dict[str, Any]]:
+        """Count, mean, median, 90th percentile and max length per section."""
+        if kind == "sentence":
+            lengths, ids = self.sentence_lengths, self.sentence_sections
+        else:
+            lengths, ids = self.paragraph_lengths, self.paragraph_sections
+
+        rows = []
+        for sid, (count, total, p50, p90, longest) in _grouped_stats(lengths, ids, len(self.sections)):
+            document, heading = self.sections[sid]
+            rows.append({
+                "document": document,
+                "section": heading,
+                "count": count,
+                "mean": round(total / count, 1),
+                "p50": p50,
+                "p90": p90,
+                "max": longest,
+            })
+        return rows
+
+
+def _shift_ids(ids: array, offset: int) -> array:
+    if np is not None:
+        return array('I', (np.frombuffer(ids, dtype=np.uint32) + offset).astype(np.uint32).tobytes())
+    return array('I', [i + offset for i in ids])
+
+
+def _rank(q: int, n: int) -> int:
+    """1-based nearest-rank position of the q-th percentile among n values."""
+    return max(1, (q * n + 99) // 100)
+
+
+def length_distribution(lengths: array, buckets: Tuple[int, ...]) -> Dict[str, Any]:
+    """Mean, spread, percentiles and a bucketed histogram of lengths."""
+    n = len(lengths)
+    if not n:
+        return {"count": 0}
+
+    if np is not None:
+        values = np.frombuffer(lengths, dtype=np.uint32)
+        wide = values.astype(np.uint64)
+        total = int(wide.sum())
+        squares = int((wide * wide).sum())
+        cumulative = np.cumsum(np.bincount(values))
+        ranks = np.array([_rank(q, n) for q in PERCENTILES])
+        points = [int(v) for v in np.searchsorted(cumulative, ranks)]
+        hist = [int(c) for c in np.bincount(np.searchsorted(np.array(buckets), values),
+                                            minlength=len(buckets) + 1)]
+        longest = int(values.max())
+    else:
+        counts = Counter(lengths)
+        total = sum(v * c for v, c in counts.items())
+        squares = sum(v * v * c for v, c in counts.items())
+        points = []
+        seen = 0
+        wanted = iter(_rank(q, n) for q in PERCENTILES)
+        rank = next(wanted)
+        for value in sorted(counts):
+            seen += counts[value]
+            while rank is not None and seen >= rank:
+                points.append(value)
+                rank = next(wanted, None)
+        hist = [0] * (len(buckets) + 1)
+        for value, c in counts.items():
+            hist[bisect_left(buckets, value)] += c
+        longest = max(counts)
+
+    mean = total / n
+    std_dev = ((n * squares - total * total) / (n * n)) ** 0.5
+    labels = [f"<={buckets[0]}"] + [f"{lo + 1}-{hi}" for lo, hi in zip(buckets, buckets[1:])] \
+        + [f">{buckets[-1]}"]
+
+    return {
+        "count": n,
+        "mean": round(mean, 2),
+        "std_dev": round(std_dev, 2),
+        "variation_score": round(min(1.0, std_dev / mean), 2) if mean > 0 else 0,
+        "max": longest,
+        "percentiles": {f"p{q}": v for q, v in zip(PERCENTILES, points)},
+        "histogram": dict(zip(labels, hist)),
+    }
+
+
+def _grouped_stats(lengths: array, ids: array, groups: int) -> Iterator[Tuple[int, Tuple[int, int, int, int, int]]]:
+    """Yield (group, (count, total, p50, p90, max)) for each non-empty group."""
+    if not lengths:
+        return
+    if np is not None:
+        values = np.frombuffer(lengths, dtype=np.uint32)
+        keys = np.frombuffer(ids, dtype=np.uint32)
+        order = np.lexsort((values, keys))
+        ordered = values[order]
+        counts = np.bincount(keys, minlength=groups)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        totals = np.bincount(keys, weights=values, minlength=groups)
+        present = np.nonzero(counts)[0]
+        c = counts[present]
+        p50 = ordered[starts[present] + np.maximum(1, (50 * c + 99) // 100) - 1]
+        p90 = ordered[starts[present] + np.maximum(1, (90 * c + 99) // 100) - 1]
+        top = ordered[ends[present] - 1]
+        for row in zip(present.tolist(), c.tolist(), totals[present].tolist(),
+                       p50.tolist(), p90.tolist(), top.tolist()):
+            yield row[0], (row[1], int(row[2]), row[3], row[4], row[5])
+    else:
+        grouped: Dict[int, List[int]] = {}
+        for value, key in zip(lengths, ids):
+            grouped.setdefault(key, []).append(value)
+        for key in sorted(grouped):
+            values = sorted(grouped[key])
+            n = len(values)
+            yield key, (n, sum(values), values[_rank(50, n) - 1],
+                        values[_rank(90, n) - 1], values[-1])
+
+
+# =============================================================================
+# Result Cache (skip unchanged documents)
+# =============================================================================
+
+RESULT_CACHE_ENV = 'C2C_READABILITY_CACHE'
+# Bump when an analysis change alters reports without changing any rule
+CACHE_FORMAT = 1
+_builtin_ruleset: Optional[str] = None
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def _component_digest(component: Any, fingerprint) -> str:
+    """Digest of `fingerprint()`, stored on the component after the first call."""
+    digest = getattr(component, '_ruleset_digest', None)
+    if digest is None:
+        digest = component._ruleset_digest = _digest(fingerprint())
+    return digest
+
+
+def builtin_ruleset_version() -> str:
+    """Fingerprint of the rules built into this module, including its code."""
+    global _builtin_ruleset
+    if _builtin_ruleset is None:
+        _builtin_ruleset = _digest({
+            "format": CACHE_FORMAT,
+            "code": source_digest(__file__),
+            "definitions": [pattern.pattern for pattern in DEFINITION_PATTERNS]
+                           + [TERM_GAP_PATTERN.pattern, TERM_DEFINED_AFTER.pattern,
+                              TERM_DEFINED_BEFORE.pattern],
+            "passive": PASSIVE_PATTERNS,
+            "passive_exceptions": sorted(PASSIVE_EXCEPTIONS),
+            "profiles": [[a.value, asdict(p)] for a, p in AUDIENCE_PROFILES.items()],
+            "syllables": SYLLABLE_EXCEPTIONS,
+        })
+    return _builtin_ruleset
+
+
+def ruleset_version(syllables: SyllableCounter, phrases: PhraseMatcher,
+                    glossary: JargonGlossary, house_rules: Tuple[Rule, ...] = ()) -> str:
+    """Fingerprint of every rule a report depends on besides the content.
+
+    Covers this module's source, the jargon terms (glossary index included)
+    and definition patterns, hedge and filler phrases (house-style ones
+    included), passive patterns and exceptions, audience profiles, the
+    syllable rules and house rules (by name, version and defining source),
+    so editing any of them changes every cache key. Each component keeps
+    its own digest, so this is cheap to call per document.
+    """
+    return _digest([
+        builtin_ruleset_version(),
+        _component_digest(glossary, glossary.fingerprint),
+        _component_digest(phrases, lambda: [list(phrases.hedges.items()),
+                                            list(phrases.fillers.items())]),
+        _component_digest(syllables, lambda: syllables.lexicon.fingerprint()
+                          if syllables.lexicon else None),
+        [_component_digest(rule, lambda: rule_fingerprint(rule)) for rule in house_rules],
+    ])
+
+
+class ResultCache:
+    """Reports on disk, keyed by content hash, audience and ruleset version.
+
+    Each entry is a small JSON file with the report and the document's
+    sentence and paragraph lengths, so a hit also feeds batch corpus
+    statistics. A changed rule changes every key, so stale entries are
+    simply never read again; delete the directory to reclaim the space.
+
+        cache = ResultCache(Path(".readability-cache"))
+        report = ReadabilityAnalyzer(Audience.BEGINNER, cache=cache).analyze(text)
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, content: str, audience: Audience, ruleset: str) -> str:
+        digest = hashlib.sha256(f"{ruleset}\0{audience.value}\0".encode('utf-8'))
+        digest.update(content.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key[2:]}.json"
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], CorpusStats]]:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding='utf-8'))
+            cached = entry["report"], CorpusStats.from_dict(entry["corpus"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def put(self, key: str, report: Dict[str, Any], corpus: CorpusStats):
+        """Store an entry; a cache that cannot be written is skipped."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent workers never read half an entry
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"report": report, "corpus": corpus.to_dict()}),
+                           encoding='utf-8')
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+_default_result_cache: Optional[ResultCache] = None
+
+
+def default_result_cache() -> Optional[ResultCache]:
+    """Process-wide cache in $C2C_READABILITY_CACHE, or None if unset."""
+    global _default_result_cache
+    directory = os.environ.get(RESULT_CACHE_ENV)
+    if not directory:
+        return None
+    if _default_result_cache is None or _default_result_cache.directory != Path(directory):
+        _default_result_cache = ResultCache(Path(directory))
+    return _default_result_cache
+
+
+# =============================================================================
+# Git Changes (pre-commit and CI gate)
+# =============================================================================
+
+GIT_TIMEOUT = 30
+
+
+class GitError(Exception):
+    """A git command failed (not a repository, unknown revision, ...)."""
+
+
+def _git(args: List[str], cwd: Path, stdin: Optional[bytes] = None) -> bytes:
+    try:
+        result = subprocess.run(['git', *args], cwd=cwd, input=stdin,
+                                capture_output=True, timeout=GIT_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise GitError(f"git {args[0]}: {e}")
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise GitError(message[-1] if message else f"git {args[0]} failed")
+    return result.stdout
+
+
+def changed_markdown_files(cwd: Path, staged: bool = False, rev: Optional[str] = None,
+                           pathspecs: Iterable[str] = ()) -> Tuple[Path, List[str]]:
+    """Markdown files added, copied, modified or renamed, for a gate run.
+
+    With `staged`, compares the index with HEAD (what a commit would
+    record); otherwise compares the worktree with `rev`, or whatever
+    `rev` names when it is a range such as `origin/main...HEAD`.
+    Returns the repository root and the paths relative to it; deleted
+    files are left out.
+    """
+    root = Path(_git(['rev-parse', '--show-toplevel'], cwd).decode('utf-8').strip())
+    args = ['diff', '--name-only', '-z', '--no-renames', '--diff-filter=ACM']
+    if staged:
+        args.append('--cached')
+    elif rev:
+        args.append(rev)
+    args.append('--')
+    # Pathspecs from the command line are relative to where we were run
+    args.extend(os.path.relpath(Path(cwd, spec).resolve(), root) for spec in pathspecs)
+    names = _git(args, root).decode('utf-8', 'surrogateescape').split('\0')
+    return root, sorted(n for n in names if n and n.lower().endswith(MARKDOWN_EXTENSIONS))
+
+
+def read_revision_file(path: Path, rev: str) -> str:
+    """Content of a worktree file as it was at `rev`."""
+    data = _git(['show', f"{rev}:./{path.name}"], path.resolve().parent)
+    return data.decode('utf-8', 'replace')
+
+
+def read_index_blobs(root: Path, names: List[str]) -> Dict[str, str]:
+    """Staged content of each path, read with one `git cat-file --batch` call.
+
+    Partially staged files are checked as they will be committed, not as
+    they are in the worktree.
+    """
+    if not names:
+        return {}
+    request = ''.join(f":{name}\n" for name in names).encode('utf-8', 'surrogateescape')
+    data = _git(['cat-file', '--batch'], root, stdin=request)
+    contents = {}
+    pos = 0
+    for name in names:
+        end = data.index(b'\n', pos)
+        header = data[pos:end].split()
+        pos = end + 1
+        if len(header) != 3:  # "<name> missing"
+            continue
+        size = int(header[2])
+        contents[name] = data[pos:pos + size].decode('utf-8', 'replace')
+        pos += size + 1  # trailing newline
+    return contents
+
+
 # =============================================================================
 # CLI Interface
 # =============================================================================
 
+def _at_line(finding: Dict[str, Any]) -> str:
+    return f" (line {finding['line']})" if "line" in finding else ""
+
+
+def print_profile(profile: Dict[str, Any], limit: int = 12):
+    """Print the slowest analysis stages of a profile."""
+    stages = sorted(profile["stages"].items(), key=lambda item: -item[1]["seconds"])
+    total = profile["total_seconds"] or 1
+    print(f"\n⏱  PROFILE: {profile['total_seconds'] * 1000:.1f} ms in analysis stages")
+    print(f"   {'stage':<28}{'ms':>9}{'share':>8}{'regex':>9}{'tokens':>10}")
+    for stage, timing in stages[:limit]:
+        print(f"   {stage:<28}{timing['seconds'] * 1000:>9.2f}{timing['seconds'] / total:>8.0%}"
+              f"{timing['regex_evaluations']:>9}{timing['tokens']:>10}")
+
+
 def print_report(results: Dict, show_suggestions: bool = True):
     """Print a formatted report."""
     print("\n" + "=" * 70)
@@ -1141,11 +3825,17 @@ def print_report(results: Dict, show_suggestions: bool = True):
     if jargon.get("undefined_jargon"):
         print("   Terms needing definition:")
         for term in jargon["undefined_jargon"][:3]:
-            print(f"      • {term['term']}")
+            print(f"      • {term['term']}{_at_line(term)}")
+    if jargon.get("defined_after_use"):
+        print("   Terms defined after first use:")
+        for term in jargon["defined_after_use"][:3]:
+            print(f"      • {term['term']}{_at_line(term)}")
 
     # Passive voice
     passive = results.get("passive_voice", {})
     print(f"\nPASSIVE VOICE: {passive.get('passive_percentage', 0)}% ({passive.get('assessment', 'N/A')})")
+    for example in passive.get("examples", [])[:3]:
+        print(f"      • {example['match']}{_at_line(example)}")
 
     # Code analysis
     code = results.get("code_analysis", {})
@@ -1153,6 +3843,13 @@ def print_report(results: Dict, show_suggestions: bool = True):
         print(f"\nCODE: {code['code_blocks']} blocks")
         print(f"   {code.get('ratio_assessment', '')}")
 
+    # House rules
+    for name, rule in results.get("house_rules", {}).items():
+        if rule["count"]:
+            print(f"\nRULE {name}: {rule['count']} hits")
+            for finding in rule["findings"][:3]:
+                print(f"      • {finding['message']}{_at_line(finding)}")
+
     # Suggestions
     if show_suggestions and results.get("suggestions"):
         print("\nSUGGESTIONS (by priority):")
@@ -1162,6 +3859,9 @@ def print_report(results: Dict, show_suggestions: bool = True):
             print(f"      Issue: {sug['issue']}")
             print(f"      Fix: {sug['suggestion']}")
 
+    if "profile" in results:
+        print_profile(results["profile"])
+
     # Validation result
     print("\n" + "-" * 70)
     if results.get("validation_passed"):
@@ -1172,40 +3872,471 @@ def print_report(results: Dict, show_suggestions: bool = True):
     print("=" * 70 + "\n")
 
 
+MARKDOWN_EXTENSIONS = ('.md', '.markdown', '.mdx')
+
+
+def collect_input_files(specs: List[str]) -> List[Path]:
+    """Expand file, directory and glob arguments into a sorted file list."""
+    files = set()
+    for spec in specs:
+        path = Path(spec)
+        if glob.has_magic(spec):
+            files.update(Path(p) for p in glob.glob(spec, recursive=True) if Path(p).is_file())
+        elif path.is_dir():
+            files.update(p for p in path.rglob('*')
+                         if p.is_file() and p.suffix.lower() in MARKDOWN_EXTENSIONS)
+        elif path.is_file():
+            files.add(path)
+    return sorted(files)
+
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 8
+
+
+def _analyze_file(job: Tuple[str, str, Optional[str]]) -> Tuple[Dict[str, Any], CorpusStats]:
+    """Process-pool worker: analyze one file for one audience.
+
+    The content is read from disk unless the job carries it (staged blobs).
+    """
+    file_path, audience_value, content = job
+    corpus = CorpusStats()
+    if content is None:
+        try:
+            content = Path(file_path).read_text(encoding='utf-8')
+        except Exception as e:
+            return {"file_name": file_path, "error": f"Error reading file: {e}"}, corpus
+    analyzer = ReadabilityAnalyzer(Audience(audience_value), cache=default_result_cache(),
+                                   profiling=default_profiling())
+    report = analyzer.analyze(content, file_path, corpus)
+    return report, corpus
+
+
+def analyze_files(files: List[Path], audience: Audience,
+                  workers: Optional[int] = None,
+                  corpus: Optional[CorpusStats] = None,
+                  contents: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """Analyze many files in a process pool, preserving input order.
+
+    Sentence and paragraph lengths are appended to `corpus` if given.
+    Files named in `contents` are analyzed from that text instead of disk.
+    Small batches run in this process unless `workers` asks for a pool.
+    """
+    contents = contents or {}
+    jobs = [(str(f), audience.value, contents.get(str(f))) for f in files]
+    if workers == 1 or len(jobs) <= 1 or (workers is None and len(jobs) < PARALLEL_MIN_FILES):
+        return _gather(map(_analyze_file, jobs), corpus)
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _gather(pool.map(_analyze_file, jobs, chunksize=chunksize), corpus)
+
+
+def _gather(outputs: Iterable[Tuple[Dict[str, Any], CorpusStats]],
+            corpus: Optional[CorpusStats]) -> List[Dict[str, Any]]:
+    results = []
+    for report, part in outputs:
+        results.append(report)
+        if corpus is not None:
+            corpus.extend(part)
+    return results
+
+
+def aggregate_results(results: List[Dict[str, Any]],
+                      corpus: Optional[CorpusStats] = None) -> Dict[str, Any]:
+    """Summarize per-file results; averages are weighted by word count."""
+    analyzed = [r for r in results if "error" not in r]
+    passed = [r for r in analyzed if r.get("validation_passed")]
+    scored = [r for r in analyzed if "error" not in r["readability_scores"]]
+    total_words = sum(r["readability_scores"]["word_count"] for r in scored)
+
+    def weighted(get) -> float:
+        if not total_words:
+            return 0.0
+        return round(sum(get(r) * r["readability_scores"]["word_count"]
+                         for r in scored) / total_words, 2)
+
+    aggregate = {
+        "files": len(results),
+        "analyzed": len(analyzed),
+        "errors": len(results) - len(analyzed),
+        "passed": len(passed),
+        "failed": len(results) - len(passed),
+        "total_words": total_words,
+        "avg_flesch_reading_ease": weighted(lambda r: r["readability_scores"]["flesch_reading_ease"]),
+        "avg_flesch_kincaid_grade": weighted(lambda r: r["readability_scores"]["flesch_kincaid_grade"]),
+        "avg_passive_percentage": weighted(lambda r: r["passive_voice"]["passive_percentage"]),
+        "avg_jargon_density_percentage": weighted(
+            lambda r: r["jargon_analysis"]["jargon_density_percentage"]),
+        "failing_files": [r["file_name"] for r in results if not r.get("validation_passed")],
+        "corpus": corpus.summary() if corpus else {},
+    }
+
+    profiled = [r["profile"] for r in analyzed if "profile" in r]
+    if profiled:
+        profiler = RuleProfiler()
+        for profile in profiled:
+            profiler.merge(profile)
+        aggregate["profile"] = profiler.to_dict()
+    return aggregate
+
+
+def print_batch_report(results: List[Dict[str, Any]], aggregate: Dict[str, Any], audience: Audience):
+    """Print one line per file followed by the aggregate."""
+    print("\n" + "=" * 70)
+    print(f"READABILITY BATCH: {aggregate['files']} files")
+    print(f"Target Audience: {audience.value.upper()}")
+    print("=" * 70 + "\n")
+
+    for r in results:
+        if "error" in r:
+            print(f"ERROR {r['file_name']}: {r['error']}")
+            continue
+        status = "PASS" if r.get("validation_passed") else "FAIL"
+        grade = r["readability_scores"].get("flesch_kincaid_grade", "N/A")
+        print(f"{status}  {r['file_name']}  (score {r['assessment']['score']}%, grade {grade})")
+
+    print("\n" + "-" * 70)
+    print(f"Passed: {aggregate['passed']}/{aggregate['files']}  "
+          f"Errors: {aggregate['errors']}  Words: {aggregate['total_words']}")
+    print(f"Avg Flesch-Kincaid Grade: {aggregate['avg_flesch_kincaid_grade']}  "
+          f"Avg Reading Ease: {aggregate['avg_flesch_reading_ease']}")
+
+    sentences = aggregate.get("corpus", {}).get("sentences", {})
+    if sentences.get("count"):
+        pct = sentences["percentiles"]
+        print(f"Sentence length: mean {sentences['mean']}, median {pct['p50']}, "
+              f"p90 {pct['p90']}, max {sentences['max']} "
+              f"(variation {sentences['variation_score']})")
+        for section in aggregate["corpus"]["longest_sentence_sections"][:3]:
+            title = section["section"] or "(intro)"
+            print(f"   Long sentences: {section['document']} > {title} "
+                  f"(mean {section['mean']}, p90 {section['p90']})")
+    if "profile" in aggregate:
+        print_profile(aggregate["profile"])
+    print("=" * 70 + "\n")
+
+
+def print_delta_report(results: Dict[str, Any]):
+    """Print how readability moved between two versions."""
+    print("\n" + "=" * 70)
+    print(f"READABILITY DELTA: {results['file_name']}")
+    print(f"Target Audience: {results['audience'].upper()}")
+    print("=" * 70)
+
+    blocks = results["paragraphs"]
+    print(f"\nParagraph blocks: {blocks['modified']} modified, {blocks['added']} added, "
+          f"{blocks['removed']} removed, {blocks['unchanged']} unchanged")
+    for changed in blocks["changed_ranges"][:5]:
+        lines = changed["line"] if changed["line"] == changed["end_line"] else \
+            f"{changed['line']}-{changed['end_line']}"
+        print(f"   {changed['change']}: lines {lines}")
+
+    print(f"\n{'metric':<28}{'before':>10}{'after':>10}{'change':>10}")
+    for name, delta in results["delta"].items():
+        before, after = results["before"][name], results["after"][name]
+        change = f"{delta:+g}" if delta is not None else "-"
+        print(f"{name:<28}{str(before if before is not None else '-'):>10}"
+              f"{str(after if after is not None else '-'):>10}{change:>10}")
+
+    if results["new_undefined_terms"]:
+        print("\n⚠️  New undefined terms:")
+        for term in results["new_undefined_terms"]:
+            print(f"   - {term['term']}{_at_line(term)}")
+    if results["resolved_undefined_terms"]:
+        print(f"\n✓ Now defined: {', '.join(results['resolved_undefined_terms'])}")
+
+    print("\n" + "-" * 70)
+    before = "passed" if results["passed_before"] else "needed revision"
+    if results["validation_passed"]:
+        print(f"✅ New version PASSES validation (old version {before})")
+    else:
+        print(f"❌ New version NEEDS REVISION (old version {before})")
+    print("=" * 70 + "\n")
+
+
+def print_audience_ranking(results: Dict[str, Any]):
+    """Print how well one document fits each audience, best first."""
+    print("\n" + "=" * 70)
+    print(f"AUDIENCE FIT: {results['file_name']}")
+    print("=" * 70)
+    print(f"\nBest fit: {results['best_fit']}\n")
+    for rank, entry in enumerate(results["ranking"], 1):
+        status = "PASS" if entry["validation_passed"] else "FAIL"
+        grade = entry["flesch_kincaid_grade"]
+        grade_text = f"grade {grade} (max {entry['max_grade']})" if grade is not None else "no prose"
+        print(f"  {rank}. {entry['audience']:<13} {status}  score {entry['score']:>5}  {grade_text}")
+        for issue in entry["issues"][:3]:
+            print(f"        - {issue}")
+    print("\n" + "=" * 70 + "\n")
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
-        print("Usage: python analyze_readability.py /path/to/file.md [options]")
+        print("Usage: python analyze_readability.py PATH [PATH ...] [options]")
+        print("\nPATH may be a file, a directory (markdown files are found recursively)")
+        print("or a glob such as 'docs/**/*.md'.")
         print("\nOptions:")
         print("  --audience LEVEL   Set target audience (beginner/intermediate/expert/mixed)")
+        print("                     or 'all' to rank every audience for one file")
         print("  --json             Output as JSON")
         print("  --validate         Only output pass/fail status")
         print("  --no-suggestions   Hide improvement suggestions")
+        print("  --workers N        Worker processes for batches (default: CPU count)")
+        print("  --stream           Read a single file (or '-' for stdin) in chunks,")
+        print("                     in memory bounded by the longest markdown block")
+        print("  --syllable-lexicon FILE")
+        print("                     Syllable index built with --build-syllable-lexicon")
+        print("                     (default: $C2C_SYLLABLE_LEXICON)")
+        print("  --jargon-index FILE")
+        print("                     Glossary index built with --build-jargon-index")
+        print("                     (default: $C2C_JARGON_INDEX)")
+        print("  --phrases FILE     House-style hedge/filler phrases, one per line as")
+        print("                     'hedge|filler<TAB>phrase<TAB>category|replacement'")
+        print("                     (default: $C2C_HOUSE_PHRASES)")
+        print("  --rules FILE       House-style rules: a Python file whose RULES list holds")
+        print("                     Rule instances (default: $C2C_READABILITY_RULES)")
+        print("  --cache DIR        Reuse reports of unchanged files from DIR")
+        print("                     (default: $C2C_READABILITY_CACHE)")
+        print("  --profile          Add per-stage time, regex and token counts to reports")
+        print("                     (bypasses --cache; default: $C2C_READABILITY_PROFILE)")
+        print("  --diff OLD NEW     Report how readability moved from OLD to NEW")
+        print("  --rev REV          With one FILE, compare it against its version at REV")
+        print("  --staged           Check only staged markdown files, as staged")
+        print("                     (for a pre-commit hook)")
+        print("  --changed [REV]    Check only markdown files changed since REV (default")
+        print("                     HEAD), or in a range such as origin/main...HEAD (for CI)")
+        print("  --build-syllable-lexicon CMUDICT OUT")
+        print("                     Convert a CMUdict-format file into a syllable index")
+        print("  --build-jargon-index GLOSSARY OUT")
+        print("                     Convert a glossary (TSV or .csv: term, category,")
+        print("                     complexity, requires definition, domains) into an index")
         print("\nContext-aware readability analysis for technical writing.")
         print("Adjusts expectations based on target audience.")
         sys.exit(1)
 
-    file_path = sys.argv[1]
+    if "--build-syllable-lexicon" in sys.argv:
+        idx = sys.argv.index("--build-syllable-lexicon")
+        if idx + 2 >= len(sys.argv):
+            print("Usage: --build-syllable-lexicon CMUDICT OUT")
+            sys.exit(1)
+        source, dest = Path(sys.argv[idx + 1]), Path(sys.argv[idx + 2])
+        count = build_syllable_lexicon(source, dest)
+        print(f"Wrote {count} entries to {dest}")
+        return
+
+    if "--build-jargon-index" in sys.argv:
+        idx = sys.argv.index("--build-jargon-index")
+        if idx + 2 >= len(sys.argv):
+            print("Usage: --build-jargon-index GLOSSARY OUT")
+            sys.exit(1)
+        source, dest = Path(sys.argv[idx + 1]), Path(sys.argv[idx + 2])
+        try:
+            count = build_jargon_index([source], dest)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"Wrote {count} terms to {dest}")
+        return
 
-    # Parse audience
+    # Set through the environment so batch worker processes pick it up too
+    if "--syllable-lexicon" in sys.argv:
+        idx = sys.argv.index("--syllable-lexicon")
+        if idx + 1 < len(sys.argv):
+            os.environ[SYLLABLE_LEXICON_ENV] = sys.argv[idx + 1]
+
+    if "--jargon-index" in sys.argv:
+        idx = sys.argv.index("--jargon-index")
+        if idx + 1 < len(sys.argv):
+            os.environ[JARGON_INDEX_ENV] = sys.argv[idx + 1]
+
+    if "--phrases" in sys.argv:
+        idx = sys.argv.index("--phrases")
+        if idx + 1 < len(sys.argv):
+            os.environ[HOUSE_PHRASES_ENV] = sys.argv[idx + 1]
+
+    if "--profile" in sys.argv:
+        os.environ[PROFILE_ENV] = '1'
+
+    if "--rules" in sys.argv:
+        idx = sys.argv.index("--rules")
+        if idx + 1 < len(sys.argv):
+            os.environ[RULES_ENV] = sys.argv[idx + 1]
+
+    if "--cache" in sys.argv:
+        idx = sys.argv.index("--cache")
+        if idx + 1 < len(sys.argv):
+            os.environ[RESULT_CACHE_ENV] = sys.argv[idx + 1]
+
+    # Positional arguments are paths; skip option values
+    value_options = {"--audience", "--workers", "--syllable-lexicon", "--phrases", "--cache",
+                     "--changed", "--jargon-index", "--rev", "--rules"}
+    specs = []
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] in value_options:
+            i += 1 if args[i] == "--changed" and not changed_has_rev(args, i) else 2
+            continue
+        if not args[i].startswith("--"):
+            specs.append(args[i])
+        i += 1
+
+    # Parse audience; None means every audience
     audience = Audience.INTERMEDIATE
     if "--audience" in sys.argv:
         idx = sys.argv.index("--audience")
         if idx + 1 < len(sys.argv):
             audience_str = sys.argv[idx + 1].lower()
             try:
-                audience = Audience(audience_str)
+                audience = None if audience_str == "all" else Audience(audience_str)
             except ValueError:
                 print(f"Invalid audience: {audience_str}")
-                print("Valid options: beginner, intermediate, expert, mixed")
+                print("Valid options: beginner, intermediate, expert, mixed, all")
                 sys.exit(1)
 
-    # Read file
-    path = Path(file_path)
-    if not path.exists():
-        print(f"Error: File not found: {file_path}")
+    workers = None
+    if "--workers" in sys.argv:
+        idx = sys.argv.index("--workers")
+        if idx + 1 < len(sys.argv) and sys.argv[idx + 1].isdigit():
+            workers = max(1, int(sys.argv[idx + 1]))
+
+    if "--diff" in sys.argv or "--rev" in sys.argv:
+        if audience is None:
+            print("Error: --audience all cannot be combined with --diff or --rev")
+            sys.exit(1)
+        compare_file_versions(specs, audience)
+        return
+
+    if "--staged" in sys.argv or "--changed" in sys.argv:
+        if audience is None:
+            print("Error: --audience all takes a single file")
+            sys.exit(1)
+        analyze_changed_files(specs, audience, workers)
+        return
+
+    if specs == ["-"] or (len(specs) == 1 and "--stream" in sys.argv and Path(specs[0]).is_file()):
+        stream_single_file(specs[0], audience)
+        return
+
+    if len(specs) == 1 and Path(specs[0]).is_file():
+        analyze_single_file(Path(specs[0]), audience)
+        return
+
+    if len(specs) == 1 and not Path(specs[0]).exists() and not glob.has_magic(specs[0]):
+        print(f"Error: File not found: {specs[0]}")
         sys.exit(1)
 
+    files = collect_input_files(specs)
+    if not files:
+        print(f"Error: No files found: {' '.join(specs)}")
+        sys.exit(1)
+
+    if audience is None:
+        print("Error: --audience all takes a single file")
+        sys.exit(1)
+
+    corpus = CorpusStats()
+    results = analyze_files(files, audience, workers, corpus)
+    output_batch_report(results, aggregate_results(results, corpus), audience)
+
+
+def changed_has_rev(args: List[str], idx: int) -> bool:
+    """Whether `--changed` at args[idx] is followed by a revision rather
+    than another option (or nothing), in which case it means HEAD."""
+    return idx + 1 < len(args) and not args[idx + 1].startswith("-")
+
+
+def analyze_changed_files(specs: List[str], audience: Audience, workers: Optional[int]):
+    """Analyze only the markdown files git reports as staged or changed.
+
+    Paths on the command line narrow the check to those files or
+    directories. Nothing to check counts as a pass.
+    """
+    staged = "--staged" in sys.argv
+    rev = None
+    if not staged:
+        idx = sys.argv.index("--changed")
+        rev = sys.argv[idx + 1] if changed_has_rev(sys.argv, idx) else "HEAD"
+
+    try:
+        root, names = changed_markdown_files(Path.cwd(), staged, rev, specs)
+        blobs = read_index_blobs(root, names) if staged else {}
+    except GitError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # Report paths relative to where the hook or CI job runs
+    files = [Path(os.path.relpath(root / name)) for name in names]
+    contents = {str(f): blobs[name] for f, name in zip(files, names) if name in blobs}
+    if staged:
+        files = [f for f in files if str(f) in contents]
+    if not files and "--json" not in sys.argv:
+        print("No changed markdown files")
+        return
+
+    corpus = CorpusStats()
+    results = analyze_files(files, audience, workers, corpus, contents)
+    output_batch_report(results, aggregate_results(results, corpus), audience)
+
+
+def output_batch_report(results: List[Dict[str, Any]], aggregate: Dict[str, Any], audience: Audience):
+    """Print batch results in the selected format; --validate sets the exit status."""
+    if "--json" in sys.argv:
+        print(json.dumps({"files": results, "aggregate": aggregate}, indent=2, default=str))
+    elif "--validate" in sys.argv:
+        for r in results:
+            status = "PASS" if r.get("validation_passed") else "FAIL"
+            print(f"{status}: {r['file_name']}")
+        print(f"{aggregate['passed']}/{aggregate['files']} files suitable for {audience.value} audience")
+    else:
+        print_batch_report(results, aggregate, audience)
+
+    if "--validate" in sys.argv:
+        sys.exit(0 if aggregate["failed"] == 0 else 1)
+
+
+def compare_file_versions(specs: List[str], audience: Audience):
+    """--diff OLD NEW, or --rev REV FILE against the file's version at REV."""
+    try:
+        if "--diff" in sys.argv:
+            idx = sys.argv.index("--diff")
+            if idx + 2 >= len(sys.argv):
+                print("Usage: --diff OLD NEW")
+                sys.exit(1)
+            path = Path(sys.argv[idx + 2])
+            old_content = Path(sys.argv[idx + 1]).read_text(encoding='utf-8')
+        else:
+            idx = sys.argv.index("--rev")
+            if idx + 1 >= len(sys.argv) or len(specs) != 1:
+                print("Usage: --rev REV FILE")
+                sys.exit(1)
+            path = Path(specs[0])
+            old_content = read_revision_file(path, sys.argv[idx + 1])
+        new_content = path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError, GitError) as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
+    results = compare_versions(old_content, new_content, audience, path.name)
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2, default=str))
+    elif "--validate" in sys.argv:
+        status = "PASS" if results["validation_passed"] else "FAIL"
+        grade = results["delta"]["flesch_kincaid_grade"]
+        change = f" (grade {grade:+g})" if grade is not None else ""
+        print(f"{status}: {path.name} for {audience.value} audience{change}")
+    else:
+        print_delta_report(results)
+
+    if "--validate" in sys.argv:
+        sys.exit(0 if results["validation_passed"] else 1)
+
+
+def analyze_single_file(path: Path, audience: Optional[Audience]):
+    """Analyze and report on a single file."""
     try:
         content = path.read_text(encoding='utf-8')
     except Exception as e:
@@ -1213,12 +4344,41 @@ def main():
         sys.exit(1)
 
     # Analyze
-    analyzer = ReadabilityAnalyzer(audience)
-    results = analyzer.analyze(content, path.name)
+    if audience is None:
+        results = analyze_all_audiences(content, path.name)
+    else:
+        analyzer = ReadabilityAnalyzer(audience, cache=default_result_cache(),
+                                       profiling=default_profiling())
+        results = analyzer.analyze(content, path.name)
+    output_single_report(results, audience)
+
+
+def stream_single_file(spec: str, audience: Optional[Audience]):
+    """Analyze one file, or stdin for '-', without reading it whole."""
+    if spec == "-":
+        results = analyze_stream(sys.stdin, audience, "stdin")
+    else:
+        path = Path(spec)
+        try:
+            with open(path, encoding='utf-8') as f:
+                results = analyze_stream(f, audience, path.name)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error reading file: {e}")
+            sys.exit(1)
+    output_single_report(results, audience)
+
 
-    # Output
+def output_single_report(results: Dict[str, Any], audience: Optional[Audience]):
+    """Print one report in the format selected on the command line."""
     if "--json" in sys.argv:
         print(json.dumps(results, indent=2, default=str))
+    elif audience is None:
+        best = results["ranking"][0]
+        if "--validate" in sys.argv:
+            status = "PASS" if best["validation_passed"] else "FAIL"
+            print(f"{status}: Best fit is {best['audience']} audience (score {best['score']})")
+            sys.exit(0 if best["validation_passed"] else 1)
+        print_audience_ranking(results)
     elif "--validate" in sys.argv:
         if results.get("validation_passed"):
             print(f"PASS: Content suitable for {audience.value} audience")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Readability Analyzer Throughput Benchmark
+
+Measures how fast analyze_readability.py processes markdown, per analysis
+stage and end to end, in MB/s. Fixtures are the skill's own markdown
+(references/, examples/, assets/templates/) plus synthetic documents made
+by repeating that corpus up to a target size.
+
+Usage:
+    python benchmark_readability.py
+    python benchmark_readability.py --sizes 1,8 --repeat 5
+    python benchmark_readability.py --output results.json
+    python benchmark_readability.py --compare results.json --tolerance 0.2
+
+Output:
+    - Table of MB/s per stage and fixture
+    - Optional JSON results file for regression comparison
+    - With --compare, exit status 1 if any stage is slower than the
+      baseline by more than the tolerance
+"""
+
+import sys
+import json
+import time
+import platform
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from analyze_readability import (  # noqa: E402
+    Audience,
+    CODE_PLACEHOLDER_PATTERN,
+    Document,
+    ProseStats,
+    ReadabilityAnalyzer,
+    SyllableCounter,
+    split_blocks,
+)
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+CORPUS_DIRS = ("references", "examples", "assets/templates")
+RESULTS_VERSION = 1
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def load_corpus() -> List[Tuple[str, str]]:
+    """(relative path, content) for every markdown file in the corpus dirs."""
+    files = []
+    for name in CORPUS_DIRS:
+        for path in sorted((SKILL_DIR / name).rglob("*.md")):
+            files.append((str(path.relative_to(SKILL_DIR)), path.read_text(encoding="utf-8")))
+    return files
+
+
+def synthetic_document(corpus: List[Tuple[str, str]], megabytes: float) -> str:
+    """Repeat the corpus, file by file, until it reaches `megabytes`."""
+    target = int(megabytes * 1024 * 1024)
+    parts = []
+    size = 0
+    while size < target:
+        for _, content in corpus:
+            parts.append(content)
+            size += len(content.encode("utf-8"))
+            if size >= target:
+                break
+    return "\n\n".join(parts)
+
+
+def build_fixtures(sizes: List[float]) -> Dict[str, List[str]]:
+    corpus = load_corpus()
+    fixtures = {"corpus": [content for _, content in corpus]}
+    for mb in sizes:
+        fixtures[f"synthetic-{mb:g}mb"] = [synthetic_document(corpus, mb)]
+    return fixtures
+
+
+# =============================================================================
+# Stages
+# =============================================================================
+
+def fresh_analyzer() -> ReadabilityAnalyzer:
+    """Analyzer with a cold syllable memo, so repeats do not share it."""
+    return ReadabilityAnalyzer(Audience.INTERMEDIATE, syllables=SyllableCounter())
+
+
+def prepare(documents: List[str]) -> List[Dict[str, Any]]:
+    """Precompute each stage's input so stages can be timed in isolation."""
+    analyzer = fresh_analyzer()
+    prepared = []
+    for content in documents:
+        prose, markdown = analyzer._separate_code_and_prose(content)
+        text = CODE_PLACEHOLDER_PATTERN.sub('', prose)
+        blocks = [text[start:end] for start, end in split_blocks(text)]
+        stats, markup = analyzer.collect(content)
+        prepared.append({
+            "content": content,
+            "prose": prose,
+            "markdown": markdown,
+            "blocks": blocks,
+            "docs": [Document.parse(block) for block in blocks],
+            "stats": stats,
+            "markup": markup,
+        })
+    return prepared
+
+
+def stage_functions(prepared: List[Dict[str, Any]]) -> Dict[str, Callable[[], None]]:
+    """Name -> callable running that stage over every prepared document."""
+    def separate():
+        analyzer = fresh_analyzer()
+        for item in prepared:
+            analyzer._separate_code_and_prose(item["content"])
+
+    def tokenize():
+        for item in prepared:
+            for block in item["blocks"]:
+                Document.parse(block)
+
+    def rule(name: str):
+        def run():
+            engine = fresh_analyzer().engine.only(name)
+            for item in prepared:
+                for doc in item["docs"]:
+                    engine.collect(doc, ProseStats())
+        return run
+
+    def rules():
+        engine = fresh_analyzer().engine
+        for item in prepared:
+            for doc in item["docs"]:
+                engine.collect(doc, ProseStats())
+
+    def markup():
+        analyzer = fresh_analyzer()
+        for item in prepared:
+            analyzer._collect_markup(item["content"], item["prose"], item["markdown"])
+
+    def report():
+        analyzer = fresh_analyzer()
+        for item in prepared:
+            analyzer._report(item["stats"], item["markup"], "bench")
+
+    def end_to_end():
+        analyzer = fresh_analyzer()
+        for item in prepared:
+            analyzer.analyze(item["content"], "bench")
+
+    stages = {"separate": separate, "tokenize": tokenize}
+    for engine_rule in fresh_analyzer().engine.prose_rules:
+        stages[f"rule:{engine_rule.name}"] = rule(engine_rule.name)
+    stages["rules"] = rules
+    stages["_collect_markup"] = markup
+    stages["_report"] = report
+    stages["end_to_end"] = end_to_end
+    return stages
+
+
+def best_time(fn: Callable[[], None], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes: List[float], repeat: int) -> Dict[str, Any]:
+    results = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "fixtures": {},
+    }
+    for name, documents in build_fixtures(sizes).items():
+        size = sum(len(d.encode("utf-8")) for d in documents)
+        prepared = prepare(documents)
+        stages = {}
+        for stage, fn in stage_functions(prepared).items():
+            seconds = best_time(fn, repeat)
+            stages[stage] = {
+                "seconds": round(seconds, 6),
+                "mb_per_s": round(size / (1024 * 1024) / seconds, 3) if seconds else None,
+            }
+        results["fixtures"][name] = {"documents": len(documents), "bytes": size, "stages": stages}
+    return results
+
+
+# =============================================================================
+# Reporting
+# =============================================================================
+
+def print_results(results: Dict[str, Any]):
+    fixtures = results["fixtures"]
+    names = list(fixtures)
+    stages = list(next(iter(fixtures.values()))["stages"])
+
+    print("\n" + "=" * 70)
+    print(f"READABILITY THROUGHPUT (MB/s, best of {results['repeat']}, "
+          f"Python {results['python']})")
+    print("=" * 70)
+    print(f"{'stage':<20}" + "".join(f"{n:>16}" for n in names))
+    print(f"{'(size)':<20}" + "".join(
+        f"{fixtures[n]['bytes'] / 1024:>14.0f}KB" for n in names))
+    for stage in stages:
+        row = "".join(f"{fixtures[n]['stages'][stage]['mb_per_s']:>16.2f}" for n in names)
+        print(f"{stage:<20}{row}")
+    print("=" * 70 + "\n")
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Stages whose throughput fell more than `tolerance` below the baseline."""
+    regressions = []
+    for name, fixture in results["fixtures"].items():
+        base_fixture = baseline.get("fixtures", {}).get(name)
+        if not base_fixture:
+            continue
+        for stage, timing in fixture["stages"].items():
+            base = base_fixture["stages"].get(stage)
+            if not base or not base["mb_per_s"] or not timing["mb_per_s"]:
+                continue
+            change = timing["mb_per_s"] / base["mb_per_s"] - 1
+            if change < -tolerance:
+                regressions.append(f"{name} {stage}: {base['mb_per_s']:.2f} -> "
+                                   f"{timing['mb_per_s']:.2f} MB/s ({change:+.0%})")
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print("Usage: python benchmark_readability.py [options]")
+        print("\nOptions:")
+        print("  --sizes MB[,MB]    Synthetic document sizes in MB (default: 1,4)")
+        print("  --repeat N         Runs per stage; the fastest counts (default: 3)")
+        print("  --output FILE      Write results as JSON")
+        print("  --compare FILE     Compare with an earlier results file")
+        print("  --tolerance F      Allowed slowdown before failing --compare (default: 0.15)")
+        sys.exit(0)
+
+    def option(name: str, default: str) -> str:
+        if name in sys.argv:
+            idx = sys.argv.index(name)
+            if idx + 1 < len(sys.argv):
+                return sys.argv[idx + 1]
+        return default
+
+    sizes = [float(s) for s in option("--sizes", "1,4").split(",") if s]
+    repeat = max(1, int(option("--repeat", "3")))
+    tolerance = float(option("--tolerance", "0.15"))
+
+    results = run_benchmark(sizes, repeat)
+    print_results(results)
+
+    output = option("--output", "")
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {output}")
+
+    baseline_path = option("--compare", "")
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, tolerance)
+        if regressions:
+            print(f"Regressions beyond {tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {tolerance:.0%} against {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
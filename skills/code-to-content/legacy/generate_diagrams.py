@@ -13,15 +13,19 @@ Options:
     --type      Diagram type: architecture, flow, erd, components, deps
     --output    Output format: ascii, mermaid, both (default: both)
     --depth     How deep to analyze (1-5, default: 2)
+    --workers   Worker processes for parsing source files (default: CPU count)
 """
 
 import os
 import sys
+import ast
+import bisect
 import json
 import re
 import argparse
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Set, Tuple, Optional
 
 # ============================================================================
@@ -41,6 +45,90 @@ IGNORE_FILES = {
     'Pipfile.lock', 'poetry.lock', 'composer.lock'
 }
 
+# Source files each extractor looks at
+IMPORT_EXTENSIONS = {'.py', '.ts', '.tsx', '.js', '.jsx'}
+ENTITY_EXTENSIONS = IMPORT_EXTENSIONS | {'.prisma'}
+ENDPOINT_EXTENSIONS = IMPORT_EXTENSIONS | {'.java', '.kt'}
+SERVICE_EXTENSIONS = IMPORT_EXTENSIONS
+
+SCAN_EXTENSIONS = {
+    'imports': IMPORT_EXTENSIONS,
+    'entities': ENTITY_EXTENSIONS,
+    'endpoints': ENDPOINT_EXTENSIONS,
+    'services': SERVICE_EXTENSIONS,
+}
+SCAN_KINDS = tuple(SCAN_EXTENSIONS)
+
+# Fallback for Python files that do not parse: (leading dots, module)
+PYTHON_IMPORT_PATTERN = re.compile(
+    r'^[ \t]*(?:from[ \t]+(\.*)([\w.]*)[ \t]+import|import[ \t]+([\w.]+))', re.MULTILINE)
+JS_IMPORT_PATTERN = re.compile(r"import\s+.*?from\s+['\"](.+?)['\"]")
+
+# Common ORM patterns. Python models (SQLAlchemy, Django) are classes whose
+# bases mention Base or Model; their fields are class-body assignments from
+# a column/field call.
+PYTHON_ENTITY_BASES = re.compile(r'Base|Model')
+PYTHON_FIELD_CALLS = {'Column', 'mapped_column', 'ForeignKey'}  # plus any *Field
+PYTHON_CLASS_PATTERN = re.compile(r'^([ \t]*)class\s+(\w+)\s*\(([^)]*)', re.MULTILINE)
+PYTHON_FIELD_LINE = re.compile(r'(\w+)\s*(?::[^=\n]*)?=\s*(?:\w+\.)*(\w+)\s*\(')
+
+# JS/TS models; JS_BODY_OPEN matches from the end of each declaration to
+# the brace that starts its body
+JS_ENTITY_PATTERN = re.compile(
+    # TypeORM
+    r'@Entity\([^)]*\)\s*(?:export\s+)?(?:default\s+)?class\s+(?P<typeorm>\w+)'
+    # Mongoose
+    r'|(?:const|let|var)\s+(?P<mongoose>\w+)Schema\s*=\s*new\s+(?:mongoose\.)?Schema'
+    # Sequelize
+    r'|(?:const|let|var)\s+(?P<sequelize>\w+)\s*=\s*sequelize\.define'
+)
+JS_BODY_OPEN = {
+    'typeorm': re.compile(r'[^{;]*\{'),
+    'mongoose': re.compile(r'\s*(?:<[^>]*>)?\s*\(\s*\{'),
+    'sequelize': re.compile(r'\s*\(\s*[^,()]*,\s*\{'),
+}
+# Class property or object key at the top level of a body
+JS_FIELD_PATTERN = re.compile(r'(\w+)[\'"]?\s*[!?]?\s*:(?!:)')
+
+# Prisma
+PRISMA_MODEL_PATTERN = re.compile(r'^\s*model\s+(\w+)\s*\{', re.MULTILINE)
+PRISMA_FIELD_PATTERN = re.compile(r'^\s*(\w+)\s+[\w\[\]?]', re.MULTILINE)
+
+# Tokens that matter for brace matching in JS/TS and Prisma bodies
+SCOPE_TOKEN_PATTERN = re.compile(
+    r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`'
+    r'|//[^\n]*|/\*.*?(?:\*/|\Z)|[()\[\]{}]',
+    re.DOTALL
+)
+
+MAX_ENTITY_FIELDS = 10
+
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 200
+
+ENDPOINT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    # Express.js
+    r'(?:app|router)\.(get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
+    # FastAPI
+    r'@(?:app|router)\.(get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
+    # Flask
+    r'@(?:app|bp|blueprint)\.route\s*\(\s*[\'"]([^\'"]+)[\'"].*methods=\[([^\]]+)\]',
+    # Django
+    r'path\s*\(\s*[\'"]([^\'"]+)[\'"]',
+    # Spring-like
+    r'@(?:Get|Post|Put|Delete|Patch)Mapping\s*\(\s*[\'"]?([^\'")\s]+)',
+    # NestJS
+    r'@(?:Get|Post|Put|Delete|Patch)\s*\(\s*[\'"]?([^\'")\s]*)',
+]]
+
+SERVICE_PATTERNS = [re.compile(p) for p in [
+    r'class\s+(\w+Service)',
+    r'class\s+(\w+UseCase)',
+    r'class\s+(\w+Interactor)',
+    r'class\s+(\w+Handler)',
+    r'(?:const|let|var|export\s+(?:const|let|var)?)\s+(\w+Service)\s*=',
+]]
+
 LAYER_PATTERNS = {
     'presentation': ['controller', 'view', 'page', 'component', 'ui', 'screen', 'route', 'handler'],
     'api': ['api', 'endpoint', 'rest', 'graphql', 'grpc', 'route'],
@@ -97,173 +185,529 @@ def detect_layer(name: str) -> Optional[str]:
     return None
 
 
-def analyze_imports(root_path: Path) -> Dict[str, Set[str]]:
-    """Analyze import relationships between modules."""
-    imports = defaultdict(set)
+def walk_source_files(root_path: Path, extensions: Set[str]):
+    """Yield every source file under `root_path` with one of `extensions`.
 
-    for ext in ['*.py', '*.ts', '*.tsx', '*.js', '*.jsx']:
-        for filepath in root_path.rglob(ext):
-            if any(ignored in filepath.parts for ignored in IGNORE_DIRS):
+    One os.walk over the tree; IGNORE_DIRS are pruned before descending,
+    so node_modules and friends are never listed.
+    """
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORE_DIRS)
+        for filename in sorted(filenames):
+            if filename in IGNORE_FILES or os.path.splitext(filename)[1] not in extensions:
                 continue
+            yield Path(dirpath) / filename
 
-            try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
-                module_name = filepath.stem
-
-                # Python imports
-                if filepath.suffix == '.py':
-                    for match in re.finditer(r'^(?:from|import)\s+([\w.]+)', content, re.MULTILINE):
-                        imported = match.group(1).split('.')[0]
-                        if imported != module_name:
-                            imports[module_name].add(imported)
-
-                # JavaScript/TypeScript imports
-                elif filepath.suffix in ['.js', '.jsx', '.ts', '.tsx']:
-                    for match in re.finditer(r"import\s+.*?from\s+['\"](.+?)['\"]", content):
-                        imported = match.group(1)
-                        if imported.startswith('.'):
-                            imported = Path(imported).stem
-                        else:
-                            imported = imported.split('/')[0]
-                        if imported != module_name:
-                            imports[module_name].add(imported)
-
-            except Exception:
-                continue
 
-    return dict(imports)
+def parse_python(content: str) -> Optional[ast.Module]:
+    """Parse a Python file, or None if it does not parse.
+
+    Deeply nested expressions (long generated concatenations) exhaust the
+    parser's recursion limit or memory; those files use the line patterns.
+    """
+    try:
+        return ast.parse(content)
+    except (SyntaxError, ValueError, RecursionError, MemoryError):
+        return None
+
+
+# Statements that contain other statements
+BLOCK_STATEMENTS = tuple(
+    getattr(ast, name) for name in (
+        'FunctionDef', 'AsyncFunctionDef', 'ClassDef', 'If', 'For', 'AsyncFor', 'While',
+        'With', 'AsyncWith', 'Try', 'TryStar', 'Match',
+    ) if hasattr(ast, name)
+)
+
+
+def python_statements(tree: ast.Module):
+    """Every statement in the module, nested blocks included.
+
+    Only statement lists are followed, never expressions, which is far
+    cheaper than ast.walk on large files.
+    """
+    stack = list(tree.body)
+    while stack:
+        statement = stack.pop()
+        yield statement
+        if not isinstance(statement, BLOCK_STATEMENTS):
+            continue
+        for field in ('body', 'orelse', 'finalbody', 'handlers', 'cases'):
+            for child in getattr(statement, field, ()):
+                if isinstance(child, ast.stmt):
+                    stack.append(child)
+                else:  # except handler or match case
+                    stack.extend(child.body)
+
+
+def extract_python_imports(content: str, tree: Optional[ast.Module] = None
+                           ) -> List[Tuple[int, str, Tuple[str, ...]]]:
+    """Import statements in a Python file as (level, module, names).
+
+    `level` is the number of leading dots of a relative import and `names`
+    the names of a `from` import. Pass `tree` to reuse an earlier parse.
+    Files that do not parse fall back to a line pattern, which gives no
+    names.
+    """
+    tree = tree or parse_python(content)
+    if tree is None:
+        return [(len(m.group(1) or ''), m.group(2) or m.group(3) or '', ())
+                for m in PYTHON_IMPORT_PATTERN.finditer(content)]
+
+    records = []
+    for node in python_statements(tree):
+        if isinstance(node, ast.Import):
+            records.extend((0, alias.name, ()) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names = tuple(alias.name for alias in node.names if alias.name != '*')
+            records.append((node.level, node.module or '', names))
+    return records
+
+
+def extract_js_imports(filepath: Path, content: str) -> Set[str]:
+    """Modules imported by one JavaScript/TypeScript file."""
+    module_name = filepath.stem
+    imported_modules = set()
+
+    for match in JS_IMPORT_PATTERN.finditer(content):
+        imported = match.group(1)
+        if imported.startswith('.'):
+            imported = Path(imported).stem
+        else:
+            imported = imported.split('/')[0]
+        if imported != module_name:
+            imported_modules.add(imported)
+
+    return imported_modules
+
+
+def brace_scope(content: str, open_index: int) -> Tuple[int, str]:
+    """Match the brace at `open_index` and return (end, top-level body text).
+
+    `end` is the index just past the closing brace (len(content) if it is
+    unbalanced). Strings and comments are skipped while matching. The text
+    keeps only the body's own level: the contents of nested brackets,
+    comments and non-identifier strings are dropped, so field patterns see
+    the body's declarations and nothing inside methods or nested objects.
+    """
+    parts = []
+    depth = 0
+    pos = open_index + 1
+
+    for match in SCOPE_TOKEN_PATTERN.finditer(content, pos):
+        token = match.group()
+        if depth == 0:
+            parts.append(content[pos:match.start()])
+        pos = match.end()
+
+        if token in '([{':
+            if depth == 0:
+                parts.append(token)
+            depth += 1
+        elif token in ')]}':
+            if depth == 0:
+                return pos, ''.join(parts)
+            depth -= 1
+            if depth == 0:
+                parts.append(token)
+        elif depth == 0 and token[0] in '"\'`' and token[1:-1].isidentifier():
+            parts.append(token)  # quoted key
+
+    if depth == 0:
+        parts.append(content[pos:])
+    return len(content), ''.join(parts)
+
+
+def _unique_fields(fields: List[str]) -> List[str]:
+    """Fields in declaration order, deduplicated and limited."""
+    return list(dict.fromkeys(fields))[:MAX_ENTITY_FIELDS]
+
+
+def _is_field_call(name: str) -> bool:
+    return name in PYTHON_FIELD_CALLS or name.endswith('Field')
+
+
+def _python_field(statement: ast.stmt) -> Optional[str]:
+    """Field name declared by one class-body statement, if any."""
+    if isinstance(statement, ast.Assign):
+        if len(statement.targets) != 1:
+            return None
+        target, value = statement.targets[0], statement.value
+    elif isinstance(statement, ast.AnnAssign):
+        target, value = statement.target, statement.value
+        annotation = statement.annotation
+        if isinstance(annotation, ast.Subscript) and isinstance(annotation.value, ast.Name) \
+                and annotation.value.id == 'Mapped':
+            return target.id if isinstance(target, ast.Name) else None
+    else:
+        return None
+
+    if not isinstance(target, ast.Name) or not isinstance(value, ast.Call):
+        return None
+    func = value.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', '')
+    return target.id if _is_field_call(name) else None
+
+
+def _dotted_name(node: ast.expr) -> str:
+    """`a.b.C` for a class base such as `db.Model`, `Base[T]` or `declarative_base()`."""
+    parts = []
+    while True:
+        if isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        elif isinstance(node, ast.Subscript):
+            node = node.value
+        elif isinstance(node, ast.Call):
+            node = node.func
+        else:
+            if isinstance(node, ast.Name):
+                parts.append(node.id)
+            return '.'.join(reversed(parts))
 
 
-def find_database_entities(root_path: Path) -> List[Dict]:
-    """Find database models/entities in the codebase."""
-    entities = []
+def extract_python_entities(content: str, tree: Optional[ast.Module] = None
+                            ) -> List[Tuple[str, List[str]]]:
+    """(model name, fields) for SQLAlchemy/Django models in a Python file.
 
-    # Common ORM patterns
-    entity_patterns = [
-        # SQLAlchemy
-        r'class\s+(\w+)\s*\([^)]*(?:Base|Model|db\.Model)',
-        # Django
-        r'class\s+(\w+)\s*\(\s*models\.Model\s*\)',
-        # TypeORM
-        r'@Entity\([^)]*\)\s*(?:export\s+)?class\s+(\w+)',
-        # Prisma-like
-        r'model\s+(\w+)\s*\{',
-        # Mongoose
-        r'(?:const|let|var)\s+(\w+)Schema\s*=\s*new\s+(?:mongoose\.)?Schema',
-        # Sequelize
-        r'(?:const|let|var)\s+(\w+)\s*=\s*sequelize\.define',
-    ]
-
-    field_patterns = [
-        # Python class attribute
-        r'(\w+)\s*=\s*(?:Column|Field|CharField|IntegerField|ForeignKey)',
-        # TypeScript/JS property
-        r'@Column\([^)]*\)\s*(\w+)\s*[!?]?\s*:',
-        r'(\w+)\s*:\s*(?:string|number|boolean|Date)',
-    ]
-
-    for ext in ['*.py', '*.ts', '*.tsx', '*.js', '*.jsx', '*.prisma']:
-        for filepath in root_path.rglob(ext):
-            if any(ignored in filepath.parts for ignored in IGNORE_DIRS):
-                continue
+    Fields come from each model's own class body. Pass `tree` to reuse an
+    earlier parse. Files that do not parse fall back to matching class
+    headers and reading the indented block below each one.
+    """
+    if 'class' not in content:
+        return []
+    tree = tree or parse_python(content)
+    if tree is None:
+        return _extract_python_entities_by_indent(content)
 
-            try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
+    entities = []
+    classes = sorted((node for node in python_statements(tree) if isinstance(node, ast.ClassDef)),
+                     key=lambda node: node.lineno)
+    for node in classes:
+        bases = ' '.join(_dotted_name(base) for base in node.bases)
+        if not PYTHON_ENTITY_BASES.search(bases):
+            continue
+        fields = [_python_field(statement) for statement in node.body]
+        entities.append((node.name, _unique_fields([f for f in fields if f])))
+    return entities
 
-                for pattern in entity_patterns:
-                    for match in re.finditer(pattern, content, re.MULTILINE):
-                        entity_name = match.group(1)
 
-                        # Try to find fields
-                        fields = []
-                        for fp in field_patterns:
-                            fields.extend(re.findall(fp, content))
+def _extract_python_entities_by_indent(content: str) -> List[Tuple[str, List[str]]]:
+    lines = content.splitlines()
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line) + 1)
 
-                        entities.append({
-                            'name': entity_name,
-                            'file': str(filepath.relative_to(root_path)),
-                            'fields': list(set(fields))[:10]  # Limit fields
-                        })
+    entities = []
+    for match in PYTHON_CLASS_PATTERN.finditer(content):
+        indent, name, bases = match.groups()
+        if not PYTHON_ENTITY_BASES.search(bases):
+            continue
 
-            except Exception:
+        # Body: the following lines indented deeper than the class header
+        lineno = bisect.bisect_right(line_starts, match.end() - 1)
+        body_indent = None
+        fields = []
+        for line in lines[lineno:]:
+            stripped = line.lstrip()
+            if not stripped or stripped.startswith('#'):
                 continue
+            width = len(line) - len(stripped)
+            if width <= len(indent):
+                break
+            if body_indent is None:
+                body_indent = width
+            if width != body_indent:
+                continue
+            field = PYTHON_FIELD_LINE.match(stripped)
+            if field and _is_field_call(field.group(2)):
+                fields.append(field.group(1))
+        entities.append((name, _unique_fields(fields)))
+    return entities
+
+
+def extract_js_entities(content: str) -> List[Tuple[str, List[str]]]:
+    """(model name, fields) for TypeORM, Mongoose and Sequelize models.
 
+    Each model's body is brace-matched and only its top level is searched
+    for fields; scanning resumes after the body.
+    """
+    entities = []
+    pos = 0
+    while True:
+        match = JS_ENTITY_PATTERN.search(content, pos)
+        if not match:
+            break
+        kind = match.lastgroup
+        pos = match.end()
+
+        fields = []
+        body_open = JS_BODY_OPEN[kind].match(content, pos)
+        if body_open:
+            pos, body = brace_scope(content, body_open.end() - 1)
+            fields = JS_FIELD_PATTERN.findall(body)
+        entities.append((match.group(kind), _unique_fields(fields)))
     return entities
 
 
-def find_api_endpoints(root_path: Path) -> List[Dict]:
-    """Find API endpoints in the codebase."""
+def extract_prisma_entities(content: str) -> List[Tuple[str, List[str]]]:
+    """(model name, fields) for `model X { ... }` blocks in a Prisma schema."""
+    entities = []
+    pos = 0
+    while True:
+        match = PRISMA_MODEL_PATTERN.search(content, pos)
+        if not match:
+            break
+        pos, body = brace_scope(content, match.end() - 1)
+        entities.append((match.group(1), _unique_fields(PRISMA_FIELD_PATTERN.findall(body))))
+    return entities
+
+
+def extract_entities(filepath: Path, relative_path: str, content: str,
+                     tree: Optional[ast.Module] = None) -> List[Dict]:
+    """Database models/entities declared in one file, each with its own fields."""
+    if filepath.suffix == '.py':
+        found = extract_python_entities(content, tree)
+    elif filepath.suffix == '.prisma':
+        found = extract_prisma_entities(content)
+    else:
+        found = extract_js_entities(content)
+    return [{'name': name, 'file': relative_path, 'fields': fields} for name, fields in found]
+
+
+def extract_endpoints(relative_path: str, content: str) -> List[Dict]:
+    """API endpoints declared in one file."""
     endpoints = []
 
-    endpoint_patterns = [
-        # Express.js
-        r'(?:app|router)\.(get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-        # FastAPI
-        r'@(?:app|router)\.(get|post|put|delete|patch)\s*\(\s*[\'"]([^\'"]+)[\'"]',
-        # Flask
-        r'@(?:app|bp|blueprint)\.route\s*\(\s*[\'"]([^\'"]+)[\'"].*methods=\[([^\]]+)\]',
-        # Django
-        r'path\s*\(\s*[\'"]([^\'"]+)[\'"]',
-        # Spring-like
-        r'@(?:Get|Post|Put|Delete|Patch)Mapping\s*\(\s*[\'"]?([^\'")\s]+)',
-        # NestJS
-        r'@(?:Get|Post|Put|Delete|Patch)\s*\(\s*[\'"]?([^\'")\s]*)',
-    ]
-
-    for ext in ['*.py', '*.ts', '*.tsx', '*.js', '*.jsx', '*.java', '*.kt']:
-        for filepath in root_path.rglob(ext):
-            if any(ignored in filepath.parts for ignored in IGNORE_DIRS):
-                continue
+    for pattern in ENDPOINT_PATTERNS:
+        for match in pattern.finditer(content):
+            groups = match.groups()
+            if len(groups) == 2:
+                method, path = groups
+            else:
+                method = 'GET'
+                path = groups[0]
 
-            try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
-
-                for pattern in endpoint_patterns:
-                    for match in re.finditer(pattern, content, re.IGNORECASE):
-                        groups = match.groups()
-                        if len(groups) == 2:
-                            method, path = groups
-                        else:
-                            method = 'GET'
-                            path = groups[0]
-
-                        endpoints.append({
-                            'method': method.upper() if method else 'GET',
-                            'path': path,
-                            'file': str(filepath.relative_to(root_path))
-                        })
-
-            except Exception:
-                continue
+            endpoints.append({
+                'method': method.upper() if method else 'GET',
+                'path': path,
+                'file': relative_path
+            })
 
-    return endpoints[:30]  # Limit results
+    return endpoints
 
 
-def find_services(root_path: Path) -> List[str]:
-    """Find service classes/modules."""
+def extract_services(content: str) -> List[str]:
+    """Service classes/modules declared in one file."""
     services = []
+    for pattern in SERVICE_PATTERNS:
+        services.extend(pattern.findall(content))
+    return services
+
+
+def python_modules(relative_paths: List[str], root_path: Path) -> Dict[str, Tuple[str, str, str]]:
+    """(module, import name, import root) for each Python file, by relative path.
+
+    The module is the file's dotted path from the root (`pkg/sub/mod.py` ->
+    `pkg.sub.mod`, `pkg/__init__.py` -> `pkg`), prefixed with the root's own
+    name when the root is itself a package, so no two files share a node.
+    The import name is how other code imports it: the path from the
+    directory above its outermost package (its import root), the directory
+    that would be on sys.path.
+    """
+    split = {rel: tuple(rel.split(os.sep)) for rel in relative_paths}
+    packages = {parts[:-1] for parts in split.values() if parts[-1] == '__init__.py'}
+    prefix = (root_path.resolve().name,) if () in packages else ()
+
+    modules = {}
+    for rel, path_parts in split.items():
+        dirs = path_parts[:-1]
+        stem = os.path.splitext(path_parts[-1])[0]
+        parts = prefix + dirs + (() if stem == '__init__' else (stem,))
+
+        # Climb the chain of package directories above the file
+        top = len(dirs)
+        while top > 0 and dirs[:top] in packages:
+            top -= 1
+        if top == 0 and prefix:
+            top = -1  # the root is a package too; its parent is the import root
+        start = top + len(prefix)
+
+        modules[rel] = ('.'.join(parts), '.'.join(parts[start:]), '.'.join(parts[:start]))
+    return modules
+
+
+def resolve_python_imports(records: Dict[str, List[Tuple[int, str, Tuple[str, ...]]]],
+                           root_path: Path) -> Dict[str, Set[str]]:
+    """Python module graph from each file's import records, keyed by relative path.
+
+    Absolute and relative imports of modules in the tree resolve to their
+    dotted module names (see python_modules); `from pkg import mod` points
+    at the submodule when it exists. Anything outside the tree is recorded
+    by its top-level package name.
+    """
+    modules = python_modules(list(records), root_path)
+    known = {module for module, _, _ in modules.values()}
+    by_import_name = defaultdict(list)
+    for module, import_name, import_root in modules.values():
+        by_import_name[import_name].append((import_root, module))
+
+    def lookup(name: str, import_root: str) -> Optional[str]:
+        candidates = by_import_name.get(name)
+        if not candidates:
+            return None
+        # Same-named scripts in different directories: prefer the importer's
+        for candidate_root, module in candidates:
+            if candidate_root == import_root:
+                return module
+        return candidates[0][1]
+
+    graph = {}
+    for rel, file_records in records.items():
+        module_name, _, import_root = modules[rel]
+        is_package = os.path.basename(rel) == '__init__.py'
+        package = module_name if is_package else module_name.rpartition('.')[0]
+        deps = set()
+
+        for level, imported, names in file_records:
+            if level:
+                base = package.split('.') if package else []
+                if level > len(base):
+                    continue  # beyond the top-level package
+                base = base[:len(base) - (level - 1)] + ([imported] if imported else [])
+                base = '.'.join(base)
+                targets = [f'{base}.{n}' if base else n for n in names]
+                targets = [t for t in targets if t in known] or [base]
+            else:
+                targets = [t for t in (lookup(f'{imported}.{n}', import_root) for n in names) if t]
+                if not targets:
+                    name = imported
+                    while name and not lookup(name, import_root):
+                        name = name.rpartition('.')[0]
+                    targets = [lookup(name, import_root) if name else imported.split('.')[0]]
+            deps.update(targets)
+
+        deps.discard(module_name)
+        deps.discard('')
+        if deps:
+            graph[module_name] = deps
+
+    return graph
+
+
+def _scan_file(job: Tuple[str, str, Tuple[str, ...]]) -> Dict:
+    """Process-pool worker: read one file once and run its extractors.
+
+    Returns one entry per kind; Python imports are unresolved records,
+    since resolving them needs every module in the tree.
+    """
+    file_path, relative_path, kinds = job
+    filepath = Path(file_path)
+    try:
+        content = filepath.read_text(encoding='utf-8', errors='ignore')
+    except OSError:
+        return {}
+
+    # One parse serves both the import and the entity extractor
+    tree = None
+    if filepath.suffix == '.py' and ('imports' in kinds or 'entities' in kinds):
+        tree = parse_python(content)
+
+    extractors = {
+        'imports': lambda: (extract_python_imports(content, tree) if filepath.suffix == '.py'
+                            else extract_js_imports(filepath, content)),
+        'entities': lambda: extract_entities(filepath, relative_path, content, tree),
+        'endpoints': lambda: extract_endpoints(relative_path, content),
+        'services': lambda: extract_services(content),
+    }
+    found = {}
+    for kind in kinds:
+        # A file an extractor cannot handle is skipped, not the whole scan
+        try:
+            found[kind] = extractors[kind]()
+        except Exception:
+            continue
+    return found
 
-    patterns = [
-        r'class\s+(\w+Service)',
-        r'class\s+(\w+UseCase)',
-        r'class\s+(\w+Interactor)',
-        r'class\s+(\w+Handler)',
-        r'(?:const|let|var|export\s+(?:const|let|var)?)\s+(\w+Service)\s*=',
-    ]
-
-    for ext in ['*.py', '*.ts', '*.tsx', '*.js', '*.jsx']:
-        for filepath in root_path.rglob(ext):
-            if any(ignored in filepath.parts for ignored in IGNORE_DIRS):
-                continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
-                for pattern in patterns:
-                    services.extend(re.findall(pattern, content))
-            except Exception:
-                continue
+def _scan_files(jobs: List[Tuple[str, str, Tuple[str, ...]]], workers: Optional[int]) -> List[Dict]:
+    """Run _scan_file over `jobs` in a process pool, preserving order.
+
+    Small trees run in this process unless `workers` asks for a pool.
+    """
+    if workers == 1 or len(jobs) <= 1 or (workers is None and len(jobs) < PARALLEL_MIN_FILES):
+        return list(map(_scan_file, jobs))
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_scan_file, jobs, chunksize=chunksize))
+
+
+def scan_codebase(root_path: Path, kinds: Tuple[str, ...] = SCAN_KINDS,
+                  workers: Optional[int] = None) -> Dict:
+    """Run the requested extractors over the tree in a single walk.
 
-    return list(set(services))[:20]
+    Each file is read once, in a worker process for larger trees, and
+    handed to every extractor that wants its extension. Returns a dict with
+    one entry per kind: 'imports' (module -> imported modules), 'entities',
+    'endpoints' and 'services', each in the shape the matching
+    analyze_imports / find_* function returns.
+    """
+    wanted = {kind: SCAN_EXTENSIONS[kind] for kind in kinds}
+    extensions = set().union(*wanted.values())
+
+    jobs = []
+    for filepath in walk_source_files(root_path, extensions):
+        file_kinds = tuple(kind for kind, exts in wanted.items() if filepath.suffix in exts)
+        jobs.append((str(filepath), str(filepath.relative_to(root_path)), file_kinds))
+
+    imports = defaultdict(set)
+    python_imports = {}
+    entities = []
+    endpoints = []
+    services = []
+
+    for (file_path, relative_path, _), found in zip(jobs, _scan_files(jobs, workers)):
+        if 'imports' in found:
+            if file_path.endswith('.py'):
+                python_imports[relative_path] = found['imports']
+            elif found['imports']:
+                imports[Path(file_path).stem].update(found['imports'])
+        entities.extend(found.get('entities', ()))
+        endpoints.extend(found.get('endpoints', ()))
+        services.extend(found.get('services', ()))
+
+    for module, deps in resolve_python_imports(python_imports, root_path).items():
+        imports[module].update(deps)
+
+    results = {
+        'imports': dict(imports),
+        'entities': entities,
+        'endpoints': endpoints[:30],  # Limit results
+        'services': list(set(services))[:20],
+    }
+    return {kind: results[kind] for kind in kinds}
+
+
+def analyze_imports(root_path: Path, workers: Optional[int] = None) -> Dict[str, Set[str]]:
+    """Analyze import relationships between modules."""
+    return scan_codebase(root_path, ('imports',), workers)['imports']
+
+
+def find_database_entities(root_path: Path) -> List[Dict]:
+    """Find database models/entities in the codebase."""
+    return scan_codebase(root_path, ('entities',))['entities']
+
+
+def find_api_endpoints(root_path: Path) -> List[Dict]:
+    """Find API endpoints in the codebase."""
+    return scan_codebase(root_path, ('endpoints',))['endpoints']
+
+
+def find_services(root_path: Path) -> List[str]:
+    """Find service classes/modules."""
+    return scan_codebase(root_path, ('services',))['services']
 
 
 # ============================================================================
@@ -496,6 +940,15 @@ def generate_mermaid_deps(imports: Dict[str, Set[str]]) -> str:
 
     added = set()
     count = 0
+    # Numbered ids, so modules differing only in punctuation (a.b_c, a_b.c)
+    # stay separate nodes; the label is given where a node first appears
+    ids: Dict[str, str] = {}
+
+    def node(name: str) -> str:
+        if name in ids:
+            return ids[name]
+        ids[name] = f"m{len(ids)}"
+        return f'{ids[name]}["{name}"]'
 
     for module, deps in imports.items():
         if count >= 20:
@@ -505,9 +958,7 @@ def generate_mermaid_deps(imports: Dict[str, Set[str]]) -> str:
                 break
             key = f"{module}->{dep}"
             if key not in added:
-                module_id = re.sub(r'[^a-zA-Z0-9]', '', module)
-                dep_id = re.sub(r'[^a-zA-Z0-9]', '', dep)
-                lines.append(f"    {module_id}[{module}] --> {dep_id}[{dep}]")
+                lines.append(f"    {node(module)} --> {node(dep)}")
                 added.add(key)
                 count += 1
 
@@ -519,16 +970,18 @@ def generate_mermaid_deps(imports: Dict[str, Set[str]]) -> str:
 # MAIN OUTPUT
 # ============================================================================
 
-def generate_output(root_path: Path, diagram_type: str, output_format: str, depth: int) -> str:
+def generate_output(root_path: Path, diagram_type: str, output_format: str, depth: int,
+                    workers: Optional[int] = None) -> str:
     """Generate the requested diagram output."""
     output = []
 
     # Analyze codebase
     structure = analyze_directory_structure(root_path, depth)
-    imports = analyze_imports(root_path)
-    entities = find_database_entities(root_path)
-    endpoints = find_api_endpoints(root_path)
-    services = find_services(root_path)
+    scan = scan_codebase(root_path, workers=workers)
+    imports = scan['imports']
+    entities = scan['entities']
+    endpoints = scan['endpoints']
+    services = scan['services']
 
     # Group directories by layer
     layers = defaultdict(list)
@@ -616,6 +1069,17 @@ def generate_output(root_path: Path, diagram_type: str, output_format: str, dept
     return "\n".join(output)
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate architecture diagrams from codebase analysis'
@@ -645,6 +1109,12 @@ def main():
         choices=range(1, 6),
         help='Analysis depth (1-5)'
     )
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=None,
+        help='Worker processes for parsing source files (default: CPU count)'
+    )
 
     args = parser.parse_args()
 
@@ -658,7 +1128,7 @@ def main():
         print(f"Error: '{args.directory}' is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    output = generate_output(root_path, args.type, args.output, args.depth)
+    output = generate_output(root_path, args.type, args.output, args.depth, args.workers)
     print(output)
 
 
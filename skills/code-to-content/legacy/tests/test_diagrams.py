@@ -0,0 +1,106 @@
+"""The Python import graph must resolve modules by their place in the tree.
+
+Run with: python -m unittest discover skills/code-to-content/legacy/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_diagrams import analyze_imports, find_database_entities  # noqa: E402
+
+# A source tree that is not itself a package
+PROJECT = {
+    "app/__init__.py": "from . import models\n",
+    "app/db.py": "class Base:\n    pass\n",
+    "app/models.py": "import os\nfrom .db import Base\n\nclass User(Base):\n    pass\n",
+    "app/cli.py": "from app import db\nfrom .. import setup\n",
+    "app/api/__init__.py": "",
+    "app/api/views.py": (
+        "from ..models import User\n"
+        "from .. import db\n"
+        "from ... import beyond_the_top_level_package\n"
+    ),
+    "scripts/helper.py": "",
+    "scripts/run.py": "import app.models\nimport helper\n",
+    "tools/helper.py": "",
+    "tools/report.py": "import helper\n",
+    "setup.py": "import setuptools\n",
+    # Too deeply nested for ast.parse; read by the line patterns instead
+    "generated.py": (
+        "import json\nfrom sqlalchemy import Column\n\n"
+        "class Record(Base):\n    id = Column(Integer)\n\n"
+        "BLOB = " + " + ".join(['"s"'] * 3000) + "\n"
+    ),
+}
+
+# A source tree whose root directory is a package
+PACKAGE = {
+    "__init__.py": "",
+    "core.py": "from . import util\n",
+    "util.py": "",
+    "sub/__init__.py": "",
+    "sub/x.py": "from ..core import run\nfrom mypkg import util\n",
+}
+
+
+def write_tree(root: Path, files):
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
+class ImportGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_project_tree(self):
+        root = self.base / "project"
+        write_tree(root, PROJECT)
+        self.assertEqual(analyze_imports(root, workers=1), {
+            "app": {"app.models"},
+            "app.models": {"os", "app.db"},
+            "app.cli": {"app.db"},
+            "app.api.views": {"app.models", "app.db"},
+            "scripts.run": {"app.models", "scripts.helper"},
+            "tools.report": {"tools.helper"},
+            "setup": {"setuptools"},
+            "generated": {"json", "sqlalchemy"},
+        })
+
+    def test_unparsable_file_keeps_its_entities(self):
+        root = self.base / "project"
+        write_tree(root, PROJECT)
+        names = {entity["name"] for entity in find_database_entities(root)}
+        self.assertIn("Record", names)
+
+    def test_root_is_a_package(self):
+        root = self.base / "mypkg"
+        write_tree(root, PACKAGE)
+        expected = {
+            "mypkg.core": {"mypkg.util"},
+            "mypkg.sub.x": {"mypkg.core", "mypkg.util"},
+        }
+        self.assertEqual(analyze_imports(root, workers=1), expected)
+
+        # API callers may pass the current directory unresolved
+        cwd = os.getcwd()
+        os.chdir(root)
+        try:
+            self.assertEqual(analyze_imports(Path("."), workers=1), expected)
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    unittest.main()
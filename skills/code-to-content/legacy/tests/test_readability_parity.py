@@ -0,0 +1,97 @@
+"""Incremental and streaming analysis must match a full analysis.
+
+Run with: python -m unittest discover skills/code-to-content/legacy/tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyze_readability import (  # noqa: E402
+    TOKENS, Audience, Document, IncrementalAnalyzer, ProseStats, ReadabilityAnalyzer, Rule,
+    StreamingAnalyzer, iter_markdown_chunks,
+)
+
+SKILL_DIR = Path(__file__).resolve().parent.parent.parent
+DOCUMENTS = sorted((SKILL_DIR / "references").glob("*.md")) + [SKILL_DIR / "SKILL.md"]
+
+
+def first_paragraph_removed(content: str) -> str:
+    head, sep, tail = content.partition("\n\n")
+    return tail if sep else ""
+
+
+class ParityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = ReadabilityAnalyzer(Audience.INTERMEDIATE)
+
+    def test_documents_found(self):
+        self.assertGreater(len(DOCUMENTS), 1)
+
+    def test_incremental(self):
+        for path in DOCUMENTS:
+            content = path.read_text(encoding="utf-8")
+            with self.subTest(path.name):
+                session = IncrementalAnalyzer(analyzer=self.analyzer)
+                self.assertEqual(session.update(content, path.name),
+                                 self.analyzer.analyze(content, path.name))
+                # An edit, then its undo, which rescans only the removed block
+                edited = first_paragraph_removed(content)
+                self.assertEqual(session.update(edited, path.name),
+                                 self.analyzer.analyze(edited, path.name))
+                self.assertEqual(session.update(content, path.name),
+                                 self.analyzer.analyze(content, path.name))
+                self.assertLessEqual(session.blocks_analyzed, 1)
+
+    def test_streaming(self):
+        for path in DOCUMENTS:
+            content = path.read_text(encoding="utf-8")
+            for chunk_size in (1, 512, 64 * 1024):
+                with self.subTest(path.name, chunk_size=chunk_size):
+                    stream = StreamingAnalyzer(analyzer=self.analyzer)
+                    lines = content.splitlines(keepends=True)
+                    for chunk in iter_markdown_chunks(lines, chunk_size):
+                        stream.feed(chunk)
+                    self.assertEqual(stream.finish(path.name),
+                                     self.analyzer.analyze(content, path.name))
+
+
+class NestedAnalysis(Rule):
+    """Runs a whole analysis with the same engine from inside a token callback."""
+
+    name = 'nested'
+    consumes = (TOKENS,)
+    triggers = ('nested',)
+
+    def __init__(self, other: str):
+        self.other = other
+        self.engine = None
+
+    def token(self, run, i, word):
+        self.engine.collect(Document.parse(self.other), ProseStats())
+
+
+class ReentrancyTest(unittest.TestCase):
+
+    def test_rules_keep_no_state_between_runs(self):
+        # The inner text's jargon and long sentence come after where the
+        # outer walk stands when it starts
+        other = ("Words " * 40 + "then kubernetes and microservices.\n\n") * 2
+        content = ("A nested analysis starts here, before the API, Docker and "
+                   "idempotent handlers are described in a sentence that goes on "
+                   "well past the limit for an intermediate reader to follow.\n")
+        rule = NestedAnalysis(other)
+        nested = ReadabilityAnalyzer(Audience.INTERMEDIATE, rules=[rule])
+        rule.engine = nested.engine
+        report = nested.analyze(content)
+        report.pop("house_rules", None)
+        expected = ReadabilityAnalyzer(Audience.INTERMEDIATE, rules=[]).analyze(content)
+        expected.pop("house_rules", None)
+        self.assertEqual(report, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""--rev analysis must match the working tree it was committed from.
+
+Run with: python -m unittest discover skills/code-to-content/legacy/tests
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analyze_codebase import ChurnIndex, ComplexityTimeline, analyze_project, git_prefix  # noqa: E402
+
+FILES = {
+    "README.md": "# Outer\n",
+    "other/tool.py": "class OtherService:\n    def run(self):\n        return 1\n",
+    "proj/README.md": "# Project\n\nA small project.\n",
+    "proj/app/__init__.py": "",
+    "proj/app/models.py": (
+        "from dataclasses import dataclass\n\n"
+        "@dataclass\nclass User:\n    name: str\n\n"
+        "class UserRepository:\n"
+        "    def find(self, name):\n"
+        "        if name:\n            return User(name)\n        return None\n"
+    ),
+    "proj/app/api.py": (
+        "from .models import UserRepository\n\n"
+        "def get_user(name):\n    return UserRepository().find(name)\n"
+    ),
+    "proj/web/index.js": "import React from 'react';\nexport const App = () => null;\n",
+    "proj/package.json": '{"name": "proj", "dependencies": {"react": "18.0.0"}}\n',
+}
+
+
+def normalized(value):
+    """Sort every list, so walk order does not matter."""
+    if isinstance(value, dict):
+        return {k: normalized(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [normalized(v) for v in value]
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True, default=str))
+    return value
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class RevisionParityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name) / "repo"
+        for name, content in FILES.items():
+            path = self.repo / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("add", "-A")
+        git("-c", "user.name=Test", "-c", "user.email=test@example.com",
+            "commit", "-q", "-m", "Initial commit")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assert_parity(self, path: Path):
+        worktree = json.loads(json.dumps(analyze_project(str(path), full_analysis=True), default=str))
+        revision = json.loads(json.dumps(analyze_project(str(path), full_analysis=True, rev="HEAD"),
+                                         default=str))
+        self.assertEqual(revision.pop("revision"), "HEAD")
+        self.assertEqual(normalized(revision), normalized(worktree))
+        return worktree
+
+    def test_repository_root(self):
+        self.assertEqual(git_prefix(self.repo), "")
+        results = self.assert_parity(self.repo)
+        self.assertEqual(results["files"]["total"], len(FILES))
+
+    def test_subdirectory(self):
+        project = self.repo / "proj"
+        self.assertEqual(git_prefix(project), "proj")
+        results = self.assert_parity(project)
+        self.assertEqual(results["files"]["total"],
+                         sum(1 for name in FILES if name.startswith("proj/")))
+
+    def test_subdirectory_timeline(self):
+        timeline = ComplexityTimeline(self.repo / "proj").analyze(3)
+        self.assertNotIn("error", timeline)
+        self.assertEqual(timeline["samples"], 1)
+        point = timeline["timeline"][0]
+        self.assertEqual(point["files_analyzed"],
+                         sum(1 for name in FILES
+                             if name.startswith("proj/") and name.endswith((".py", ".js"))))
+        self.assertEqual(point["classes"], 2)
+
+    def test_churn_is_project_relative(self):
+        churn = ChurnIndex(self.repo / "proj").build()
+        paths = {f["path"] for f in churn.top_files(20)}
+        self.assertIn("app/models.py", paths)
+        self.assertNotIn("other/tool.py", paths)
+        self.assertFalse(any(p.startswith("proj/") for p in paths))
+        hotspots = {h["path"] for h in churn.hotspots(self.repo / "proj")}
+        self.assertIn("app/models.py", hotspots)
+
+    def test_subdirectory_git_history(self):
+        project = self.repo / "proj"
+        insights = analyze_project(str(project))["git_insights"]
+        self.assertTrue(insights["is_git_repo"])
+        self.assertIn("app/models.py", {f["path"] for f in insights["most_changed_files"]})
+
+        narrative = analyze_project(str(project), deep_analysis=True)["git_narrative"]
+        self.assertNotIn("error", narrative)
+        self.assertEqual(narrative["total_commits"], 1)
+        churn = {f["path"] for f in narrative["churn"]["most_changed_files"]}
+        self.assertIn("app/models.py", churn)
+        self.assertNotIn("other/tool.py", churn)
+
+
+if __name__ == "__main__":
+    unittest.main()